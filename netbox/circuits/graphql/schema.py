@@ -1,21 +1,26 @@
 import graphene
 
-from netbox.graphql.fields import ObjectField, ObjectListField
+from netbox.graphql.fields import ObjectConnectionField, ObjectField, ObjectListField
 from .types import *
 
 
 class CircuitsQuery(graphene.ObjectType):
     circuit = ObjectField(CircuitType)
     circuit_list = ObjectListField(CircuitType)
+    circuit_connection = ObjectConnectionField(CircuitType)
 
     circuit_termination = ObjectField(CircuitTerminationType)
     circuit_termination_list = ObjectListField(CircuitTerminationType)
+    circuit_termination_connection = ObjectConnectionField(CircuitTerminationType)
 
     circuit_type = ObjectField(CircuitTypeType)
     circuit_type_list = ObjectListField(CircuitTypeType)
+    circuit_type_connection = ObjectConnectionField(CircuitTypeType)
 
     provider = ObjectField(ProviderType)
     provider_list = ObjectListField(ProviderType)
+    provider_connection = ObjectConnectionField(ProviderType)
 
     provider_network = ObjectField(ProviderNetworkType)
     provider_network_list = ObjectListField(ProviderNetworkType)
+    provider_network_connection = ObjectConnectionField(ProviderNetworkType)
@@ -5,6 +5,10 @@ from .choices import InterfaceTypeChoices
 # Exclude SVG images (unsupported by PIL)
 DEVICETYPE_IMAGE_FORMATS = 'image/bmp,image/gif,image/jpeg,image/png,image/tiff,image/webp'
 
+# Cache key and timeout (in seconds) for the component templates from which devices of a DeviceType are instantiated
+DEVICETYPE_BLUEPRINT_CACHE_KEY = 'devicetype_blueprint:{}'
+DEVICETYPE_BLUEPRINT_CACHE_TIMEOUT = 86400
+
 
 #
 # Racks
@@ -112,3 +116,10 @@ COMPATIBLE_TERMINATION_TYPES = {
     'powerport': ['poweroutlet', 'powerfeed'],
     'rearport': ['consoleport', 'consoleserverport', 'interface', 'frontport', 'rearport', 'circuittermination'],
 }
+
+# Each node within a CablePath is encoded as a single integer: the ContentType ID of the node shifted left by this
+# number of bits, combined with its object ID
+PATH_NODE_ID_BITS = 48
+PATH_NODE_ID_MASK = (1 << PATH_NODE_ID_BITS) - 1
+# The largest ContentType ID which fits within the remaining bits of a (signed 64-bit) bigint
+PATH_NODE_CT_ID_MAX = (1 << (63 - PATH_NODE_ID_BITS)) - 1
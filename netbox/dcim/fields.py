@@ -97,10 +97,10 @@ class WWNField(models.Field):
 
 class PathField(ArrayField):
     """
-    An ArrayField which holds a set of objects, each identified by a (type, ID) tuple.
+    An ArrayField which holds a set of objects, each identified by a (type, ID) tuple encoded as a single integer.
     """
     def __init__(self, **kwargs):
-        kwargs['base_field'] = models.CharField(max_length=40)
+        kwargs.setdefault('base_field', models.BigIntegerField())
         super().__init__(**kwargs)
 
 
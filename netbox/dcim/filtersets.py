@@ -315,18 +315,18 @@ class RackFilterSet(NetBoxModelFilterSet, TenancyFilterSet, ContactModelFilterSe
         model = Rack
         fields = [
             'id', 'name', 'facility_id', 'asset_tag', 'u_height', 'desc_units', 'outer_width', 'outer_depth',
-            'outer_unit',
+            'outer_unit', 'comments',
         ]
 
     def search(self, queryset, name, value):
+        # Comments are not searched (they cannot use a trigram index); filter on comments__ic to match them instead
         if not value.strip():
             return queryset
         return queryset.filter(
             Q(name__icontains=value) |
             Q(facility_id__icontains=value) |
             Q(serial__icontains=value.strip()) |
-            Q(asset_tag__icontains=value.strip()) |
-            Q(comments__icontains=value)
+            Q(asset_tag__icontains=value.strip())
         )
 
 
@@ -944,18 +944,18 @@ class DeviceFilterSet(NetBoxModelFilterSet, TenancyFilterSet, ContactModelFilter
 
     class Meta:
         model = Device
-        fields = ['id', 'name', 'asset_tag', 'face', 'position', 'airflow', 'vc_position', 'vc_priority', 'ip_address', 'url', 'os', 'programs', 'products']
+        fields = ['id', 'name', 'asset_tag', 'face', 'position', 'airflow', 'vc_position', 'vc_priority', 'ip_address', 'url', 'os', 'programs', 'products', 'comments']
 
     def search(self, queryset, name, value):
+        # Comments are not searched (they cannot use a trigram index); filter on comments__ic to match them instead
         if not value.strip():
             return queryset
         return queryset.filter(
             Q(name__icontains=value) |
-            Q(comments__icontains=value) |
             Q(ip_address__icontains=value.strip()) |
             Q(url__icontains=value.strip()) |
             Q(os__icontains=value.strip())
-        ).distinct()
+        )
     
 
     def _has_primary_ip(self, queryset, name, value):
@@ -1034,16 +1034,16 @@ class ModuleFilterSet(NetBoxModelFilterSet):
 
     class Meta:
         model = Module
-        fields = ['id', 'asset_tag']
+        fields = ['id', 'asset_tag', 'comments']
 
     def search(self, queryset, name, value):
+        # Comments are not searched (they cannot use a trigram index); filter on comments__ic to match them instead
         if not value.strip():
             return queryset
         return queryset.filter(
             Q(serial__icontains=value.strip()) |
-            Q(asset_tag__icontains=value.strip()) |
-            Q(comments__icontains=value)
-        ).distinct()
+            Q(asset_tag__icontains=value.strip())
+        )
 
 class ProductFilterSet(OrganizationalModelFilterSet):
     q = django_filters.CharFilter(
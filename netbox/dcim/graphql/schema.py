@@ -1,123 +1,162 @@
 import graphene
 
-from netbox.graphql.fields import ObjectField, ObjectListField
+from netbox.graphql.fields import ObjectConnectionField, ObjectField, ObjectListField
 from .types import *
 
 
 class DCIMQuery(graphene.ObjectType):
     cable = ObjectField(CableType)
     cable_list = ObjectListField(CableType)
+    cable_connection = ObjectConnectionField(CableType)
 
     console_port = ObjectField(ConsolePortType)
     console_port_list = ObjectListField(ConsolePortType)
+    console_port_connection = ObjectConnectionField(ConsolePortType)
 
     console_port_template = ObjectField(ConsolePortTemplateType)
     console_port_template_list = ObjectListField(ConsolePortTemplateType)
+    console_port_template_connection = ObjectConnectionField(ConsolePortTemplateType)
 
     console_server_port = ObjectField(ConsoleServerPortType)
     console_server_port_list = ObjectListField(ConsoleServerPortType)
+    console_server_port_connection = ObjectConnectionField(ConsoleServerPortType)
 
     console_server_port_template = ObjectField(ConsoleServerPortTemplateType)
     console_server_port_template_list = ObjectListField(ConsoleServerPortTemplateType)
+    console_server_port_template_connection = ObjectConnectionField(ConsoleServerPortTemplateType)
 
     device = ObjectField(DeviceType)
     device_list = ObjectListField(DeviceType)
+    device_connection = ObjectConnectionField(DeviceType)
 
     device_bay = ObjectField(DeviceBayType)
     device_bay_list = ObjectListField(DeviceBayType)
+    device_bay_connection = ObjectConnectionField(DeviceBayType)
 
     device_bay_template = ObjectField(DeviceBayTemplateType)
     device_bay_template_list = ObjectListField(DeviceBayTemplateType)
+    device_bay_template_connection = ObjectConnectionField(DeviceBayTemplateType)
 
     device_role = ObjectField(DeviceRoleType)
     device_role_list = ObjectListField(DeviceRoleType)
+    device_role_connection = ObjectConnectionField(DeviceRoleType)
 
     device_type = ObjectField(DeviceTypeType)
     device_type_list = ObjectListField(DeviceTypeType)
+    device_type_connection = ObjectConnectionField(DeviceTypeType)
 
     front_port = ObjectField(FrontPortType)
     front_port_list = ObjectListField(FrontPortType)
+    front_port_connection = ObjectConnectionField(FrontPortType)
 
     front_port_template = ObjectField(FrontPortTemplateType)
     front_port_template_list = ObjectListField(FrontPortTemplateType)
+    front_port_template_connection = ObjectConnectionField(FrontPortTemplateType)
 
     interface = ObjectField(InterfaceType)
     interface_list = ObjectListField(InterfaceType)
+    interface_connection = ObjectConnectionField(InterfaceType)
 
     interface_template = ObjectField(InterfaceTemplateType)
     interface_template_list = ObjectListField(InterfaceTemplateType)
+    interface_template_connection = ObjectConnectionField(InterfaceTemplateType)
 
     inventory_item = ObjectField(InventoryItemType)
     inventory_item_list = ObjectListField(InventoryItemType)
+    inventory_item_connection = ObjectConnectionField(InventoryItemType)
 
     inventory_item_role = ObjectField(InventoryItemRoleType)
     inventory_item_role_list = ObjectListField(InventoryItemRoleType)
+    inventory_item_role_connection = ObjectConnectionField(InventoryItemRoleType)
 
     inventory_item_template = ObjectField(InventoryItemTemplateType)
     inventory_item_template_list = ObjectListField(InventoryItemTemplateType)
+    inventory_item_template_connection = ObjectConnectionField(InventoryItemTemplateType)
 
     location = ObjectField(LocationType)
     location_list = ObjectListField(LocationType)
+    location_connection = ObjectConnectionField(LocationType)
 
     manufacturer = ObjectField(ManufacturerType)
     manufacturer_list = ObjectListField(ManufacturerType)
+    manufacturer_connection = ObjectConnectionField(ManufacturerType)
 
     module = ObjectField(ModuleType)
     module_list = ObjectListField(ModuleType)
+    module_connection = ObjectConnectionField(ModuleType)
 
     module_bay = ObjectField(ModuleBayType)
     module_bay_list = ObjectListField(ModuleBayType)
+    module_bay_connection = ObjectConnectionField(ModuleBayType)
 
     module_bay_template = ObjectField(ModuleBayTemplateType)
     module_bay_template_list = ObjectListField(ModuleBayTemplateType)
+    module_bay_template_connection = ObjectConnectionField(ModuleBayTemplateType)
 
     module_type = ObjectField(ModuleTypeType)
     module_type_list = ObjectListField(ModuleTypeType)
+    module_type_connection = ObjectConnectionField(ModuleTypeType)
 
     platform = ObjectField(PlatformType)
     platform_list = ObjectListField(PlatformType)
+    platform_connection = ObjectConnectionField(PlatformType)
 
     power_feed = ObjectField(PowerFeedType)
     power_feed_list = ObjectListField(PowerFeedType)
+    power_feed_connection = ObjectConnectionField(PowerFeedType)
 
     power_outlet = ObjectField(PowerOutletType)
     power_outlet_list = ObjectListField(PowerOutletType)
+    power_outlet_connection = ObjectConnectionField(PowerOutletType)
 
     power_outlet_template = ObjectField(PowerOutletTemplateType)
     power_outlet_template_list = ObjectListField(PowerOutletTemplateType)
+    power_outlet_template_connection = ObjectConnectionField(PowerOutletTemplateType)
 
     power_panel = ObjectField(PowerPanelType)
     power_panel_list = ObjectListField(PowerPanelType)
+    power_panel_connection = ObjectConnectionField(PowerPanelType)
 
     power_port = ObjectField(PowerPortType)
     power_port_list = ObjectListField(PowerPortType)
+    power_port_connection = ObjectConnectionField(PowerPortType)
 
     power_port_template = ObjectField(PowerPortTemplateType)
     power_port_template_list = ObjectListField(PowerPortTemplateType)
+    power_port_template_connection = ObjectConnectionField(PowerPortTemplateType)
 
     rack = ObjectField(RackType)
     rack_list = ObjectListField(RackType)
+    rack_connection = ObjectConnectionField(RackType)
 
     rack_reservation = ObjectField(RackReservationType)
     rack_reservation_list = ObjectListField(RackReservationType)
+    rack_reservation_connection = ObjectConnectionField(RackReservationType)
 
     rack_role = ObjectField(RackRoleType)
     rack_role_list = ObjectListField(RackRoleType)
+    rack_role_connection = ObjectConnectionField(RackRoleType)
 
     rear_port = ObjectField(RearPortType)
     rear_port_list = ObjectListField(RearPortType)
+    rear_port_connection = ObjectConnectionField(RearPortType)
 
     rear_port_template = ObjectField(RearPortTemplateType)
     rear_port_template_list = ObjectListField(RearPortTemplateType)
+    rear_port_template_connection = ObjectConnectionField(RearPortTemplateType)
 
     region = ObjectField(RegionType)
     region_list = ObjectListField(RegionType)
+    region_connection = ObjectConnectionField(RegionType)
 
     site = ObjectField(SiteType)
     site_list = ObjectListField(SiteType)
+    site_connection = ObjectConnectionField(SiteType)
 
     site_group = ObjectField(SiteGroupType)
     site_group_list = ObjectListField(SiteGroupType)
+    site_group_connection = ObjectConnectionField(SiteGroupType)
 
     virtual_chassis = ObjectField(VirtualChassisType)
     virtual_chassis_list = ObjectListField(VirtualChassisType)
+    virtual_chassis_connection = ObjectConnectionField(VirtualChassisType)
@@ -1,10 +1,13 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context
+
+from django.contrib.contenttypes.models import ContentType
 from django.core.management.base import BaseCommand
 from django.core.management.color import no_style
-from django.db import connection
+from django.db import connection, connections, transaction
 from django.db.models import Q
 
 from dcim.models import CablePath, ConsolePort, ConsoleServerPort, Interface, PowerFeed, PowerOutlet, PowerPort
-from dcim.signals import create_cablepath
 
 ENDPOINT_MODELS = (
     ConsolePort,
@@ -16,6 +19,33 @@ ENDPOINT_MODELS = (
 )
 
 
+def trace_origins(model, pks):
+    """
+    Trace and save the CablePaths originating from a chunk of endpoints, returning the number of endpoints traced.
+    All paths are created using a single query, and their references on the endpoints set using another. Each chunk
+    is committed on its own, so that an interrupted run can be resumed.
+    """
+    with transaction.atomic():
+        origins = list(model.objects.filter(pk__in=pks))
+
+        # Clear any stale paths from these origins (e.g. if a previous run was interrupted)
+        CablePath.objects.filter(
+            origin_type=ContentType.objects.get_for_model(model),
+            origin_id__in=pks
+        ).delete()
+
+        cablepaths = {
+            origin: cp for origin, cp in zip(origins, CablePath.from_origins(origins)) if cp is not None
+        }
+        CablePath.objects.bulk_create(cablepaths.values())
+
+        for origin, cp in cablepaths.items():
+            origin._path = cp
+        model.objects.bulk_update(cablepaths.keys(), ['_path'])
+
+    return len(origins)
+
+
 class Command(BaseCommand):
     help = "Generate any missing cable paths among all cable termination objects in NetBox"
 
@@ -28,6 +58,14 @@ class Command(BaseCommand):
             "--no-input", action='store_true', dest='no_input',
             help="Do not prompt user for any input/confirmation"
         )
+        parser.add_argument(
+            "--workers", type=int, default=1,
+            help="Number of worker processes among which to divide the endpoints to be traced (default: 1)"
+        )
+        parser.add_argument(
+            "--chunk-size", type=int, default=1000,
+            help="Number of endpoints to trace and save at a time (default: 1000)"
+        )
 
     def draw_progress_bar(self, percentage):
         """
@@ -36,6 +74,34 @@ class Command(BaseCommand):
         bar_size = int(percentage / 5)
         self.stdout.write(f"\r  [{'#' * bar_size}{' ' * (20-bar_size)}] {int(percentage)}%", ending='')
 
+    def trace_chunks(self, model, chunks, executor):
+        """
+        Trace all chunks of endpoints of the given model (in parallel if an executor is provided), drawing a progress
+        bar as each chunk is completed. Returns the number of endpoints traced.
+        """
+        origins_count = sum(len(chunk) for chunk in chunks)
+        futures = []
+        if executor is None:
+            results = (trace_origins(model, chunk) for chunk in chunks)
+        else:
+            # Close the database connections before any worker processes are forked, so that each worker opens its own
+            connections.close_all()
+            futures = [executor.submit(trace_origins, model, chunk) for chunk in chunks]
+            results = (future.result() for future in as_completed(futures))
+
+        traced = 0
+        try:
+            for count in results:
+                traced += count
+                self.draw_progress_bar(traced * 100 / origins_count)
+        finally:
+            # If tracing was interrupted, cancel any chunks not yet started (shutdown() accepts cancel_futures only
+            # from Python 3.9)
+            for future in futures:
+                future.cancel()
+
+        return traced
+
     def handle(self, *model_names, **options):
 
         # If --force was passed, first delete all existing CablePaths
@@ -66,25 +132,33 @@ class Command(BaseCommand):
                 for sql in sequence_sql:
                     cursor.execute(sql)
 
+            self.stdout.write(
+                "If retracing is interrupted, run this command again without --force to resume."
+            )
+
+        executor = None
+        if options['workers'] > 1:
+            executor = ProcessPoolExecutor(max_workers=options['workers'], mp_context=get_context('fork'))
+
         # Retrace paths
-        for model in ENDPOINT_MODELS:
-            params = Q(cable__isnull=False)
-            if hasattr(model, 'wireless_link'):
-                params |= Q(wireless_link__isnull=False)
-            origins = model.objects.filter(params)
-            if not options['force']:
-                origins = origins.filter(_path__isnull=True)
-            origins_count = origins.count()
-            if not origins_count:
-                self.stdout.write(f'Found no missing {model._meta.verbose_name} paths; skipping')
-                continue
-            self.stdout.write(f'Retracing {origins_count} cabled {model._meta.verbose_name_plural}...')
-            i = 0
-            for i, obj in enumerate(origins, start=1):
-                create_cablepath(obj)
-                if not i % 100:
-                    self.draw_progress_bar(i * 100 / origins_count)
-            self.draw_progress_bar(100)
-            self.stdout.write(self.style.SUCCESS(f'\n  Retraced {i} {model._meta.verbose_name_plural}'))
+        try:
+            for model in ENDPOINT_MODELS:
+                params = Q(cable__isnull=False)
+                if hasattr(model, 'wireless_link'):
+                    params |= Q(wireless_link__isnull=False)
+                origins = model.objects.filter(params)
+                if not options['force']:
+                    origins = origins.filter(_path__isnull=True)
+                pks = list(origins.order_by('pk').values_list('pk', flat=True))
+                if not pks:
+                    self.stdout.write(f'Found no missing {model._meta.verbose_name} paths; skipping')
+                    continue
+                self.stdout.write(f'Retracing {len(pks)} cabled {model._meta.verbose_name_plural}...')
+                chunks = [pks[i:i + options['chunk_size']] for i in range(0, len(pks), options['chunk_size'])]
+                traced = self.trace_chunks(model, chunks, executor)
+                self.stdout.write(self.style.SUCCESS(f'\n  Retraced {traced} {model._meta.verbose_name_plural}'))
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
 
         self.stdout.write(self.style.SUCCESS('Finished.'))
@@ -0,0 +1,31 @@
+from django.db import transaction
+from django.db.models import Manager
+
+from extras.querysets import ConfigContextModelQuerySet
+
+
+class DeviceManager(Manager.from_queryset(ConfigContextModelQuerySet)):
+
+    def bulk_provision(self, device_type, devices):
+        """
+        Create many new devices of the given DeviceType, along with all of the components defined by its templates,
+        using a handful of bulk INSERTs. This is equivalent to setting the DeviceType of and saving each device, but
+        avoids retrieving the DeviceType's templates and creating components for each device individually.
+
+        The devices are not validated, and Device.save() is not called. Changelog records are created for the
+        devices (but not their components) and the devices are added to the search index, as when saved.
+        """
+        from extras.bulk import bulk_create_objects
+
+        devices = list(devices)
+        for device in devices:
+            device.device_type = device_type
+            # Inherit airflow attribute from DeviceType if not set
+            if not device.airflow:
+                device.airflow = device_type.airflow
+
+        with transaction.atomic(using=self.db):
+            bulk_create_objects(devices)
+            device_type.instantiate_components(devices)
+
+        return devices
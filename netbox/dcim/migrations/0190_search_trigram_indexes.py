@@ -0,0 +1,67 @@
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dcim', '0189_alter_device_ip_address_alter_device_os_and_more'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='device',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='gin_trgm_ops'), name='dcim_device_name_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='device',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('ip_address'), name='gin_trgm_ops'), name='dcim_device_ip_address_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='device',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('url'), name='gin_trgm_ops'), name='dcim_device_url_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='device',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('os'), name='gin_trgm_ops'), name='dcim_device_os_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='interface',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='gin_trgm_ops'), name='dcim_interface_name_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='interface',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('label'), name='gin_trgm_ops'), name='dcim_interface_label_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='interface',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('description'), name='gin_trgm_ops'), name='dcim_interface_descr_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='module',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('serial'), name='gin_trgm_ops'), name='dcim_module_serial_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='module',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('asset_tag'), name='gin_trgm_ops'), name='dcim_module_asset_tag_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='rack',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='gin_trgm_ops'), name='dcim_rack_name_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='rack',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('facility_id'), name='gin_trgm_ops'), name='dcim_rack_facility_id_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='rack',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('serial'), name='gin_trgm_ops'), name='dcim_rack_serial_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='rack',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('asset_tag'), name='gin_trgm_ops'), name='dcim_rack_asset_tag_trgm'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.0.6 on 2026-10-19 00:33
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dcim', '0190_search_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='cablepath',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['path'], name='dcim_cablepath_path'),
+        ),
+    ]
@@ -0,0 +1,59 @@
+import dcim.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+# Path nodes are converted between the "<ContentType ID>:<object ID>" string format and the integer format
+# (<ContentType ID> << 48 | <object ID>). Subqueries are not permitted in ALTER COLUMN ... USING, so each path is
+# converted into a new column, which then replaces the original.
+ENCODE_PATH_NODES = """
+ALTER TABLE dcim_cablepath ADD COLUMN path_new bigint[];
+UPDATE dcim_cablepath SET path_new = ARRAY(
+    SELECT (split_part(node, ':', 1)::bigint << 48) | split_part(node, ':', 2)::bigint
+    FROM unnest(path) WITH ORDINALITY AS nodes(node, position)
+    ORDER BY position
+);
+ALTER TABLE dcim_cablepath DROP COLUMN path;
+ALTER TABLE dcim_cablepath RENAME COLUMN path_new TO path;
+ALTER TABLE dcim_cablepath ALTER COLUMN path SET NOT NULL;
+"""
+
+DECODE_PATH_NODES = """
+ALTER TABLE dcim_cablepath ADD COLUMN path_new varchar(40)[];
+UPDATE dcim_cablepath SET path_new = ARRAY(
+    SELECT (node >> 48)::text || ':' || (node & 281474976710655)::text
+    FROM unnest(path) WITH ORDINALITY AS nodes(node, position)
+    ORDER BY position
+);
+ALTER TABLE dcim_cablepath DROP COLUMN path;
+ALTER TABLE dcim_cablepath RENAME COLUMN path_new TO path;
+ALTER TABLE dcim_cablepath ALTER COLUMN path SET NOT NULL;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dcim', '0191_cablepath_path_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='cablepath',
+            name='dcim_cablepath_path',
+        ),
+        migrations.RunSQL(
+            sql=ENCODE_PATH_NODES,
+            reverse_sql=DECODE_PATH_NODES,
+            state_operations=[
+                migrations.AlterField(
+                    model_name='cablepath',
+                    name='path',
+                    field=dcim.fields.PathField(base_field=models.BigIntegerField(), size=None),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='cablepath',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['path'], name='dcim_cablepath_path'),
+        ),
+    ]
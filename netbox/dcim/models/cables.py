@@ -2,6 +2,7 @@ from collections import defaultdict
 
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.indexes import GinIndex
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.db import models
 from django.db.models import Sum
@@ -10,7 +11,7 @@ from django.urls import reverse
 from dcim.choices import *
 from dcim.constants import *
 from dcim.fields import PathField
-from dcim.utils import decompile_path_node, object_to_path_node, path_node_to_object
+from dcim.utils import decompile_path_node, path_node_to_object
 from netbox.models import NetBoxModel
 from utilities.fields import ColorField
 from utilities.utils import to_meters
@@ -304,9 +305,9 @@ class CablePath(models.Model):
     elements in the path. Every instance must specify an `origin`, whereas `destination` may be null (for paths which do
     not terminate on a PathEndpoint).
 
-    `path` contains a list of nodes within the path, each represented by a tuple of (type, ID). The first element in the
-    path must be a Cable instance, followed by a pair of pass-through ports. For example, consider the following
-    topology:
+    `path` contains a list of nodes within the path, each represented by a tuple of (type, ID) encoded as a single
+    integer (see compile_path_node()). The first element in the path must be a Cable instance, followed by a pair of
+    pass-through ports. For example, consider the following topology:
 
                      1                              2                              3
         Interface A --- Front Port A | Rear Port A --- Rear Port B | Front Port B --- Interface B
@@ -357,6 +358,10 @@ class CablePath(models.Model):
 
     class Meta:
         unique_together = ('origin_type', 'origin_id')
+        indexes = (
+            # Supports path__contains lookups (finding all paths which traverse a given node)
+            GinIndex(fields=('path',), name='dcim_cablepath_path'),
+        )
 
     def __str__(self):
         status = ' (active)' if self.is_active else ' (split)' if self.is_split else ''
@@ -379,96 +384,27 @@ class CablePath(models.Model):
         """
         Create a new CablePath instance as traced from the given path origin.
         """
-        from circuits.models import CircuitTermination
+        return cls.from_origins([origin])[0]
 
-        if origin is None or origin.link is None:
-            return None
-
-        destination = None
-        path = []
-        position_stack = []
-        is_active = True
-        is_split = False
-
-        node = origin
-        while node.link is not None:
-            if hasattr(node.link, 'status') and node.link.status != LinkStatusChoices.STATUS_CONNECTED:
-                is_active = False
-
-            # Follow the link to its far-end termination
-            path.append(object_to_path_node(node.link))
-            peer_termination = node.get_link_peer()
-
-            # Follow a FrontPort to its corresponding RearPort
-            if isinstance(peer_termination, FrontPort):
-                path.append(object_to_path_node(peer_termination))
-                node = peer_termination.rear_port
-                if node.positions > 1:
-                    position_stack.append(peer_termination.rear_port_position)
-                path.append(object_to_path_node(node))
-
-            # Follow a RearPort to its corresponding FrontPort (if any)
-            elif isinstance(peer_termination, RearPort):
-                path.append(object_to_path_node(peer_termination))
-
-                # Determine the peer FrontPort's position
-                if peer_termination.positions == 1:
-                    position = 1
-                elif position_stack:
-                    position = position_stack.pop()
-                else:
-                    # No position indicated: path has split, so we stop at the RearPort
-                    is_split = True
-                    break
-
-                try:
-                    node = FrontPort.objects.get(rear_port=peer_termination, rear_port_position=position)
-                    path.append(object_to_path_node(node))
-                except ObjectDoesNotExist:
-                    # No corresponding FrontPort found for the RearPort
-                    break
-
-            # Follow a CircuitTermination to its corresponding CircuitTermination (A to Z or vice versa)
-            elif isinstance(peer_termination, CircuitTermination):
-                path.append(object_to_path_node(peer_termination))
-                # Get peer CircuitTermination
-                node = peer_termination.get_peer_termination()
-                if node:
-                    path.append(object_to_path_node(node))
-                    if node.provider_network:
-                        destination = node.provider_network
-                        break
-                    elif node.site and not node.cable:
-                        destination = node.site
-                        break
-                else:
-                    # No peer CircuitTermination exists; halt the trace
-                    break
-
-            # Anything else marks the end of the path
-            else:
-                destination = peer_termination
-                break
-
-        if destination is None:
-            is_active = False
-
-        return cls(
-            origin=origin,
-            destination=destination,
-            path=path,
-            is_active=is_active,
-            is_split=is_split
-        )
+    @classmethod
+    def from_origins(cls, origins):
+        """
+        Create new CablePath instances as traced from each of the given path origins (or None for each origin which
+        has no path). The nodes traversed by all paths are retrieved in bulk and traced in memory.
+        """
+        from dcim.tracing import CablePathTracer
+
+        return CablePathTracer().trace(list(origins))
 
     def get_path(self):
         """
         Return the path as a list of prefetched objects.
         """
+        nodes = [decompile_path_node(node) for node in self.path]
+
         # Compile a list of IDs to prefetch for each type of model in the path
         to_prefetch = defaultdict(list)
-        for node in self.path:
-            ct_id, object_id = decompile_path_node(node)
+        for ct_id, object_id in nodes:
             to_prefetch[ct_id].append(object_id)
 
         # Prefetch path objects using one query per model type. Prefetch related devices where appropriate.
@@ -483,12 +419,7 @@ class CablePath(models.Model):
             }
 
         # Replicate the path using the prefetched objects.
-        path = []
-        for node in self.path:
-            ct_id, object_id = decompile_path_node(node)
-            path.append(prefetched[ct_id][object_id])
-
-        return path
+        return [prefetched[ct_id][object_id] for ct_id, object_id in nodes]
 
     @property
     def last_node(self):
@@ -502,14 +433,8 @@ class CablePath(models.Model):
         Return all Cable IDs within the path.
         """
         cable_ct = ContentType.objects.get_for_model(Cable).pk
-        cable_ids = []
-
-        for node in self.path:
-            ct, id = decompile_path_node(node)
-            if ct == cable_ct:
-                cable_ids.append(id)
 
-        return cable_ids
+        return [object_id for ct_id, object_id in map(decompile_path_node, self.path) if ct_id == cable_ct]
 
     def get_total_length(self):
         """
@@ -32,6 +32,23 @@ __all__ = (
 )
 
 
+def get_component(template, name, **kwargs):
+    """
+    Return the existing component, instantiated from the given template with the given name, to which a new component
+    is to be related. If the device is having all of its components instantiated at once by
+    DeviceType.instantiate_components(), the component is retrieved by its template from those already instantiated
+    rather than from the database (as names are not unique among e.g. inventory items).
+    """
+    model = template.component_model
+    new_components = getattr(kwargs['device'], '_new_components', None)
+    if new_components is not None:
+        try:
+            return new_components[template]
+        except KeyError:
+            raise model.DoesNotExist(f"{model._meta.object_name} {name} has not been instantiated.")
+    return model.objects.get(name=name, **kwargs)
+
+
 class ComponentTemplateModel(WebhooksMixin, ChangeLoggedModel):
     device_type = models.ForeignKey(
         to='dcim.DeviceType',
@@ -286,7 +303,7 @@ class PowerOutletTemplate(ModularComponentTemplateModel):
     def instantiate(self, **kwargs):
         if self.power_port:
             power_port_name = self.power_port.resolve_name(kwargs.get('module'))
-            power_port = PowerPort.objects.get(name=power_port_name, **kwargs)
+            power_port = get_component(self.power_port, power_port_name, **kwargs)
         else:
             power_port = None
         return self.component_model(
@@ -397,7 +414,7 @@ class FrontPortTemplate(ModularComponentTemplateModel):
     def instantiate(self, **kwargs):
         if self.rear_port:
             rear_port_name = self.rear_port.resolve_name(kwargs.get('module'))
-            rear_port = RearPort.objects.get(name=rear_port_name, **kwargs)
+            rear_port = get_component(self.rear_port, rear_port_name, **kwargs)
         else:
             rear_port = None
         return self.component_model(
@@ -556,10 +573,9 @@ class InventoryItemTemplate(MPTTModel, ComponentTemplateModel):
         unique_together = ('device_type', 'parent', 'name')
 
     def instantiate(self, **kwargs):
-        parent = InventoryItem.objects.get(name=self.parent.name, **kwargs) if self.parent else None
+        parent = get_component(self.parent, self.parent.name, **kwargs) if self.parent else None
         if self.component:
-            model = self.component.component_model
-            component = model.objects.get(name=self.component.name, **kwargs)
+            component = get_component(self.component, self.component.name, **kwargs)
         else:
             component = None
         return self.component_model(
@@ -14,6 +14,7 @@ from dcim.svg import CableTraceSVG
 from netbox.models import OrganizationalModel, NetBoxModel
 from utilities.choices import ColorChoices
 from utilities.fields import ColorField, NaturalOrderingField
+from utilities.indexes import trigram_index
 from utilities.mptt import TreeManager
 from utilities.ordering import naturalize_interface
 from utilities.query_functions import CollateAsChar
@@ -503,6 +504,13 @@ class BaseInterface(models.Model):
 
         return super().save(*args, **kwargs)
 
+    def prepare_bulk_create(self):
+        """
+        Apply the changes made by save() to a new interface which is instead being created in bulk.
+        """
+        if not self.mode:
+            self.untagged_vlan = None
+
     @property
     def count_ipaddresses(self):
         return self.ip_addresses.count()
@@ -642,6 +650,11 @@ class Interface(ModularComponentModel, BaseInterface, LinkTermination, PathEndpo
     class Meta:
         ordering = ('device', CollateAsChar('_name'))
         unique_together = ('device', 'name')
+        indexes = (
+            trigram_index('name', 'dcim_interface_name_trgm'),
+            trigram_index('label', 'dcim_interface_label_trgm'),
+            trigram_index('description', 'dcim_interface_descr_trgm'),
+        )
 
     def get_absolute_url(self):
         return reverse('dcim:interface', kwargs={'pk': self.pk})
@@ -4,20 +4,22 @@ from ipaddress import ip_address
 import yaml
 from django.contrib.contenttypes.fields import GenericRelation
 from django.core.exceptions import ValidationError
+from django.core.cache import cache
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db import models
-from django.db.models import F, ProtectedError
+from django.db import models, transaction
+from django.db.models import DEFERRED, F, ProtectedError
 from django.urls import reverse
 from django.utils.safestring import mark_safe
 
 from dcim.choices import *
 from dcim.constants import *
 from extras.models import ConfigContextModel
-from extras.querysets import ConfigContextModelQuerySet
+from dcim.managers import DeviceManager
 from netbox.config import ConfigItem
 from netbox.models import OrganizationalModel, NetBoxModel
 from utilities.choices import ColorChoices
 from utilities.fields import ColorField, NaturalOrderingField
+from utilities.indexes import trigram_index
 from .device_components import *
 from .sites import Site
 
@@ -343,6 +345,80 @@ class DeviceType(NetBoxModel):
         if self.rear_image:
             self.rear_image.delete(save=False)
 
+    def get_component_blueprint(self):
+        """
+        Return the component templates of this DeviceType as a list of lists, one per type of component, in the order
+        in which their components must be instantiated (e.g. rear ports before front ports). The blueprint is cached
+        until any of the DeviceType's templates is changed.
+        """
+        cache_key = DEVICETYPE_BLUEPRINT_CACHE_KEY.format(self.pk)
+        blueprint = cache.get(cache_key)
+
+        if blueprint is None:
+            blueprint = [
+                list(self.consoleporttemplates.all()),
+                list(self.consoleserverporttemplates.all()),
+                list(self.powerporttemplates.all()),
+                list(self.poweroutlettemplates.select_related('power_port')),
+                list(self.interfacetemplates.all()),
+                list(self.rearporttemplates.all()),
+                list(self.frontporttemplates.select_related('rear_port')),
+                list(self.modulebaytemplates.all()),
+                list(self.devicebaytemplates.all()),
+                # Parent inventory items must be instantiated before their children
+                list(
+                    self.inventoryitemtemplates.select_related('parent').prefetch_related('component').order_by(
+                        'tree_id', 'lft'
+                    )
+                ),
+            ]
+            # Cache the blueprint only once any transaction in which it was retrieved has been committed
+            transaction.on_commit(lambda: cache.set(cache_key, blueprint, DEVICETYPE_BLUEPRINT_CACHE_TIMEOUT))
+
+        return blueprint
+
+    @staticmethod
+    def clear_component_blueprint(pk):
+        """
+        Discard the cached component blueprint of the DeviceType with the given primary key.
+        """
+        cache_key = DEVICETYPE_BLUEPRINT_CACHE_KEY.format(pk)
+        cache.delete(cache_key)
+        transaction.on_commit(lambda: cache.delete(cache_key))
+
+    def instantiate_components(self, devices):
+        """
+        Create all of the components defined by this DeviceType's templates on each of the given (saved) devices.
+        The components of each type are created for all devices using a single bulk INSERT (one per tree level for
+        inventory items).
+        """
+        try:
+            # Components related to other new components (e.g. front ports to rear ports) are resolved by template from
+            # these mappings, rather than queried for
+            for device in devices:
+                device._new_components = {}
+
+            for templates in self.get_component_blueprint():
+                if not templates:
+                    continue
+                component_model = templates[0].component_model
+
+                components = []
+                for device in devices:
+                    for template in templates:
+                        component = template.instantiate(device=device)
+                        device._new_components[template] = component
+                        components.append(component)
+
+                if component_model is InventoryItem:
+                    InventoryItem.objects.bulk_create_trees(components)
+                else:
+                    component_model.objects.bulk_create(components)
+
+        finally:
+            for device in devices:
+                device.__dict__.pop('_new_components', None)
+
     @property
     def is_parent_device(self):
         return self.subdevice_role == SubdeviceRoleChoices.ROLE_PARENT
@@ -754,7 +830,7 @@ class Device(NetBoxModel, ConfigContextModel):
         blank=True
     )
     
-    objects = ConfigContextModelQuerySet.as_manager()
+    objects = DeviceManager()
 
     clone_fields = [
         'device_type', 'device_role', 'tenant', 'platform', 'site', 'location', 'rack', 'status', 'airflow', 'cluster',
@@ -768,6 +844,12 @@ class Device(NetBoxModel, ConfigContextModel):
             ('rack', 'position', 'face'),
             ('virtual_chassis', 'vc_position'),
         )
+        indexes = (
+            trigram_index('name', 'dcim_device_name_trgm'),
+            trigram_index('ip_address', 'dcim_device_ip_address_trgm'),
+            trigram_index('url', 'dcim_device_url_trgm'),
+            trigram_index('os', 'dcim_device_os_trgm'),
+        )
 
     def __str__(self):
         if self.name and self.asset_tag:
@@ -784,6 +866,19 @@ class Device(NetBoxModel, ConfigContextModel):
             return f'{self.device_type.manufacturer} {self.device_type.model} ({self.pk})'
         return super().__str__()
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Cache the original Site and Rack assignments of existing Devices, to determine on save whether child Devices
+        must be updated. (Fields which were not loaded are treated as changed.)
+        """
+        instance = super().from_db(db, field_names, values)
+
+        instance._orig_site_id = instance.__dict__.get('site_id', DEFERRED)
+        instance._orig_rack_id = instance.__dict__.get('rack_id', DEFERRED)
+
+        return instance
+
     def get_absolute_url(self):
         return reverse('dcim:device', args=[self.pk])
 
@@ -929,52 +1024,24 @@ class Device(NetBoxModel, ConfigContextModel):
         is_new = not bool(self.pk)
 
         # Inherit airflow attribute from DeviceType if not set
-        if (self.device_type):
-            if is_new and not self.airflow:
-                self.airflow = self.device_type.airflow
-
-
-            # If this is a new Device, instantiate all of the related components per the DeviceType definition
-            if is_new:
-                ConsolePort.objects.bulk_create(
-                    [x.instantiate(device=self) for x in self.device_type.consoleporttemplates.all()]
-                )
-                ConsoleServerPort.objects.bulk_create(
-                    [x.instantiate(device=self) for x in self.device_type.consoleserverporttemplates.all()]
-                )
-                PowerPort.objects.bulk_create(
-                    [x.instantiate(device=self) for x in self.device_type.powerporttemplates.all()]
-                )
-                PowerOutlet.objects.bulk_create(
-                    [x.instantiate(device=self) for x in self.device_type.poweroutlettemplates.all()]
-                )
-                Interface.objects.bulk_create(
-                    [x.instantiate(device=self) for x in self.device_type.interfacetemplates.all()]
-                )
-                RearPort.objects.bulk_create(
-                    [x.instantiate(device=self) for x in self.device_type.rearporttemplates.all()]
-                )
-                FrontPort.objects.bulk_create(
-                    [x.instantiate(device=self) for x in self.device_type.frontporttemplates.all()]
-                )
-                ModuleBay.objects.bulk_create(
-                    [x.instantiate(device=self) for x in self.device_type.modulebaytemplates.all()]
-                )
-                DeviceBay.objects.bulk_create(
-                    [x.instantiate(device=self) for x in self.device_type.devicebaytemplates.all()]
-                )
-                # Avoid bulk_create to handle MPTT
-                for x in self.device_type.inventoryitemtemplates.all():
-                    x.instantiate(device=self).save()
+        if is_new and not self.airflow:
+            self.airflow = self.device_type.airflow
 
         super().save(*args, **kwargs)
 
-        # Update Site and Rack assignment for any child Devices
-        devices = Device.objects.filter(parent_bay__device=self)
-        for device in devices:
-            device.site = self.site
-            device.rack = self.rack
-            device.save()
+        # If this is a new Device, instantiate all of the related components per the DeviceType definition
+        if is_new:
+            self.device_type.instantiate_components([self])
+
+        # Update Site and Rack assignment for any child Devices if either has changed
+        if not is_new and (
+            self.site_id != getattr(self, '_orig_site_id', DEFERRED) or
+            self.rack_id != getattr(self, '_orig_rack_id', DEFERRED)
+        ):
+            from extras.bulk import update_objects
+            update_objects(Device.objects.filter(parent_bay__device=self), site=self.site, rack=self.rack)
+        self._orig_site_id = self.site_id
+        self._orig_rack_id = self.rack_id
 
     @property
     def identifier(self):
@@ -1085,6 +1152,10 @@ class Module(NetBoxModel, ConfigContextModel):
 
     class Meta:
         ordering = ('module_bay',)
+        indexes = (
+            trigram_index('serial', 'dcim_module_serial_trgm'),
+            trigram_index('asset_tag', 'dcim_module_asset_tag_trgm'),
+        )
 
     def __str__(self):
         return f'{self.module_bay.name}: {self.module_type} ({self.pk})'
@@ -7,7 +7,7 @@ from django.contrib.postgres.fields import ArrayField
 from django.core.exceptions import ValidationError
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
-from django.db.models import Count, Sum
+from django.db.models import DEFERRED, Count, Sum
 from django.urls import reverse
 
 from dcim.choices import *
@@ -17,6 +17,7 @@ from netbox.config import get_config
 from netbox.models import OrganizationalModel, NetBoxModel
 from utilities.choices import ColorChoices
 from utilities.fields import ColorField, NaturalOrderingField
+from utilities.indexes import trigram_index
 from utilities.utils import array_to_string
 from .device_components import PowerOutlet, PowerPort
 from .devices import Device
@@ -196,12 +197,31 @@ class Rack(NetBoxModel):
             ('location', 'name'),
             ('location', 'facility_id'),
         )
+        indexes = (
+            trigram_index('name', 'dcim_rack_name_trgm'),
+            trigram_index('facility_id', 'dcim_rack_facility_id_trgm'),
+            trigram_index('serial', 'dcim_rack_serial_trgm'),
+            trigram_index('asset_tag', 'dcim_rack_asset_tag_trgm'),
+        )
 
     def __str__(self):
         if self.facility_id:
             return f'{self.name} ({self.facility_id})'
         return self.name
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Cache the original Site and Location assignments of existing Racks, to determine on save whether their
+        Devices must be updated. (Fields which were not loaded are treated as changed.)
+        """
+        instance = super().from_db(db, field_names, values)
+
+        instance._orig_site_id = instance.__dict__.get('site_id', DEFERRED)
+        instance._orig_location_id = instance.__dict__.get('location_id', DEFERRED)
+
+        return instance
+
     def get_absolute_url(self):
         return reverse('dcim:rack', args=[self.pk])
 
@@ -1,6 +1,7 @@
 from django.contrib.contenttypes.fields import GenericRelation
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models import DEFERRED
 from django.urls import reverse
 from mptt.models import TreeForeignKey
 from timezone_field import TimeZoneField
@@ -406,6 +407,18 @@ class Location(NestedGroupModel):
 
         super().validate_unique(exclude=exclude)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Cache the original Site assignment of existing Locations, to determine on save whether their child objects
+        must be updated. (Fields which were not loaded are treated as changed.)
+        """
+        instance = super().from_db(db, field_names, values)
+
+        instance._orig_site_id = instance.__dict__.get('site_id', DEFERRED)
+
+        return instance
+
     def get_absolute_url(self):
         return reverse('dcim:location', args=[self.pk])
 
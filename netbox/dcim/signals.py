@@ -1,11 +1,16 @@
 import logging
 
-from django.contrib.contenttypes.models import ContentType
+from django.db.models import DEFERRED
 from django.db.models.signals import post_save, post_delete, pre_delete
 from django.dispatch import receiver
 
+from extras.bulk import update_objects
 from .choices import LinkStatusChoices
-from .models import Cable, CablePath, Device, PathEndpoint, PowerPanel, Rack, Location, VirtualChassis
+from .models import (
+    Cable, CablePath, ConsolePortTemplate, ConsoleServerPortTemplate, Device, DeviceBayTemplate, DeviceType,
+    FrontPortTemplate, InterfaceTemplate, InventoryItemTemplate, Location, ModuleBayTemplate, PathEndpoint, PowerPanel,
+    PowerOutletTemplate, PowerPortTemplate, Rack, RearPortTemplate, VirtualChassis,
+)
 from .utils import create_cablepath, rebuild_paths
 
 
@@ -16,15 +21,16 @@ from .utils import create_cablepath, rebuild_paths
 @receiver(post_save, sender=Location)
 def handle_location_site_change(instance, created, **kwargs):
     """
-    Update child objects if Site assignment has changed. We intentionally recurse through each child
-    object instead of calling update() on the QuerySet to ensure the proper change records get created for each.
+    Update child objects if Site assignment has changed. Each type of child object is updated using a single query,
+    with change records created for each object in bulk.
     """
-    if not created:
-        instance.get_descendants().update(site=instance.site)
+    if not created and instance.site_id != getattr(instance, '_orig_site_id', DEFERRED):
+        update_objects(instance.get_descendants(), site=instance.site)
         locations = instance.get_descendants(include_self=True).values_list('pk', flat=True)
-        Rack.objects.filter(location__in=locations).update(site=instance.site)
-        Device.objects.filter(location__in=locations).update(site=instance.site)
-        PowerPanel.objects.filter(location__in=locations).update(site=instance.site)
+        update_objects(Rack.objects.filter(location__in=locations), site=instance.site)
+        update_objects(Device.objects.filter(location__in=locations), site=instance.site)
+        update_objects(PowerPanel.objects.filter(location__in=locations), site=instance.site)
+    instance._orig_site_id = instance.site_id
 
 
 @receiver(post_save, sender=Rack)
@@ -32,8 +38,41 @@ def handle_rack_site_change(instance, created, **kwargs):
     """
     Update child Devices if Site or Location assignment has changed.
     """
-    if not created:
-        Device.objects.filter(rack=instance).update(site=instance.site, location=instance.location)
+    if not created and (
+        instance.site_id != getattr(instance, '_orig_site_id', DEFERRED) or
+        instance.location_id != getattr(instance, '_orig_location_id', DEFERRED)
+    ):
+        update_objects(Device.objects.filter(rack=instance), site=instance.site, location=instance.location)
+    instance._orig_site_id = instance.site_id
+    instance._orig_location_id = instance.location_id
+
+
+#
+# Device type component templates
+#
+
+COMPONENT_TEMPLATE_MODELS = (
+    ConsolePortTemplate, ConsoleServerPortTemplate, PowerPortTemplate, PowerOutletTemplate, InterfaceTemplate,
+    FrontPortTemplate, RearPortTemplate, ModuleBayTemplate, DeviceBayTemplate, InventoryItemTemplate,
+)
+
+
+def clear_component_blueprint(instance, **kwargs):
+    """
+    Discard the cached component blueprint of a DeviceType when any of its component templates is changed.
+    """
+    if instance.device_type_id is not None:
+        DeviceType.clear_component_blueprint(instance.device_type_id)
+
+    # Also clear the blueprint of any DeviceType from which the template has been moved
+    prechange_device_type = (getattr(instance, '_prechange_snapshot', None) or {}).get('device_type')
+    if prechange_device_type not in (None, instance.device_type_id):
+        DeviceType.clear_component_blueprint(prechange_device_type)
+
+
+for template_model in COMPONENT_TEMPLATE_MODELS:
+    post_save.connect(clear_component_blueprint, sender=template_model)
+    post_delete.connect(clear_component_blueprint, sender=template_model)
 
 
 #
@@ -125,16 +164,5 @@ def nullify_connected_endpoints(instance, **kwargs):
         model = instance.termination_b._meta.model
         model.objects.filter(pk=instance.termination_b.pk).update(_link_peer_type=None, _link_peer_id=None)
 
-    # Delete and retrace any dependent cable paths
-    for cablepath in CablePath.objects.filter(path__contains=instance):
-        cp = CablePath.from_origin(cablepath.origin)
-        if cp:
-            CablePath.objects.filter(pk=cablepath.pk).update(
-                path=cp.path,
-                destination_type=ContentType.objects.get_for_model(cp.destination) if cp.destination else None,
-                destination_id=cp.destination.pk if cp.destination else None,
-                is_active=cp.is_active,
-                is_split=cp.is_split
-            )
-        else:
-            cablepath.delete()
+    # Retrace any dependent cable paths (deleting any which no longer exist)
+    rebuild_paths(instance)
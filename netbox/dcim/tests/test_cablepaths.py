@@ -1,5 +1,10 @@
+from io import StringIO
+
 from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from circuits.models import *
 from dcim.choices import LinkStatusChoices
@@ -15,6 +20,7 @@ class CablePathTestCase(TestCase):
         1XX: Test direct connections between different endpoint types
         2XX: Test different cable topologies
         3XX: Test responses to changes in existing objects
+        4XX: Test the trace_paths management command
     """
     @classmethod
     def setUpTestData(cls):
@@ -1175,3 +1181,167 @@ class CablePathTestCase(TestCase):
             is_active=True
         )
         self.assertEqual(CablePath.objects.count(), 2)
+
+    def test_303_trace_multiple_origins(self):
+        """
+        [IF1] --C1-- [FP1:1] [RP1] --C3-- [RP2] [FP2:1] --C4-- [IF3]
+        [IF2] --C2-- [FP1:2]                    [FP2:2] --C5-- [IF4]
+        """
+        interfaces = [
+            Interface.objects.create(device=self.device, name=f'Interface {i}') for i in range(1, 5)
+        ]
+        rearport1 = RearPort.objects.create(device=self.device, name='Rear Port 1', positions=4)
+        rearport2 = RearPort.objects.create(device=self.device, name='Rear Port 2', positions=4)
+        for i in (1, 2):
+            frontport1 = FrontPort.objects.create(
+                device=self.device, name=f'Front Port 1:{i}', rear_port=rearport1, rear_port_position=i
+            )
+            frontport2 = FrontPort.objects.create(
+                device=self.device, name=f'Front Port 2:{i}', rear_port=rearport2, rear_port_position=i
+            )
+            Cable(termination_a=interfaces[i - 1], termination_b=frontport1).save()
+            Cable(termination_a=frontport2, termination_b=interfaces[i + 1]).save()
+        Cable(termination_a=rearport1, termination_b=rearport2).save()
+        self.assertEqual(CablePath.objects.filter(is_active=True).count(), 4)
+
+        # Tracing all origins together requires no more queries than tracing any one of them
+        origins = list(Interface.objects.filter(pk__in=[i.pk for i in interfaces]).order_by('pk'))
+        with CaptureQueriesContext(connection) as single_context:
+            CablePath.from_origin(origins[0])
+        with CaptureQueriesContext(connection) as context:
+            cablepaths = CablePath.from_origins(origins)
+        self.assertLessEqual(len(context.captured_queries), len(single_context.captured_queries))
+
+        # The traced paths match those traced individually when the cables were created
+        for origin, cp in zip(origins, cablepaths):
+            existing = CablePath.objects.get(pk=origin._path_id)
+            self.assertEqual(cp.path, existing.path)
+            self.assertEqual(cp.destination_type_id, existing.destination_type_id)
+            self.assertEqual(cp.destination_id, existing.destination_id)
+            self.assertEqual(cp.is_active, existing.is_active)
+            self.assertEqual(cp.is_split, existing.is_split)
+
+    def test_304_delete_trunk_cable(self):
+        """
+        [IF A1] --C-- [FP A1] [RP1] --Trunk-- [RP2] [FP B1] --C-- [IF B1]
+        ...
+        [IF An] --C-- [FP An]                       [FP Bn] --C-- [IF Bn]
+        """
+        def create_trunk(prefix, positions):
+            rearport1 = RearPort.objects.create(device=self.device, name=f'{prefix} Rear Port 1', positions=positions)
+            rearport2 = RearPort.objects.create(device=self.device, name=f'{prefix} Rear Port 2', positions=positions)
+            for i in range(1, positions + 1):
+                for rearport, side in ((rearport1, 'A'), (rearport2, 'B')):
+                    interface = Interface.objects.create(device=self.device, name=f'{prefix} Interface {side}{i}')
+                    frontport = FrontPort.objects.create(
+                        device=self.device, name=f'{prefix} Front Port {side}{i}', rear_port=rearport,
+                        rear_port_position=i
+                    )
+                    Cable(termination_a=interface, termination_b=frontport).save()
+            trunk = Cable(termination_a=rearport1, termination_b=rearport2)
+            trunk.save()
+            return trunk
+
+        trunk1 = create_trunk('Trunk 1', 2)
+        trunk2 = create_trunk('Trunk 2', 8)
+        self.assertEqual(CablePath.objects.filter(is_active=True).count(), 20)
+
+        # The number of queries needed to retrace the affected paths does not depend on the number of paths
+        with CaptureQueriesContext(connection) as context1:
+            trunk1.delete()
+        with CaptureQueriesContext(connection) as context2:
+            trunk2.delete()
+        self.assertEqual(len(context1.captured_queries), len(context2.captured_queries))
+
+        # Every path now ends at its RearPort
+        self.assertEqual(CablePath.objects.count(), 20)
+        self.assertFalse(CablePath.objects.filter(is_active=True).exists())
+        interface = Interface.objects.get(name='Trunk 2 Interface A8')
+        frontport = FrontPort.objects.get(name='Trunk 2 Front Port A8')
+        self.assertPathExists(
+            origin=interface,
+            destination=None,
+            path=(interface.cable, frontport, frontport.rear_port),
+            is_active=False
+        )
+
+    def test_401_trace_paths_missing(self):
+        """
+        [IF1] --C1-- [IF2]
+        [IF3] --C2-- [IF4]
+
+        Delete all paths and run trace_paths to recreate them, two endpoints at a time.
+        """
+        interfaces = [
+            Interface.objects.create(device=self.device, name=f'Interface {i}') for i in range(1, 5)
+        ]
+        cable1 = Cable(termination_a=interfaces[0], termination_b=interfaces[1])
+        cable1.save()
+        cable2 = Cable(termination_a=interfaces[2], termination_b=interfaces[3])
+        cable2.save()
+        CablePath.objects.all().delete()
+
+        with CaptureQueriesContext(connection) as ctx:
+            call_command('trace_paths', chunk_size=2, stdout=StringIO())
+
+        # Paths should be created and set on their origins using a single query per chunk
+        sql = [query['sql'] for query in ctx.captured_queries]
+        self.assertEqual(len([q for q in sql if q.startswith('INSERT INTO "dcim_cablepath"')]), 2)
+        self.assertEqual(len([q for q in sql if q.startswith('UPDATE "dcim_interface"')]), 2)
+
+        self.assertEqual(CablePath.objects.count(), 4)
+        for origin, destination, cable in (
+            (interfaces[0], interfaces[1], cable1),
+            (interfaces[1], interfaces[0], cable1),
+            (interfaces[2], interfaces[3], cable2),
+            (interfaces[3], interfaces[2], cable2),
+        ):
+            path = self.assertPathExists(origin=origin, destination=destination, path=(cable,), is_active=True)
+            origin.refresh_from_db()
+            self.assertPathIsSet(origin, path)
+
+    def test_402_trace_paths_resume(self):
+        """
+        [IF1] --C1-- [IF2]
+
+        Run trace_paths after an interrupted run has left a stale path from IF1 which is not set on the interface.
+        """
+        interface1 = Interface.objects.create(device=self.device, name='Interface 1')
+        interface2 = Interface.objects.create(device=self.device, name='Interface 2')
+        cable1 = Cable(termination_a=interface1, termination_b=interface2)
+        cable1.save()
+        stale_path = self.assertPathExists(origin=interface1, destination=interface2)
+        path2 = self.assertPathExists(origin=interface2, destination=interface1)
+        Interface.objects.filter(pk=interface1.pk).update(_path=None)
+
+        call_command('trace_paths', stdout=StringIO())
+
+        # The stale path should be replaced, leaving the path from IF2 untouched
+        self.assertFalse(CablePath.objects.filter(pk=stale_path.pk).exists())
+        self.assertEqual(CablePath.objects.count(), 2)
+        path1 = self.assertPathExists(origin=interface1, destination=interface2, path=(cable1,), is_active=True)
+        interface1.refresh_from_db()
+        interface2.refresh_from_db()
+        self.assertPathIsSet(interface1, path1)
+        self.assertPathIsSet(interface2, path2)
+
+    def test_403_trace_paths_force(self):
+        """
+        [IF1] --C1-- [IF2]
+
+        Run trace_paths with --force to recalculate all existing paths.
+        """
+        interface1 = Interface.objects.create(device=self.device, name='Interface 1')
+        interface2 = Interface.objects.create(device=self.device, name='Interface 2')
+        cable1 = Cable(termination_a=interface1, termination_b=interface2)
+        cable1.save()
+        old_pks = list(CablePath.objects.values_list('pk', flat=True))
+
+        call_command('trace_paths', force=True, no_input=True, stdout=StringIO())
+
+        self.assertFalse(CablePath.objects.filter(pk__in=old_pks).exists())
+        self.assertEqual(CablePath.objects.count(), 2)
+        for origin, destination in ((interface1, interface2), (interface2, interface1)):
+            path = self.assertPathExists(origin=origin, destination=destination, path=(cable1,), is_active=True)
+            origin.refresh_from_db()
+            self.assertPathIsSet(origin, path)
@@ -1,10 +1,18 @@
+import uuid
+
+from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from circuits.models import *
 from dcim.choices import *
 from dcim.models import *
+from extras.context_managers import change_logging
+from extras.models import ObjectChange
 from tenancy.models import Tenant
+from utilities.utils import NetBoxFakeRequest
 
 
 class LocationTestCase(TestCase):
@@ -386,6 +394,110 @@ class DeviceTestCase(TestCase):
             name='Device Bay 1'
         )
 
+    def test_bulk_provision(self):
+        """
+        Ensure that Devices provisioned in bulk receive all components defined by the DeviceType.
+        """
+        interface_template = InterfaceTemplate.objects.get(device_type=self.device_type)
+        iit1 = InventoryItemTemplate.objects.create(device_type=self.device_type, name='Inventory Item 1')
+        iit2 = InventoryItemTemplate.objects.create(
+            device_type=self.device_type, name='Inventory Item 2', parent=iit1, component=interface_template
+        )
+        InventoryItemTemplate.objects.create(device_type=self.device_type, name='Inventory Item 3', parent=iit2)
+        # A second tree repeating names beneath different parents (including that of its root, which is instantiated
+        # before the root's last child)
+        iit4 = InventoryItemTemplate.objects.create(device_type=self.device_type, name='Inventory Item 4')
+        iit5 = InventoryItemTemplate.objects.create(device_type=self.device_type, name='Inventory Item 2', parent=iit4)
+        InventoryItemTemplate.objects.create(device_type=self.device_type, name='Inventory Item 4', parent=iit5)
+        InventoryItemTemplate.objects.create(device_type=self.device_type, name='Inventory Item 5', parent=iit4)
+
+        devices = Device.objects.bulk_provision(self.device_type, [
+            Device(site=self.site, device_role=self.device_role, name=f'Test Device {i}') for i in range(1, 4)
+        ])
+
+        self.assertEqual(Device.objects.filter(device_type=self.device_type).count(), 3)
+        for d in devices:
+            self.assertEqual(d.consoleports.count(), 1)
+            self.assertEqual(d.consoleserverports.count(), 1)
+            self.assertEqual(d.modulebays.count(), 1)
+            self.assertEqual(d.devicebays.count(), 1)
+            self.assertEqual(d.poweroutlets.get().power_port, d.powerports.get())
+            self.assertEqual(d.frontports.get().rear_port, d.rearports.get())
+
+            # Inventory items are created with valid tree attributes, beneath the parents defined by their templates
+            root1 = InventoryItem.objects.get(device=d, name='Inventory Item 1', parent__isnull=True)
+            self.assertEqual(
+                list(root1.get_descendants().values_list('parent__name', 'name')),
+                [('Inventory Item 1', 'Inventory Item 2'), ('Inventory Item 2', 'Inventory Item 3')]
+            )
+            root2 = InventoryItem.objects.get(device=d, name='Inventory Item 4', parent__isnull=True)
+            item2 = root2.get_children().get(name='Inventory Item 2')
+            self.assertEqual(
+                list(root2.get_descendants().values_list('parent', 'name')),
+                [
+                    (root2.pk, 'Inventory Item 2'),
+                    (item2.pk, 'Inventory Item 4'),
+                    (root2.pk, 'Inventory Item 5'),
+                ]
+            )
+            self.assertEqual(
+                InventoryItem.objects.get(device=d, parent__name='Inventory Item 1').component,
+                d.interfaces.get()
+            )
+            self.assertIsNone(item2.component)
+        self.assertEqual(len(set(InventoryItem.objects.values_list('tree_id', flat=True))), 6)
+
+    def test_change_parent_device_site(self):
+        """
+        Check that child Devices are updated (and change-logged) in bulk only when the parent's Site or Rack changes.
+        """
+        manufacturer = self.device_type.manufacturer
+        parent_type = DeviceType.objects.create(
+            manufacturer=manufacturer, model='Parent Device Type', slug='parent-device-type',
+            subdevice_role=SubdeviceRoleChoices.ROLE_PARENT
+        )
+        child_type = DeviceType.objects.create(
+            manufacturer=manufacturer, model='Child Device Type', slug='child-device-type', u_height=0,
+            subdevice_role=SubdeviceRoleChoices.ROLE_CHILD
+        )
+        parent = Device.objects.create(
+            site=self.site, device_type=parent_type, device_role=self.device_role, name='Parent Device'
+        )
+        for i in range(1, 4):
+            child = Device.objects.create(
+                site=self.site, device_type=child_type, device_role=self.device_role, name=f'Child Device {i}'
+            )
+            DeviceBay.objects.create(device=parent, name=f'Device Bay {i}', installed_device=child)
+
+        # Saving the parent without changing its Site or Rack does not touch its children
+        parent = Device.objects.get(pk=parent.pk)
+        with CaptureQueriesContext(connection) as context:
+            parent.save()
+        self.assertEqual(len([q for q in context.captured_queries if q['sql'].startswith('UPDATE')]), 1)
+
+        site2 = Site.objects.create(name='Test Site 2', slug='test-site-2')
+        request = NetBoxFakeRequest({
+            'META': {},
+            'POST': {},
+            'GET': {},
+            'FILES': {},
+            'user': User.objects.create_user(username='testuser'),
+            'path': '',
+            'id': uuid.uuid4(),
+        })
+        with change_logging(request):
+            parent.site = site2
+            parent.save()
+
+        self.assertEqual(Device.objects.filter(site=site2).count(), 4)
+        objectchanges = ObjectChange.objects.filter(request_id=request.id).exclude(changed_object_id=parent.pk)
+        self.assertEqual(
+            sorted(objectchanges.values_list('object_repr', flat=True)),
+            ['Child Device 1', 'Child Device 2', 'Child Device 3']
+        )
+        self.assertEqual(objectchanges[0].prechange_data['site'], self.site.pk)
+        self.assertEqual(objectchanges[0].postchange_data['site'], site2.pk)
+
     def test_multiple_unnamed_devices(self):
 
         device1 = Device(
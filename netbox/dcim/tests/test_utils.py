@@ -0,0 +1,81 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TestCase, TransactionTestCase
+
+from dcim.constants import PATH_NODE_CT_ID_MAX, PATH_NODE_ID_BITS, PATH_NODE_ID_MASK
+from dcim.models import Cable, Interface
+from dcim.utils import compile_path_node, decompile_path_node
+
+
+class PathNodeTest(TestCase):
+    """
+    Validate the encoding of CablePath nodes by compile_path_node() and decompile_path_node().
+    """
+    def test_round_trip(self):
+        for ct_id, object_id in ((1, 1), (17, 123456), (PATH_NODE_CT_ID_MAX, PATH_NODE_ID_MASK), (0, 0)):
+            node = compile_path_node(ct_id, object_id)
+            self.assertEqual(decompile_path_node(node), (ct_id, object_id))
+            # Every node must fit within a signed 64-bit integer (bigint)
+            self.assertLess(node, 1 << 63)
+
+    def test_encoding(self):
+        self.assertEqual(compile_path_node(3, 5), 3 << PATH_NODE_ID_BITS | 5)
+
+    def test_object_id_out_of_range(self):
+        with self.assertRaises(ValueError):
+            compile_path_node(1, PATH_NODE_ID_MASK + 1)
+        with self.assertRaises(ValueError):
+            compile_path_node(1, -1)
+
+    def test_content_type_id_out_of_range(self):
+        with self.assertRaises(ValueError):
+            compile_path_node(PATH_NODE_CT_ID_MAX + 1, 1)
+
+
+class PathNodeMigrationTest(TransactionTestCase):
+    """
+    Validate the conversion of existing CablePath nodes between the string and integer formats by migration 0192.
+    """
+    migrate_from = [('dcim', '0191_cablepath_path_index')]
+    migrate_to = [('dcim', '0192_cablepath_path_integer_nodes')]
+
+    def migrate(self, targets):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(targets)
+
+    def tearDown(self):
+        # Return the database to the latest migration
+        executor = MigrationExecutor(connection)
+        self.migrate(executor.loader.graph.leaf_nodes())
+
+    def test_migration(self):
+        interface_ct = ContentType.objects.get_for_model(Interface).pk
+        cable_ct = ContentType.objects.get_for_model(Cable).pk
+        path = [f'{cable_ct}:1', f'{interface_ct}:2', f'{cable_ct}:{PATH_NODE_ID_MASK}']
+
+        self.migrate(self.migrate_from)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO dcim_cablepath (origin_type_id, origin_id, path, is_active, is_split) "
+                "VALUES (%s, %s, %s, true, false)",
+                [interface_ct, 1, path]
+            )
+
+        # Nodes are encoded as integers, preserving their order
+        self.migrate(self.migrate_to)
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT path FROM dcim_cablepath")
+            nodes = cursor.fetchone()[0]
+        self.assertEqual(nodes, [
+            compile_path_node(cable_ct, 1),
+            compile_path_node(interface_ct, 2),
+            compile_path_node(cable_ct, PATH_NODE_ID_MASK),
+        ])
+
+        # Reversing the migration restores the original strings
+        self.migrate(self.migrate_from)
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT path FROM dcim_cablepath")
+            self.assertEqual(cursor.fetchone()[0], path)
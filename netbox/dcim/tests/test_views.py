@@ -11,8 +11,10 @@ from netaddr import EUI
 from dcim.choices import *
 from dcim.constants import *
 from dcim.models import *
+from extras.models import Tag
 from ipam.models import ASN, RIR, VLAN, VRF
 from tenancy.models import Tenant
+from utilities.ordering import naturalize_interface
 from utilities.testing import ViewTestCases, create_tags, create_test_device, post_data
 from wireless.models import WirelessLAN
 
@@ -769,7 +771,7 @@ inventory-items:
         # Test default YAML export
         response = self.client.get(f'{url}?export')
         self.assertEqual(response.status_code, 200)
-        data = list(yaml.load_all(response.content, Loader=yaml.SafeLoader))
+        data = list(yaml.load_all(response.getvalue(), Loader=yaml.SafeLoader))
         self.assertEqual(len(data), 3)
         self.assertEqual(data[0]['manufacturer'], 'Manufacturer 1')
         self.assertEqual(data[0]['model'], 'Device Type 1')
@@ -1063,7 +1065,7 @@ front-ports:
         # Test default YAML export
         response = self.client.get(f'{url}?export')
         self.assertEqual(response.status_code, 200)
-        data = list(yaml.load_all(response.content, Loader=yaml.SafeLoader))
+        data = list(yaml.load_all(response.getvalue(), Loader=yaml.SafeLoader))
         self.assertEqual(len(data), 3)
         self.assertEqual(data[0]['manufacturer'], 'Manufacturer 1')
         self.assertEqual(data[0]['model'], 'Module Type 1')
@@ -2266,6 +2268,39 @@ class InterfaceTestCase(ViewTestCases.DeviceComponentViewTestCase):
         response = self.client.get(reverse('dcim:interface_trace', kwargs={'pk': interface1.pk}))
         self.assertHttpStatus(response, 200)
 
+    def test_bulk_add_components(self):
+        devices = (Device.objects.get(name='Device 1'), create_test_device('Device 2'))
+        tags = Tag.objects.filter(name__in=['Alpha', 'Bravo'])
+        self.add_permissions('dcim.add_interface')
+
+        form_data = {
+            'pk': [device.pk for device in devices],
+            'name_pattern': 'Ethernet[1-4]',
+            'label_pattern': 'Port [1-4]',
+            'type': InterfaceTypeChoices.TYPE_1GE_FIXED,
+            'enabled': True,
+            'mtu': 9000,
+            'tags': [t.pk for t in tags],
+            '_create': True,
+        }
+        response = self.client.post(reverse('dcim:device_bulk_add_interface'), data=post_data(form_data))
+        self.assertHttpStatus(response, 302)
+
+        interfaces = Interface.objects.filter(name__startswith='Ethernet')
+        self.assertEqual(interfaces.count(), 8)
+        interface = interfaces.get(device=devices[1], name='Ethernet3')
+        self.assertEqual(interface.label, 'Port 3')
+        self.assertEqual(interface.mtu, 9000)
+        self.assertEqual(interface._name, naturalize_interface('Ethernet3', max_length=100))
+        self.assertEqual(sorted(interface.tags.names()), ['Alpha', 'Bravo'])
+
+        # Creating components with names which already exist fails for all devices
+        form_data['name_pattern'] = 'Ethernet[4-5]'
+        form_data['label_pattern'] = ''
+        response = self.client.post(reverse('dcim:device_bulk_add_interface'), data=post_data(form_data))
+        self.assertHttpStatus(response, 200)
+        self.assertFalse(Interface.objects.filter(name='Ethernet5').exists())
+
 
 class FrontPortTestCase(ViewTestCases.DeviceComponentViewTestCase):
     model = FrontPort
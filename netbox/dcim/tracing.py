@@ -0,0 +1,261 @@
+from collections import defaultdict
+
+from django.contrib.contenttypes.models import ContentType
+
+from circuits.models import CircuitTermination
+from dcim.choices import LinkStatusChoices
+from dcim.models import Cable, CablePath, FrontPort, Interface, RearPort
+from dcim.utils import compile_path_node
+
+__all__ = (
+    'CablePathTracer',
+)
+
+
+class CablePathTracer:
+    """
+    Trace the CablePaths originating from any number of path origins in memory. Rather than retrieving each node of a
+    path in turn, the traces of all origins advance together: In each round, the nodes required by every trace are
+    retrieved in bulk (using a single query per model), and all retrieved nodes are cached for reuse by other traces.
+    Paths are thus traced using a number of queries proportional to the length of the longest path, rather than to the
+    total number of nodes traversed.
+
+    The CablePaths produced are identical to those produced by tracing each origin individually. Their destinations
+    are assigned by type and ID, without being retrieved.
+    """
+    # Fields to retrieve for each type of node (in addition to its primary key)
+    termination_fields = ('cable_id', '_link_peer_type_id', '_link_peer_id')
+    node_fields = {
+        Cable: ('status',),
+        FrontPort: (*termination_fields, 'rear_port_id', 'rear_port_position'),
+        RearPort: (*termination_fields, 'positions'),
+        CircuitTermination: (*termination_fields, 'circuit_id', 'term_side', 'site_id', 'provider_network_id'),
+    }
+
+    def __init__(self):
+        self.wireless_link_model = Interface._meta.get_field('wireless_link').related_model
+        self.node_fields = {
+            **self.node_fields,
+            self.wireless_link_model: ('status',),
+        }
+        self.provider_network_model = CircuitTermination._meta.get_field('provider_network').related_model
+        self.site_model = CircuitTermination._meta.get_field('site').related_model
+
+        # Retrieved nodes, keyed by model and primary key. Nodes found not to exist are cached as None.
+        self.nodes = defaultdict(dict)
+        # FrontPorts by (rear port ID, position), for each RearPort whose FrontPorts have been retrieved
+        self.front_ports = {}
+        self.rear_ports_loaded = set()
+        # CircuitTerminations by (circuit ID, side), for each Circuit whose terminations have been retrieved
+        self.circuit_terminations = {}
+        self.circuits_loaded = set()
+
+    #
+    # Node retrieval
+    #
+
+    def get_node(self, model, pk):
+        """
+        Return the cached field values of the specified node (or None if it does not exist), first requesting its
+        retrieval if necessary.
+        """
+        if pk not in self.nodes[model]:
+            yield model, pk
+        return self.nodes[model][pk]
+
+    def get_front_port(self, rear_port_id, position):
+        """
+        Return the FrontPort mapped to the given position of a RearPort (if any).
+        """
+        if rear_port_id not in self.rear_ports_loaded:
+            yield 'front_ports', rear_port_id
+        return self.front_ports.get((rear_port_id, position))
+
+    def get_peer_termination(self, termination):
+        """
+        Return the CircuitTermination on the opposite side of a CircuitTermination's Circuit (if any).
+        """
+        if termination['circuit_id'] not in self.circuits_loaded:
+            yield 'circuit_terminations', termination['circuit_id']
+        peer_side = 'Z' if termination['term_side'] == 'A' else 'A'
+        return self.circuit_terminations.get((termination['circuit_id'], peer_side))
+
+    def _store(self, model, rows):
+        for row in rows:
+            row['model'] = model
+            self.nodes[model][row['pk']] = row
+
+    def load(self, requests):
+        """
+        Retrieve all requested nodes, using a single query for each model.
+        """
+        for model, pks in requests.items():
+            if model == 'front_ports':
+                rows = list(
+                    FrontPort.objects.filter(rear_port_id__in=pks).values('pk', *self.node_fields[FrontPort])
+                )
+                self._store(FrontPort, rows)
+                for row in rows:
+                    self.front_ports[(row['rear_port_id'], row['rear_port_position'])] = row
+                self.rear_ports_loaded.update(pks)
+            elif model == 'circuit_terminations':
+                rows = list(CircuitTermination.objects.filter(circuit_id__in=pks).values(
+                    'pk', *self.node_fields[CircuitTermination]
+                ))
+                self._store(CircuitTermination, rows)
+                for row in rows:
+                    self.circuit_terminations[(row['circuit_id'], row['term_side'])] = row
+                self.circuits_loaded.update(pks)
+            else:
+                fields = self.node_fields.get(model, ())
+                self._store(model, model._default_manager.filter(pk__in=pks).values('pk', *fields))
+                for pk in pks:
+                    self.nodes[model].setdefault(pk, None)
+
+    #
+    # Tracing
+    #
+
+    @staticmethod
+    def path_node(node):
+        return compile_path_node(ContentType.objects.get_for_model(node['model']).pk, node['pk'])
+
+    def get_link(self, termination):
+        """
+        Return the Cable or WirelessLink attached to a termination (if any).
+        """
+        if termination['cable_id'] is not None:
+            return (yield from self.get_node(Cable, termination['cable_id']))
+        if termination.get('wireless_link_id') is not None:
+            return (yield from self.get_node(self.wireless_link_model, termination['wireless_link_id']))
+        return None
+
+    def get_link_peer(self, termination):
+        if termination['_link_peer_type_id'] is None:
+            return None
+        model = ContentType.objects.get_for_id(termination['_link_peer_type_id']).model_class()
+        return (yield from self.get_node(model, termination['_link_peer_id']))
+
+    def _trace(self, origin):
+        """
+        Trace the path from a single origin. This mirrors the original hop-by-hop algorithm of CablePath.from_origin(),
+        but is implemented as a generator which yields each node it needs retrieved before proceeding.
+        """
+        if origin is None:
+            return None
+
+        node = {
+            'model': origin._meta.model,
+            'pk': origin.pk,
+            'cable_id': origin.cable_id,
+            'wireless_link_id': getattr(origin, 'wireless_link_id', None),
+            '_link_peer_type_id': origin._link_peer_type_id,
+            '_link_peer_id': origin._link_peer_id,
+        }
+        link = yield from self.get_link(node)
+        if link is None:
+            return None
+
+        destination = None
+        path = []
+        position_stack = []
+        is_active = True
+        is_split = False
+
+        while link is not None:
+            if link['status'] != LinkStatusChoices.STATUS_CONNECTED:
+                is_active = False
+
+            # Follow the link to its far-end termination
+            path.append(self.path_node(link))
+            peer_termination = yield from self.get_link_peer(node)
+
+            # Follow a FrontPort to its corresponding RearPort
+            if peer_termination is not None and peer_termination['model'] is FrontPort:
+                path.append(self.path_node(peer_termination))
+                node = yield from self.get_node(RearPort, peer_termination['rear_port_id'])
+                if node['positions'] > 1:
+                    position_stack.append(peer_termination['rear_port_position'])
+                path.append(self.path_node(node))
+
+            # Follow a RearPort to its corresponding FrontPort (if any)
+            elif peer_termination is not None and peer_termination['model'] is RearPort:
+                path.append(self.path_node(peer_termination))
+
+                # Determine the peer FrontPort's position
+                if peer_termination['positions'] == 1:
+                    position = 1
+                elif position_stack:
+                    position = position_stack.pop()
+                else:
+                    # No position indicated: path has split, so we stop at the RearPort
+                    is_split = True
+                    break
+
+                node = yield from self.get_front_port(peer_termination['pk'], position)
+                if node is None:
+                    # No corresponding FrontPort found for the RearPort
+                    break
+                path.append(self.path_node(node))
+
+            # Follow a CircuitTermination to its corresponding CircuitTermination (A to Z or vice versa)
+            elif peer_termination is not None and peer_termination['model'] is CircuitTermination:
+                path.append(self.path_node(peer_termination))
+                # Get peer CircuitTermination
+                node = yield from self.get_peer_termination(peer_termination)
+                if node is None:
+                    # No peer CircuitTermination exists; halt the trace
+                    break
+                path.append(self.path_node(node))
+                if node['provider_network_id'] is not None:
+                    destination = (self.provider_network_model, node['provider_network_id'])
+                    break
+                elif node['site_id'] is not None and node['cable_id'] is None:
+                    destination = (self.site_model, node['site_id'])
+                    break
+
+            # Anything else marks the end of the path
+            else:
+                if peer_termination is not None:
+                    destination = (peer_termination['model'], peer_termination['pk'])
+                break
+
+            link = yield from self.get_link(node)
+
+        if destination is None:
+            is_active = False
+
+        return CablePath(
+            origin=origin,
+            destination_type=ContentType.objects.get_for_model(destination[0]) if destination else None,
+            destination_id=destination[1] if destination else None,
+            path=path,
+            is_active=is_active,
+            is_split=is_split
+        )
+
+    def trace(self, origins):
+        """
+        Trace the paths from all the given origins, returning a list of new CablePath instances (or None for each
+        origin without a path) in the same order.
+        """
+        results = [None] * len(origins)
+        traces = [(i, self._trace(origin)) for i, origin in enumerate(origins)]
+
+        while traces:
+            requests = defaultdict(set)
+            waiting = []
+            for i, trace in traces:
+                # Advance each trace until it requests a node which has not yet been retrieved
+                try:
+                    model, pk = next(trace)
+                except StopIteration as e:
+                    results[i] = e.value
+                    continue
+                requests[model].add(pk)
+                waiting.append((i, trace))
+
+            self.load(requests)
+            traces = waiting
+
+        return results
@@ -1,30 +1,39 @@
 from django.contrib.contenttypes.models import ContentType
 from django.db import transaction
 
+from .constants import PATH_NODE_CT_ID_MAX, PATH_NODE_ID_BITS, PATH_NODE_ID_MASK
+
 
 def compile_path_node(ct_id, object_id):
-    return f'{ct_id}:{object_id}'
+    """
+    Encode a ContentType ID and object ID as a single integer. Raises ValueError if either ID is out of the range
+    which can be represented.
+    """
+    if not 0 <= object_id <= PATH_NODE_ID_MASK:
+        raise ValueError(f"Object ID {object_id} cannot be encoded as a path node (maximum: {PATH_NODE_ID_MASK})")
+    if not 0 <= ct_id <= PATH_NODE_CT_ID_MAX:
+        raise ValueError(f"ContentType ID {ct_id} cannot be encoded as a path node (maximum: {PATH_NODE_CT_ID_MAX})")
+    return ct_id << PATH_NODE_ID_BITS | object_id
 
 
-def decompile_path_node(repr):
-    ct_id, object_id = repr.split(':')
-    return int(ct_id), int(object_id)
+def decompile_path_node(node):
+    return node >> PATH_NODE_ID_BITS, node & PATH_NODE_ID_MASK
 
 
 def object_to_path_node(obj):
     """
-    Return a representation of an object suitable for inclusion in a CablePath path. Node representation is in the
-    form <ContentType ID>:<Object ID>.
+    Return a representation of an object suitable for inclusion in a CablePath path. Each node is represented by a
+    single integer encoding both its ContentType ID and its object ID (see compile_path_node()).
     """
     ct = ContentType.objects.get_for_model(obj)
     return compile_path_node(ct.pk, obj.pk)
 
 
-def path_node_to_object(repr):
+def path_node_to_object(node):
     """
-    Given the string representation of a path node, return the corresponding instance.
+    Given the integer representation of a path node, return the corresponding instance.
     """
-    ct_id, object_id = decompile_path_node(repr)
+    ct_id, object_id = decompile_path_node(node)
     ct = ContentType.objects.get_for_id(ct_id)
     return ct.model_class().objects.get(pk=object_id)
 
@@ -42,14 +51,30 @@ def create_cablepath(node):
 
 def rebuild_paths(obj):
     """
-    Rebuild all CablePaths which traverse the specified node
+    Rebuild all CablePaths which traverse the specified node. The affected paths are retraced from their origins
+    together and updated in place using a single query; any which no longer exist are deleted.
     """
     from dcim.models import CablePath
 
-    cable_paths = CablePath.objects.filter(path__contains=obj)
+    cable_paths = list(CablePath.objects.filter(path__contains=obj).prefetch_related('origin'))
+    retraced = [cp for cp in cable_paths if cp.origin is not None]
+    deleted = [cp.pk for cp in cable_paths if cp.origin is None]
+
+    updated = []
+    for cp, new_cp in zip(retraced, CablePath.from_origins([cp.origin for cp in retraced])):
+        if new_cp is None:
+            deleted.append(cp.pk)
+            continue
+        cp.path = new_cp.path
+        cp.destination_type_id = new_cp.destination_type_id
+        cp.destination_id = new_cp.destination_id
+        cp.is_active = new_cp.is_active
+        cp.is_split = new_cp.is_split
+        updated.append(cp)
 
     with transaction.atomic():
-        for cp in cable_paths:
-            cp.delete()
-            if cp.origin:
-                create_cablepath(cp.origin)
+        if deleted:
+            CablePath.objects.filter(pk__in=deleted).delete()
+        CablePath.objects.bulk_update(
+            updated, ['path', 'destination_type', 'destination_id', 'is_active', 'is_split'], batch_size=1000
+        )
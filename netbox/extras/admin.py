@@ -31,6 +31,9 @@ class ConfigRevisionAdmin(admin.ModelAdmin):
         ('Pagination', {
             'fields': ('PAGINATE_COUNT', 'MAX_PAGE_SIZE'),
         }),
+        ('Search', {
+            'fields': ('SEARCH_MAX_WORKERS', 'SEARCH_TIMEOUT'),
+        }),
         ('Validation', {
             'fields': ('CUSTOM_VALIDATORS',),
             'classes': ('monospace',),
@@ -43,7 +46,10 @@ class ConfigRevisionAdmin(admin.ModelAdmin):
             'fields': ('DEFAULT_USER_PREFERENCES',),
         }),
         ('Miscellaneous', {
-            'fields': ('MAINTENANCE_MODE', 'GRAPHQL_ENABLED', 'CHANGELOG_RETENTION', 'JOBRESULT_RETENTION', 'MAPS_URL'),
+            'fields': (
+                'MAINTENANCE_MODE', 'GRAPHQL_ENABLED', 'GRAPHQL_MAX_QUERY_COST', 'GRAPHQL_MAX_QUERY_DEPTH',
+                'HOME_STATS_TIMEOUT', 'CHANGELOG_RETENTION', 'JOBRESULT_RETENTION', 'MAPS_URL',
+            ),
         }),
         ('Config Revision', {
             'fields': ('comment',),
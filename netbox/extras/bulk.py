@@ -0,0 +1,305 @@
+from collections import defaultdict
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import NON_FIELD_ERRORS, ValidationError
+from django.db import models, router, transaction
+from django.db.models.deletion import Collector
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch.dispatcher import _make_id
+from django.forms import BaseModelForm
+from django_prometheus.models import model_deletes, model_inserts, model_updates
+from taggit.managers import TaggableManager
+
+from netbox import thread_locals
+from netbox.request_context import get_request
+from utilities.utils import is_taggable
+from .choices import ObjectChangeActionChoices
+from .models import CachedValue, ObjectChange, Webhook
+from .search import cache_objects, get_indexed_models
+from .signals import handle_deleted_object, remove_search_values
+from .webhooks import enqueue_object
+
+__all__ = (
+    'BulkDeleteCollector',
+    'bulk_create_objects',
+    'bulk_delete',
+    'can_bulk_create',
+    'get_defining_class',
+    'get_serialization_lookups',
+    'has_receivers',
+    'log_changes',
+    'update_objects',
+    'validate_unique',
+)
+
+
+def get_defining_class(model, attr):
+    """
+    Return the first class in the model's MRO which defines the given attribute.
+    """
+    for cls in model.__mro__:
+        if attr in cls.__dict__:
+            return cls
+
+
+def has_receivers(signal, sender):
+    """
+    Return True if any receivers are connected to the signal specifically for the given sender.
+    """
+    sender_id = _make_id(sender)
+    return any(lookup_key[1] == sender_id for lookup_key, _ in signal.receivers)
+
+
+def can_bulk_create(model_form):
+    """
+    Return True if objects saved by the given model form class can instead be created using bulk_create_objects()
+    without bypassing any custom save logic. (Many-to-many assignments must be made separately.)
+    """
+    model = model_form._meta.model
+
+    if model_form.save is not BaseModelForm.save or model._meta.parents:
+        return False
+    if has_receivers(pre_save, model) or has_receivers(post_save, model):
+        return False
+
+    # Any custom save() method must be mirrored by prepare_bulk_create()
+    save_class = get_defining_class(model, 'save')
+    if save_class is not models.Model:
+        prepare_class = get_defining_class(model, 'prepare_bulk_create')
+        if prepare_class is None or model.__mro__.index(prepare_class) > model.__mro__.index(save_class):
+            return False
+
+    return True
+
+
+def validate_unique(entries):
+    """
+    Validate the uniqueness of multiple new instances of a model, both against existing objects and amongst each
+    other, using a single query per unique check. `entries` is an iterable of (instance, exclude) tuples, where
+    `exclude` lists the fields to be excluded from validation as for Model.validate_unique().
+
+    Returns a list of (instance, ValidationError) tuples, one for each instance which fails a check.
+    """
+    checks = defaultdict(list)
+    for instance, exclude in entries:
+        unique_checks, _ = instance._get_unique_checks(exclude=exclude)
+        # The same check may be listed more than once (e.g. for both unique_together and a UniqueConstraint)
+        for model_class, fields in dict.fromkeys(unique_checks):
+            values = tuple(getattr(instance, model_class._meta.get_field(f).attname) for f in fields)
+            if None not in values:
+                checks[(model_class, fields)].append((instance, values))
+
+    errors = []
+    for (model_class, fields), check_entries in checks.items():
+        # Retrieve all existing objects matching any of the values of each field, and find exact matches in memory
+        attnames = [model_class._meta.get_field(f).attname for f in fields]
+        lookups = {
+            f'{attname}__in': {values[i] for _, values in check_entries} for i, attname in enumerate(attnames)
+        }
+        existing = set(model_class._default_manager.filter(**lookups).order_by().values_list(*attnames))
+
+        key = fields[0] if len(fields) == 1 else NON_FIELD_ERRORS
+        for instance, values in check_entries:
+            if values in existing:
+                errors.append((instance, ValidationError({
+                    key: instance.unique_error_message(model_class, fields)
+                })))
+            existing.add(values)
+
+    return errors
+
+
+def get_serialization_lookups(model):
+    """
+    Return the related object lookups to prefetch for objects of the model which are to be serialized by
+    serialize_object() (e.g. for change logging), to avoid querying many-to-many assignments for each object.
+    """
+    lookups = [field.name for field in model._meta.local_many_to_many if field.serialize]
+    if is_taggable(model):
+        lookups.append('tags')
+    return lookups
+
+
+def log_changes(instances, action):
+    """
+    Record ObjectChanges, enqueue webhooks, and increment metrics for objects of a single model which have been
+    created, updated, or deleted in bulk (bypassing the signals which would normally do this). Nothing is done unless
+    change logging is active for the current request.
+
+    Instances being updated or deleted must have had snapshot() called beforehand. Their many-to-many assignments
+    (see get_serialization_lookups()) should be prefetched.
+    """
+    request = get_request()
+    if not instances or request is None:
+        return
+
+    model = instances[0]._meta.model
+    if not hasattr(model, 'to_objectchange'):
+        return
+
+    objectchanges = []
+    for instance in instances:
+        objectchange = instance.to_objectchange(action)
+        objectchange.user = request.user
+        objectchange.user_name = request.user.username
+        objectchange.request_id = request.id
+        objectchanges.append(objectchange)
+    ObjectChange.objects.bulk_create(objectchanges)
+
+    # Serialize objects for webhooks only if any are configured to fire
+    content_type = ContentType.objects.get_for_model(model)
+    webhook_type = {
+        ObjectChangeActionChoices.ACTION_CREATE: 'type_create',
+        ObjectChangeActionChoices.ACTION_UPDATE: 'type_update',
+        ObjectChangeActionChoices.ACTION_DELETE: 'type_delete',
+    }[action]
+    if Webhook.objects.filter(content_types=content_type, enabled=True, **{webhook_type: True}).exists():
+        for instance in instances:
+            enqueue_object(thread_locals.webhook_queue, instance, request.user, request.id, action)
+
+    metric = {
+        ObjectChangeActionChoices.ACTION_CREATE: model_inserts,
+        ObjectChangeActionChoices.ACTION_UPDATE: model_updates,
+        ObjectChangeActionChoices.ACTION_DELETE: model_deletes,
+    }[action]
+    metric.labels(model._meta.model_name).inc(len(instances))
+
+
+def update_objects(queryset, **values):
+    """
+    Set the given field values on all objects matched by a queryset using a single UPDATE query, then record
+    changelog entries, enqueue webhooks, and update the search index for the objects in bulk (as saving each object
+    would). Any auto-updated fields (e.g. last_updated) are set as well. No save() methods or signals are invoked.
+
+    The objects are retrieved only if change logging is active or an indexed field is being updated. Returns the
+    number of objects updated.
+    """
+    model = queryset.model
+
+    # Set any auto-updated fields, as update() does not
+    for model_field in model._meta.concrete_fields:
+        if getattr(model_field, 'auto_now', False):
+            values[model_field.name] = model_field.pre_save(model(), add=False)
+
+    indexed_fields = [name for name, _ in get_indexed_models().get(model, [])]
+    reindex = any(name in values for name in indexed_fields)
+    if get_request() is None and not reindex:
+        return queryset.update(**values)
+
+    objects = list(queryset.prefetch_related(*get_serialization_lookups(model)))
+    if not objects:
+        return 0
+
+    for obj in objects:
+        if hasattr(obj, 'snapshot'):
+            obj.snapshot()
+        for name, value in values.items():
+            setattr(obj, name, value)
+    model._default_manager.filter(pk__in=[obj.pk for obj in objects]).update(**values)
+
+    log_changes(objects, ObjectChangeActionChoices.ACTION_UPDATE)
+    if reindex:
+        cache_objects(objects)
+
+    return len(objects)
+
+
+class BulkDeleteCollector(Collector):
+    """
+    A Collector for use by bulk_delete(). The change logging and search index receivers, which apply to all models,
+    are disregarded when determining whether objects can be fast-deleted (i.e. without being retrieved), as their
+    work is performed in bulk by bulk_delete(). Objects which are change-logged or indexed are always retrieved.
+    """
+    bulk_receivers = (handle_deleted_object, remove_search_values)
+
+    def _has_signal_listeners(self, model):
+        if hasattr(model, 'to_objectchange') or model in get_indexed_models():
+            return True
+        return any(
+            receiver not in self.bulk_receivers
+            for signal in (pre_delete, post_delete) for receiver in signal._live_receivers(model)
+        )
+
+
+def bulk_delete(objects):
+    """
+    Delete a set of objects of a single model, along with all objects which depend on them, and return the same
+    result as QuerySet.delete(). The complete cascade of dependent objects is collected at once, rather than for
+    each object in turn. Changelog records, webhooks, and search index removals are then made in bulk for each model
+    before the objects are deleted, and dependent objects to which no other receivers apply are fast-deleted.
+
+    As with delete(), a snapshot should be taken of each object beforehand for its changelog record. Snapshots are
+    taken of any collected dependent objects which lack one.
+    """
+    objects = list(objects)
+    if not objects:
+        return 0, {}
+    using = router.db_for_write(objects[0]._meta.model)
+
+    with transaction.atomic(using=using):
+        collector = BulkDeleteCollector(using=using)
+        collector.collect(objects)
+
+        indexed_models = get_indexed_models()
+        for model, instances in collector.data.items():
+            instances = list(instances)
+
+            # Snapshot any dependent objects collected by cascade for their changelog records
+            if hasattr(model, 'snapshot'):
+                to_snapshot = [instance for instance in instances if not hasattr(instance, '_prechange_snapshot')]
+                models.prefetch_related_objects(to_snapshot, *get_serialization_lookups(model))
+                for instance in to_snapshot:
+                    instance.snapshot()
+
+            # Flag the instances to be skipped by the per-object receivers
+            for instance in instances:
+                instance._bulk_deleted = True
+
+            if hasattr(model, 'to_objectchange'):
+                log_changes(instances, ObjectChangeActionChoices.ACTION_DELETE)
+            if model in indexed_models:
+                CachedValue.objects.filter(
+                    object_type=ContentType.objects.get_for_model(model),
+                    object_id__in=[instance.pk for instance in instances]
+                )._raw_delete(using=using)
+
+        return collector.delete()
+
+
+def bulk_create_objects(instances, m2m_values=None):
+    """
+    Create new objects of a single model using bulk_create(), then perform the work of the post_save receivers in
+    bulk: Record changelog entries and enqueue webhooks (if change logging is active) and update the search index.
+
+    The model's prepare_bulk_create() method (if any) is called for each instance beforehand. `m2m_values` may map
+    the names of many-to-many fields to the related objects to be assigned to every instance.
+    """
+    if not instances:
+        return
+    model = instances[0]._meta.model
+
+    for instance in instances:
+        if hasattr(instance, 'prepare_bulk_create'):
+            instance.prepare_bulk_create()
+    model.objects.bulk_create(instances)
+
+    for name, related_objects in (m2m_values or {}).items():
+        field = model._meta.get_field(name)
+        through = field.remote_field.through
+        if isinstance(field, TaggableManager):
+            through_objects = [
+                through(tag=tag, **through.lookup_kwargs(instance))
+                for instance in instances for tag in related_objects
+            ]
+        else:
+            through_objects = [
+                through(**{field.m2m_field_name(): instance, field.m2m_reverse_field_name(): obj})
+                for instance in instances for obj in related_objects
+            ]
+        through.objects.bulk_create(through_objects)
+
+    if get_request() is not None:
+        models.prefetch_related_objects(instances, *get_serialization_lookups(model))
+        log_changes(instances, ObjectChangeActionChoices.ACTION_CREATE)
+
+    cache_objects(instances)
@@ -11,3 +11,11 @@ EXTRAS_FEATURES = [
     'tags',
     'webhooks'
 ]
+
+# Background exports
+EXPORT_JOB_TIMEOUT = 3600
+EXPORT_MEDIA_DIR = 'exports'
+
+# Background imports
+IMPORT_JOB_TIMEOUT = 3600
+IMPORT_MEDIA_DIR = 'imports'
@@ -0,0 +1,144 @@
+import gzip
+import itertools
+import logging
+import os
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.http import FileResponse, Http404
+from django_rq import job
+
+from utilities.constants import EXPORT_CHUNK_SIZE
+from utilities.utils import iterate_queryset, stream_csv
+from .choices import JobResultStatusChoices
+from .constants import EXPORT_JOB_TIMEOUT, EXPORT_MEDIA_DIR
+from .models import ExportTemplate, JobResult
+
+__all__ = (
+    'enqueue_export',
+    'get_export_path',
+    'get_export_response',
+    'run_export',
+)
+
+logger = logging.getLogger('netbox.extras.exports')
+
+
+def get_export_path(job_result):
+    """
+    Return the path at which the compressed output of a background export is stored.
+    """
+    return os.path.join(settings.MEDIA_ROOT, EXPORT_MEDIA_DIR, f'{job_result.job_id}.gz')
+
+
+def enqueue_export(queryset, user, filename, table_class=None, exclude_columns=None, export_template=None):
+    """
+    Enqueue a background job to export a QuerySet. Objects are exported as CSV if a table class is specified, by
+    rendering the export template if one is specified, or otherwise as YAML. Returns the pending JobResult.
+
+    The QuerySet's SQL query is passed to the worker rather than the QuerySet itself, as pickling a QuerySet evaluates
+    it.
+    """
+    model = queryset.model
+
+    return JobResult.enqueue_job(
+        run_export,
+        filename,
+        ContentType.objects.get_for_model(model),
+        user,
+        model=model,
+        query=queryset.query,
+        prefetch_lookups=queryset._prefetch_related_lookups,
+        filename=filename,
+        table_class=table_class,
+        exclude_columns=list(exclude_columns or []),
+        template_pk=export_template.pk if export_template else None,
+        job_timeout=EXPORT_JOB_TIMEOUT
+    )
+
+
+def _track_progress(job_result, objects):
+    """
+    Yield each object from an iterable, recording the number of objects exported on the JobResult after each chunk.
+    """
+    for i, obj in enumerate(objects, start=1):
+        yield obj
+        if i % EXPORT_CHUNK_SIZE == 0:
+            job_result.data['exported'] = i
+            job_result.save()
+
+
+@job('default')
+def run_export(job_result, model, query, prefetch_lookups=(), filename=None, table_class=None, exclude_columns=None,
+               template_pk=None, *args, **kwargs):
+    """
+    Export a set of objects to a gzip-compressed file under MEDIA_ROOT. Output is streamed to disk as it is rendered,
+    and progress is recorded on the JobResult so that it can be polled while the export is running.
+    """
+    queryset = model._default_manager.all()
+    queryset.query = query
+    if prefetch_lookups:
+        queryset = queryset.prefetch_related(*prefetch_lookups)
+
+    job_result.status = JobResultStatusChoices.STATUS_RUNNING
+    job_result.data = {
+        'filename': filename,
+        'total': queryset.count(),
+        'exported': 0,
+        'size': None,
+    }
+    job_result.save()
+
+    path = get_export_path(job_result)
+    partial_path = f'{path}.part'
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    try:
+        if template_pk is not None:
+            export_template = ExportTemplate.objects.get(pk=template_pk)
+            output = export_template.render_stream(queryset)
+        elif table_class is not None:
+            table = table_class(queryset, user=job_result.user)
+            rows = table.iter_values(exclude_columns=exclude_columns)
+            output = stream_csv(itertools.chain([next(rows)], _track_progress(job_result, rows)))
+        else:
+            objects = _track_progress(job_result, iterate_queryset(queryset))
+            output = (f'---\n{obj.to_yaml()}' if i else obj.to_yaml() for i, obj in enumerate(objects))
+
+        with gzip.open(partial_path, 'wt', encoding='utf-8', newline='') as f:
+            for block in output:
+                f.write(block)
+        os.replace(partial_path, path)
+
+        job_result.data.update({
+            'exported': job_result.data['total'],
+            'size': os.path.getsize(path),
+        })
+        job_result.set_status(JobResultStatusChoices.STATUS_COMPLETED)
+
+    except Exception as e:
+        logger.error(f"Error during export {job_result.job_id} ({filename}): {e}")
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        job_result.data['error'] = str(e)
+        job_result.set_status(JobResultStatusChoices.STATUS_ERRORED)
+
+    job_result.save()
+
+
+def get_export_response(job_result):
+    """
+    Return the compressed output of a completed background export as a file attachment.
+    """
+    path = get_export_path(job_result)
+    if job_result.status != JobResultStatusChoices.STATUS_COMPLETED or not os.path.exists(path):
+        raise Http404("Export file not found.")
+
+    filename = (job_result.data or {}).get('filename') or str(job_result.job_id)
+
+    return FileResponse(
+        open(path, 'rb'),
+        as_attachment=True,
+        filename=f'{filename}.gz',
+        content_type='application/gzip'
+    )
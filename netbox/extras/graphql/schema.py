@@ -1,30 +1,38 @@
 import graphene
 
-from netbox.graphql.fields import ObjectField, ObjectListField
+from netbox.graphql.fields import ObjectConnectionField, ObjectField, ObjectListField
 from .types import *
 
 
 class ExtrasQuery(graphene.ObjectType):
     config_context = ObjectField(ConfigContextType)
     config_context_list = ObjectListField(ConfigContextType)
+    config_context_connection = ObjectConnectionField(ConfigContextType)
 
     custom_field = ObjectField(CustomFieldType)
     custom_field_list = ObjectListField(CustomFieldType)
+    custom_field_connection = ObjectConnectionField(CustomFieldType)
 
     custom_link = ObjectField(CustomLinkType)
     custom_link_list = ObjectListField(CustomLinkType)
+    custom_link_connection = ObjectConnectionField(CustomLinkType)
 
     export_template = ObjectField(ExportTemplateType)
     export_template_list = ObjectListField(ExportTemplateType)
+    export_template_connection = ObjectConnectionField(ExportTemplateType)
 
     image_attachment = ObjectField(ImageAttachmentType)
     image_attachment_list = ObjectListField(ImageAttachmentType)
+    image_attachment_connection = ObjectConnectionField(ImageAttachmentType)
 
     journal_entry = ObjectField(JournalEntryType)
     journal_entry_list = ObjectListField(JournalEntryType)
+    journal_entry_connection = ObjectConnectionField(JournalEntryType)
 
     tag = ObjectField(TagType)
     tag_list = ObjectListField(TagType)
+    tag_connection = ObjectConnectionField(TagType)
 
     webhook = ObjectField(WebhookType)
     webhook_list = ObjectListField(WebhookType)
+    webhook_connection = ObjectConnectionField(WebhookType)
@@ -0,0 +1,467 @@
+import csv
+import itertools
+import logging
+import os
+import uuid
+from collections import defaultdict
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet, FieldDoesNotExist, ValidationError
+from django.db import models, transaction
+from django_rq import job
+
+from netbox import thread_locals
+from utilities.constants import IMPORT_CHUNK_SIZE
+from utilities.exceptions import AbortTransaction, PermissionsViolation
+from utilities.forms import iter_csv, restrict_form_fields
+from utilities.forms.fields import CSVContentTypeField, CSVModelChoiceField
+from utilities.utils import NetBoxFakeRequest
+from .bulk import bulk_create_objects, can_bulk_create, get_defining_class, validate_unique
+from .choices import JobResultStatusChoices
+from .constants import IMPORT_JOB_TIMEOUT, IMPORT_MEDIA_DIR
+from .context_managers import change_logging
+from .models import JobResult
+
+__all__ = (
+    'BulkImporter',
+    'enqueue_import',
+    'get_import_progress',
+    'run_import',
+)
+
+logger = logging.getLogger('netbox.extras.imports')
+
+
+def _get_queryset_key(queryset):
+    """
+    Return a key identifying the set of objects matched by a QuerySet, such that the form fields of different rows
+    which share a key may be resolved using a single query.
+    """
+    if not queryset.query.where:
+        return queryset.model, None
+    try:
+        return queryset.model, str(queryset.query)
+    except EmptyResultSet:
+        return queryset.model, 'none'
+
+
+class BulkImporter:
+    """
+    Validate and create objects from rows of CSV data in chunks. For each chunk:
+
+        1. The related objects referenced by each CSVModelChoiceField are resolved using a single query per field
+           (rather than one query per row).
+        2. Each row is validated by its own instance of the model form. Uniqueness is validated for all rows at
+           once.
+        3. The new objects are inserted using bulk_create(), and their changelog records, webhooks, and search index
+           values are created in bulk.
+
+    Objects of a model which has custom save logic (without an equivalent prepare_bulk_create() method), which has
+    model-specific save signal receivers, or which is saved along with many-to-many assignments are instead validated
+    and saved one row at a time. The same applies to any chunk containing rows which reference other objects of the
+    model being imported (e.g. parent interfaces), as these may be created by earlier rows.
+
+    Processing stops at the first chunk containing invalid rows; the errors are recorded in `errors` as (row number,
+    field name, message) tuples.
+
+    :param model_form: The CSV model form used to validate each row
+    :param headers: A dictionary mapping CSV column headers to the attribute by which related objects are referenced
+    :param user: The user performing the import
+    :param save_obj: A callable for saving each validated model form (optional). If specified, objects are always
+        saved one at a time using it.
+    :param chunk_size: The number of rows to process at a time
+    """
+    def __init__(self, model_form, headers, user, save_obj=None, chunk_size=IMPORT_CHUNK_SIZE):
+        self.model_form = model_form
+        self.model = model_form._meta.model
+        self.headers = headers
+        self.user = user
+        self.save_obj = save_obj
+        self.chunk_size = chunk_size
+        self.errors = []
+
+        # Retrieve the model's custom fields once, rather than for each row
+        if hasattr(model_form, '_get_custom_fields'):
+            custom_fields = None
+
+            def _get_custom_fields(form, content_type):
+                nonlocal custom_fields
+                if custom_fields is None:
+                    custom_fields = list(model_form._get_custom_fields(form, content_type))
+                return custom_fields
+
+            self.model_form = type(model_form.__name__, (model_form,), {'_get_custom_fields': _get_custom_fields})
+
+        form = self.model_form()
+        self.self_referencing_fields = [
+            name for name, field in form.fields.items()
+            if getattr(field, 'queryset', None) is not None and field.queryset.model is self.model
+        ]
+        self.can_bulk_create = save_obj is None and self._can_bulk_create(form)
+        # Uniqueness can be validated in bulk unless the model implements its own validation
+        self.bulk_validate_unique = get_defining_class(self.model, 'validate_unique') is models.Model
+
+    def _can_bulk_create(self, form):
+        """
+        Return True if objects can be created using bulk_create() without bypassing any custom save logic.
+        """
+        if any(field.name in form.fields for field in self.model._meta.many_to_many):
+            return False
+        return can_bulk_create(self.model_form)
+
+    def run(self, records):
+        """
+        Import an iterable of records (dictionaries mapping field names to values), returning the created objects. If
+        any row fails validation, the objects created prior to the failing chunk are returned.
+        """
+        new_objs = []
+
+        for chunk in self.iter_chunks(records):
+            objs = self.import_chunk(chunk)
+            if self.errors:
+                break
+            new_objs.extend(objs)
+
+        return new_objs
+
+    def iter_chunks(self, records):
+        """
+        Yield successive chunks of records, each as a list of (row number, record) tuples.
+        """
+        records = enumerate(records, start=1)
+        while chunk := list(itertools.islice(records, self.chunk_size)):
+            yield chunk
+
+    def import_chunk(self, chunk):
+        """
+        Validate and create the objects for a chunk of (row number, record) tuples, returning the created objects.
+        Any validation errors are appended to `errors`.
+        """
+        if self.can_bulk_create and not self._has_self_references(chunk):
+            return self._import_bulk(chunk)
+        return self._import_rows(chunk)
+
+    def _has_self_references(self, chunk):
+        return any(
+            data.get(name) for _, data in chunk for name in self.self_referencing_fields
+        )
+
+    #
+    # Validation
+    #
+
+    def _get_forms(self, chunk, validate_unique=True):
+        """
+        Bind each row of the chunk to a new model form instance, and resolve the related objects referenced by each
+        form in bulk.
+        """
+        forms = []
+        for row, data in chunk:
+            form = self.model_form(data, headers=self.headers)
+            if not validate_unique:
+                # Uniqueness is instead validated for all forms at once by _validate_unique()
+                form.validate_unique = lambda: None
+            forms.append((row, form))
+
+        # Group the forms' related object fields by the objects they may reference (before applying any permission
+        # constraints, which differ for each form)
+        groups = defaultdict(list)
+        for _, form in forms:
+            for name, field in form.fields.items():
+                if not isinstance(field, CSVModelChoiceField) or isinstance(field, CSVContentTypeField):
+                    continue
+                if field.queryset.model is self.model or '__' in (field.to_field_name or ''):
+                    continue
+                value = form.data.get(name)
+                if value not in field.empty_values:
+                    groups[(name, field.to_field_name, _get_queryset_key(field.queryset))].append((form, value))
+
+        for _, form in forms:
+            restrict_form_fields(form, self.user)
+
+        for (name, to_field_name, _), values in groups.items():
+            self._resolve_objects(name, to_field_name, values)
+
+        # The related objects referenced by these fields are retrieved from their querysets, so model validation need
+        # not query for each of them again
+        for _, form in forms:
+            resolved_fields = [
+                name for name, field in form.fields.items() if getattr(field, 'resolved_objects', None) is not None
+            ]
+            if resolved_fields:
+                _exclude_from_clean_fields(form.instance, resolved_fields)
+
+        return forms
+
+    def _resolve_objects(self, name, to_field_name, values):
+        """
+        Retrieve the objects referenced by a field across multiple forms using a single query.
+        """
+        queryset = values[0][0].fields[name].queryset
+        try:
+            key_field = queryset.model._meta.get_field(to_field_name) if to_field_name else queryset.model._meta.pk
+        except FieldDoesNotExist:
+            return
+        if key_field.is_relation:
+            return
+
+        lookup_values = {}
+        for _, value in values:
+            try:
+                lookup_values[value] = key_field.to_python(value)
+            except ValidationError:
+                lookup_values[value] = None
+
+        objects = defaultdict(list)
+        for obj in queryset.filter(**{f'{key_field.name}__in': {v for v in lookup_values.values() if v is not None}}):
+            objects[getattr(obj, key_field.attname)].append(obj)
+
+        resolved_objects = {
+            value: objects.get(lookup_value, []) for value, lookup_value in lookup_values.items()
+        }
+        for form, _ in values:
+            form.fields[name].resolved_objects = resolved_objects
+
+    def _validate_unique(self, forms):
+        """
+        Validate the uniqueness of the instances of multiple valid forms, both against existing objects and amongst
+        each other, using a single query per unique constraint.
+        """
+        form_map = {id(form.instance): form for form in forms}
+        for instance, error in validate_unique((form.instance, form._get_validation_exclusions()) for form in forms):
+            form_map[id(instance)]._update_errors(error)
+
+    def _record_errors(self, row, form):
+        for field, errors in form.errors.items():
+            self.errors.append((row, field, errors[0]))
+
+    #
+    # Object creation
+    #
+
+    def _import_rows(self, chunk):
+        """
+        Validate and save each row in turn, stopping at the first invalid row.
+        """
+        new_objs = []
+
+        for row, form in self._get_forms(chunk):
+            if not form.is_valid():
+                self._record_errors(row, form)
+                break
+            new_objs.append(self.save_obj(form) if self.save_obj else form.save())
+
+        return new_objs
+
+    def _import_bulk(self, chunk):
+        """
+        Validate all rows of the chunk, and create their objects in bulk if all are valid.
+        """
+        forms = self._get_forms(chunk, validate_unique=not self.bulk_validate_unique)
+        valid_forms = [form for _, form in forms if form.is_valid()]
+        if self.bulk_validate_unique:
+            self._validate_unique(valid_forms)
+
+        for row, form in forms:
+            if form.errors:
+                self._record_errors(row, form)
+        if self.errors:
+            return []
+
+        instances = [form.instance for _, form in forms]
+        bulk_create_objects(instances)
+
+        return instances
+
+
+def _exclude_from_clean_fields(instance, fields):
+    """
+    Exclude the given fields from the field validation performed by an instance's full_clean(). Unlike the form's
+    validation exclusions, this does not affect the validation of unique constraints which include them.
+    """
+    full_clean = instance.full_clean
+
+    def _full_clean(exclude=None, validate_unique=True):
+        return full_clean(exclude=[*(exclude or []), *fields], validate_unique=validate_unique)
+
+    instance.full_clean = _full_clean
+
+
+#
+# Background imports
+#
+
+def _get_progress_key(job_result):
+    return f'import_progress:{job_result.job_id}'
+
+
+def get_import_progress(job_result):
+    """
+    Return the data of a background import, updated with its progress if it is still running. Progress is recorded in
+    the cache rather than on the JobResult, as an import performed within a single transaction cannot commit changes
+    to the JobResult until it has finished.
+    """
+    data = dict(job_result.data or {})
+    if not job_result.completed:
+        data.update(cache.get(_get_progress_key(job_result)) or {})
+    return data
+
+
+def enqueue_import(view_class, request, csv_data, atomic=True):
+    """
+    Enqueue a background job to import objects from CSV data using a BulkImportView. The data is written to a file
+    under MEDIA_ROOT for the worker to read, rather than being passed through the queue. Returns the pending JobResult.
+
+    :param view_class: The BulkImportView subclass handling the import
+    :param request: The current request
+    :param csv_data: The CSV data to import (a string or an uploaded file)
+    :param atomic: If True, roll back all changes if any row fails. Otherwise, each chunk of rows is committed as it
+        is imported.
+    """
+    model = view_class.queryset.model
+    path = os.path.join(settings.MEDIA_ROOT, IMPORT_MEDIA_DIR, f'{uuid.uuid4()}.csv')
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        if isinstance(csv_data, str):
+            f.write(csv_data.encode('utf-8'))
+        else:
+            for chunk in csv_data.chunks():
+                f.write(chunk)
+
+    # Pass only the attributes of the request needed to attribute changes
+    request = NetBoxFakeRequest({
+        'META': {},
+        'POST': {},
+        'GET': {},
+        'FILES': {},
+        'user': request.user,
+        'path': request.path,
+        'id': request.id,
+    })
+
+    return JobResult.enqueue_job(
+        run_import,
+        f'netbox_{model._meta.verbose_name_plural}',
+        ContentType.objects.get_for_model(model),
+        request.user,
+        view_class=view_class,
+        path=path,
+        request=request,
+        atomic=atomic,
+        job_timeout=IMPORT_JOB_TIMEOUT
+    )
+
+
+def _import_records(job_result, view_class, request, headers, records, atomic):
+    """
+    Import the records using the view's BulkImporter, recording progress after each chunk. Returns the number of
+    objects created (and committed).
+    """
+    importer = view_class().get_importer(request, headers)
+    queryset = view_class.queryset.restrict(request.user, 'add')
+    webhook_queue = thread_locals.webhook_queue
+    progress = {'processed': 0, 'created': 0}
+
+    def import_chunk(chunk):
+        new_objs = importer.import_chunk(chunk)
+        if importer.errors:
+            job_result.data['errors'] = [list(error) for error in importer.errors]
+            raise AbortTransaction()
+        if queryset.filter(pk__in=[obj.pk for obj in new_objs]).count() != len(new_objs):
+            raise PermissionsViolation()
+        return new_objs
+
+    def update_progress(chunk, new_objs):
+        progress['processed'] += len(chunk)
+        progress['created'] += len(new_objs)
+        cache.set(_get_progress_key(job_result), progress, IMPORT_JOB_TIMEOUT)
+
+    if atomic:
+        try:
+            with transaction.atomic():
+                for chunk in importer.iter_chunks(records):
+                    update_progress(chunk, import_chunk(chunk))
+        except Exception:
+            del webhook_queue[:]
+            raise
+        return progress['created']
+
+    for chunk in importer.iter_chunks(records):
+        queue_length = len(webhook_queue)
+        try:
+            with transaction.atomic():
+                new_objs = import_chunk(chunk)
+        except Exception:
+            # Discard only the webhooks queued for the rolled back chunk
+            del webhook_queue[queue_length:]
+            job_result.data['processed'] = progress['processed']
+            job_result.data['created'] = progress['created']
+            raise
+        update_progress(chunk, new_objs)
+        job_result.data['processed'] = progress['processed']
+        job_result.data['created'] = progress['created']
+
+    return progress['created']
+
+
+@job('default')
+def run_import(job_result, view_class, path, request, atomic=True, *args, **kwargs):
+    """
+    Import objects from a CSV file in the background. Progress is recorded in the cache as each chunk of rows is
+    processed, and any rows which fail validation are recorded on the JobResult as (row, field, message) lists.
+    """
+    job_result.status = JobResultStatusChoices.STATUS_RUNNING
+    job_result.data = {
+        'total': None,
+        'processed': 0,
+        'created': 0,
+        'atomic': atomic,
+        'errors': [],
+    }
+    job_result.save()
+
+    with change_logging(request):
+        try:
+            with open(path, encoding='utf-8', newline='') as f:
+
+                # Count the rows up front (without retaining them) to report progress
+                total = max(sum(1 for row in csv.reader(f) if row) - 1, 0)
+                job_result.data['total'] = total
+                job_result.save()
+
+                # Parse each row only as it is imported
+                f.seek(0)
+                headers, records = iter_csv(csv.reader(f))
+                created = _import_records(job_result, view_class, request, headers, records, atomic)
+
+            job_result.data.update({
+                'processed': total,
+                'created': created,
+            })
+            job_result.set_status(JobResultStatusChoices.STATUS_COMPLETED)
+
+        except AbortTransaction:
+            job_result.set_status(JobResultStatusChoices.STATUS_FAILED)
+
+        except PermissionsViolation:
+            job_result.data['error'] = "Object import failed due to object-level permissions violation"
+            job_result.set_status(JobResultStatusChoices.STATUS_FAILED)
+
+        except ValidationError as e:
+            # Malformed CSV data
+            job_result.data['error'] = '; '.join(e.messages)
+            job_result.set_status(JobResultStatusChoices.STATUS_FAILED)
+
+        except Exception as e:
+            logger.error(f"Error during import {job_result.job_id}: {e}")
+            job_result.data['error'] = str(e)
+            job_result.set_status(JobResultStatusChoices.STATUS_ERRORED)
+
+        finally:
+            cache.delete(_get_progress_key(job_result))
+            if os.path.exists(path):
+                os.remove(path)
+
+    job_result.save()
@@ -1,3 +1,4 @@
+import os
 from datetime import timedelta
 from importlib import import_module
 
@@ -9,6 +10,7 @@ from django.db import DEFAULT_DB_ALIAS
 from django.utils import timezone
 from packaging import version
 
+from extras.constants import EXPORT_MEDIA_DIR
 from extras.models import JobResult
 from extras.models import ObjectChange
 from netbox.config import Config
@@ -91,6 +93,32 @@ class Command(BaseCommand):
                 f"\tSkipping: No retention period specified (JOBRESULT_RETENTION = {config.JOBRESULT_RETENTION})"
             )
 
+        # Delete background export files whose JobResults no longer exist
+        if options['verbosity']:
+            self.stdout.write("[*] Checking for orphaned export files")
+        export_dir = os.path.join(settings.MEDIA_ROOT, EXPORT_MEDIA_DIR)
+        if os.path.isdir(export_dir):
+            job_ids = {str(job_id) for job_id in JobResult.objects.values_list('job_id', flat=True)}
+            orphaned_files = [
+                filename for filename in os.listdir(export_dir) if filename.split('.', 1)[0] not in job_ids
+            ]
+            if orphaned_files:
+                if options['verbosity']:
+                    self.stdout.write(
+                        f"\tDeleting {len(orphaned_files)} orphaned files... ",
+                        self.style.WARNING,
+                        ending=""
+                    )
+                    self.stdout.flush()
+                for filename in orphaned_files:
+                    os.remove(os.path.join(export_dir, filename))
+                if options['verbosity']:
+                    self.stdout.write("Done.", self.style.SUCCESS)
+            elif options['verbosity']:
+                self.stdout.write("\tNo orphaned files found.", self.style.SUCCESS)
+        elif options['verbosity']:
+            self.stdout.write(f"\tSkipping: Export directory not found ({export_dir})")
+
         # Check for new releases (if enabled)
         if options['verbosity']:
             self.stdout.write("[*] Checking for latest release")
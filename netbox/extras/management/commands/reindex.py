@@ -0,0 +1,71 @@
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from extras.models import CachedValue
+from extras.search import get_indexed_models, rebuild_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the global search index for the specified models"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'args', metavar='app_label.ModelName', nargs='*',
+            help='One or more specific models (each prefixed with its app_label) to reindex',
+        )
+        parser.add_argument(
+            '--lazy', action='store_true',
+            help="Reindex only models which have no cached values in the search index"
+        )
+
+    def _get_models(self, names):
+        """
+        Compile a list of models to be reindexed. If no names are specified, all models included in global search will
+        be reindexed.
+        """
+        indexed_models = get_indexed_models()
+
+        if not names:
+            return list(indexed_models)
+
+        models_by_label = {
+            model._meta.label_lower: model for model in indexed_models
+        }
+        models = []
+        for name in names:
+            try:
+                models.append(models_by_label[name.lower()])
+            except KeyError:
+                raise CommandError(f"Invalid model: {name} is not included in global search")
+
+        return models
+
+    def handle(self, *args, **options):
+
+        models = self._get_models(args)
+
+        if options['lazy']:
+            indexed_types = set(CachedValue.objects.values_list('object_type', flat=True).distinct())
+            models = [
+                model for model in models if ContentType.objects.get_for_model(model).pk not in indexed_types
+            ]
+
+        if options['verbosity']:
+            self.stdout.write(f"Reindexing {len(models)} models.")
+
+        total = 0
+        for model in models:
+            if options['verbosity']:
+                self.stdout.write(f"{model._meta.label}... ", ending='')
+                self.stdout.flush()
+
+            with transaction.atomic():
+                count = rebuild_index(model)
+            total += count
+
+            if options['verbosity']:
+                self.stdout.write(self.style.SUCCESS(f"{count} values cached"))
+
+        if options['verbosity']:
+            self.stdout.write(self.style.SUCCESS(f"Done. {total} values cached."))
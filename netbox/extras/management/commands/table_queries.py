@@ -0,0 +1,78 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, URLResolver, get_resolver
+
+from netbox.views.generic import ObjectListView
+
+
+class Command(BaseCommand):
+    help = "Report the number of database queries issued to render a page of each object list table"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'args', metavar='table', nargs='*',
+            help='One or more specific tables (by class name) to report on',
+        )
+        parser.add_argument(
+            '--per-page', type=int, default=50,
+            help="Number of rows to render for each table (default: 50)"
+        )
+        parser.add_argument(
+            '--max-queries', type=int,
+            help="Exit with an error if any table issues more than this number of queries"
+        )
+
+    def _get_list_views(self, patterns):
+        """
+        Yield each ObjectListView subclass (once) found in the given URL patterns.
+        """
+        for pattern in patterns:
+            if isinstance(pattern, URLResolver):
+                yield from self._get_list_views(pattern.url_patterns)
+            elif isinstance(pattern, URLPattern):
+                view_class = getattr(pattern.callback, 'view_class', None)
+                if view_class is not None and issubclass(view_class, ObjectListView) and view_class.table:
+                    yield view_class
+
+    def get_query_count(self, view_class, per_page):
+        """
+        Render the first page of a list view's table, returning the number of rows and the number of queries issued.
+        """
+        with CaptureQueriesContext(connection) as context:
+            table = view_class.table(view_class.queryset.all())
+            table.paginate(page=1, per_page=per_page)
+            rows = 0
+            for row in table.page.object_list:
+                for _ in row:
+                    pass
+                rows += 1
+
+        return rows, len(context.captured_queries)
+
+    def handle(self, *args, **options):
+        view_classes = []
+        for view_class in self._get_list_views(get_resolver().url_patterns):
+            if view_class not in view_classes and (not args or view_class.table.__name__ in args):
+                view_classes.append(view_class)
+
+        exceeded = []
+        for view_class in sorted(view_classes, key=lambda v: v.table.__name__):
+            table_name = view_class.table.__name__
+            try:
+                rows, queries = self.get_query_count(view_class, options['per_page'])
+            except Exception as e:
+                self.stdout.write(self.style.ERROR(f"{table_name}: {e}"))
+                continue
+
+            if options['max_queries'] is not None and queries > options['max_queries']:
+                exceeded.append(table_name)
+                style = self.style.ERROR
+            else:
+                style = self.style.SUCCESS
+            self.stdout.write(f"{table_name}: " + style(f"{queries} queries") + f" ({rows} rows)")
+
+        if exceeded:
+            raise CommandError(
+                f"{len(exceeded)} tables exceeded {options['max_queries']} queries: {', '.join(exceeded)}"
+            )
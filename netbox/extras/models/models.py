@@ -1,3 +1,4 @@
+import itertools
 import json
 import uuid
 
@@ -8,7 +9,7 @@ from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
 from django.core.validators import ValidationError
 from django.db import models
-from django.http import HttpResponse
+from django.http import StreamingHttpResponse
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.formats import date_format
@@ -24,7 +25,8 @@ from netbox.models.features import (
     CustomFieldsMixin, CustomLinksMixin, ExportTemplatesMixin, JobResultsMixin, TagsMixin, WebhooksMixin,
 )
 from utilities.querysets import RestrictedQuerySet
-from utilities.utils import render_jinja2
+from utilities.constants import EXPORT_BUFFER_SIZE
+from utilities.utils import ChunkedQuerySet, render_jinja2, render_jinja2_stream
 
 __all__ = (
     'ConfigRevision',
@@ -317,31 +319,67 @@ class ExportTemplate(ExportTemplatesMixin, WebhooksMixin, ChangeLoggedModel):
         """
         Render the contents of the template.
         """
+        return ''.join(self.render_stream(queryset))
+
+    def render_stream(self, queryset, buffer_size=EXPORT_BUFFER_SIZE):
+        """
+        Render the contents of the template, yielding the output in blocks of roughly buffer_size characters as it is
+        generated. Objects are retrieved from the queryset in chunks as the template iterates over them.
+        """
         context = {
-            'queryset': queryset
+            'queryset': ChunkedQuerySet(queryset)
         }
-        output = render_jinja2(self.template_code, context)
+        return self._buffer_output(render_jinja2_stream(self.template_code, context), buffer_size)
 
-        # Replace CRLF-style line terminators
-        output = output.replace('\r\n', '\n')
-
-        return output
+    @staticmethod
+    def _buffer_output(output, buffer_size):
+        """
+        Join the pieces of rendered output into blocks of roughly buffer_size characters, replacing any CRLF-style line
+        terminators.
+        """
+        buffer = []
+        length = 0
+        for piece in output:
+            buffer.append(piece)
+            length += len(piece)
+            if length >= buffer_size:
+                block = ''.join(buffer)
+                # Carry a trailing carriage return over to the next block, in case it begins with a line feed
+                carry = '\r' if block.endswith('\r') else ''
+                if carry:
+                    block = block[:-1]
+                yield block.replace('\r\n', '\n')
+                buffer = [carry]
+                length = len(carry)
+
+        block = ''.join(buffer)
+        if block:
+            yield block.replace('\r\n', '\n')
+
+    def get_filename(self, queryset):
+        """
+        Return the name of the file to which the rendered template is saved.
+        """
+        basename = queryset.model._meta.verbose_name_plural.replace(' ', '_')
+        extension = f'.{self.file_extension}' if self.file_extension else ''
+        return f'netbox_{basename}{extension}'
 
     def render_to_response(self, queryset):
         """
-        Render the template to an HTTP response, delivered as a named file attachment
+        Render the template to an HTTP response, delivered as a named file attachment. The response is streamed to the
+        client as it is rendered.
         """
-        output = self.render(queryset)
+        output = self.render_stream(queryset)
         mime_type = 'text/plain' if not self.mime_type else self.mime_type
 
+        # Render the first block of output before building the response, so that errors can be reported to the user
+        first_block = next(output, '')
+
         # Build the response
-        response = HttpResponse(output, content_type=mime_type)
+        response = StreamingHttpResponse(itertools.chain([first_block], output), content_type=mime_type)
 
         if self.as_attachment:
-            basename = queryset.model._meta.verbose_name_plural.replace(' ', '_')
-            extension = f'.{self.file_extension}' if self.file_extension else ''
-            filename = f'netbox_{basename}{extension}'
-            response['Content-Disposition'] = f'attachment; filename="{filename}"'
+            response['Content-Disposition'] = f'attachment; filename="{self.get_filename(queryset)}"'
 
         return response
 
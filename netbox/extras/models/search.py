@@ -0,0 +1,46 @@
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.indexes import GinIndex
+from django.db import models
+
+__all__ = (
+    'CachedValue',
+)
+
+
+class CachedValue(models.Model):
+    """
+    A normalized copy of a single searchable field value of an object, used to perform global searches via a single
+    indexed query. Lower weights indicate more significant fields (e.g. an object's name versus its comments).
+    """
+    timestamp = models.DateTimeField(
+        auto_now=True,
+        editable=False
+    )
+    object_type = models.ForeignKey(
+        to=ContentType,
+        on_delete=models.CASCADE,
+        related_name='+'
+    )
+    object_id = models.PositiveBigIntegerField()
+    object = GenericForeignKey(
+        ct_field='object_type',
+        fk_field='object_id'
+    )
+    field = models.CharField(
+        max_length=200
+    )
+    value = models.TextField()
+    weight = models.PositiveSmallIntegerField(
+        default=1000
+    )
+
+    class Meta:
+        ordering = ('weight', 'object_type', 'object_id')
+        indexes = (
+            models.Index(fields=('object_type', 'object_id'), name='extras_cachedvalue_object'),
+            GinIndex(fields=('value',), opclasses=('gin_trgm_ops',), name='extras_cachedvalue_value_trgm'),
+        )
+
+    def __str__(self):
+        return f'{self.object_type} {self.object_id}: {self.field}={self.value}'
@@ -0,0 +1,177 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Case, F, IntegerField, Min, OuterRef, Subquery, Value, When
+
+from .models import CachedValue
+
+__all__ = (
+    'cache_object',
+    'cache_objects',
+    'filter_queryset',
+    'get_indexed_models',
+    'get_matching_types',
+    'rebuild_index',
+    'remove_object',
+)
+
+# Ranking offsets applied to the weight of a cached value: exact matches rank above prefix matches, which rank above
+# all other (substring) matches
+RANK_EXACT = 0
+RANK_PREFIX = 10000
+RANK_CONTAINS = 20000
+
+_indexed_models = None
+
+
+def get_indexed_models():
+    """
+    Return a mapping of each model included in global search to the fields of that model which are indexed, each as a
+    (field name, weight) tuple. The mapping is derived from SEARCH_TYPES on first use.
+    """
+    global _indexed_models
+    if _indexed_models is None:
+        from netbox.search import SEARCH_TYPES
+        _indexed_models = {
+            search_type['queryset'].model: search_type['search_fields']
+            for search_type in SEARCH_TYPES.values()
+        }
+    return _indexed_models
+
+
+def normalize(value):
+    """
+    Normalize a field value or search term for storage in and comparison against the search index.
+    """
+    return str(value).strip().lower()
+
+
+def get_cached_values(instance, fields, object_type=None):
+    """
+    Return a list of (unsaved) CachedValues for the given fields of an object. Empty values are omitted.
+    """
+    object_type = object_type or ContentType.objects.get_for_model(instance)
+    cached_values = []
+
+    for field_name, weight in fields:
+        value = getattr(instance, field_name, None)
+        if value is None:
+            continue
+        value = normalize(value)
+        if not value:
+            continue
+        cached_values.append(CachedValue(
+            object_type=object_type,
+            object_id=instance.pk,
+            field=field_name,
+            value=value,
+            weight=weight
+        ))
+
+    return cached_values
+
+
+def cache_object(instance):
+    """
+    Replace any cached values for an object with its current values.
+    """
+    fields = get_indexed_models().get(instance._meta.model)
+    if fields is None:
+        return
+
+    object_type = ContentType.objects.get_for_model(instance)
+    CachedValue.objects.filter(object_type=object_type, object_id=instance.pk).delete()
+    CachedValue.objects.bulk_create(get_cached_values(instance, fields, object_type))
+
+
+def cache_objects(instances):
+    """
+    Replace any cached values for multiple objects of the same model with their current values, in bulk.
+    """
+    if not instances:
+        return
+    fields = get_indexed_models().get(instances[0]._meta.model)
+    if fields is None:
+        return
+
+    object_type = ContentType.objects.get_for_model(instances[0])
+    CachedValue.objects.filter(
+        object_type=object_type, object_id__in=[instance.pk for instance in instances]
+    )._raw_delete(using=CachedValue.objects.db)
+    cached_values = []
+    for instance in instances:
+        cached_values.extend(get_cached_values(instance, fields, object_type))
+    CachedValue.objects.bulk_create(cached_values)
+
+
+def remove_object(instance):
+    """
+    Delete all cached values for an object.
+    """
+    object_type = ContentType.objects.get_for_model(instance)
+    CachedValue.objects.filter(object_type=object_type, object_id=instance.pk).delete()
+
+
+def rebuild_index(model, chunk_size=1000):
+    """
+    Rebuild the search index for all objects of a model in bulk. Returns the number of values cached.
+    """
+    fields = get_indexed_models()[model]
+    object_type = ContentType.objects.get_for_model(model)
+    CachedValue.objects.filter(object_type=object_type)._raw_delete(using=CachedValue.objects.db)
+
+    count = 0
+    cached_values = []
+    queryset = model._default_manager.only('pk', *[field_name for field_name, _ in fields])
+    for instance in queryset.iterator(chunk_size=chunk_size):
+        cached_values.extend(get_cached_values(instance, fields, object_type))
+        if len(cached_values) >= chunk_size:
+            CachedValue.objects.bulk_create(cached_values)
+            count += len(cached_values)
+            cached_values = []
+    if cached_values:
+        CachedValue.objects.bulk_create(cached_values)
+        count += len(cached_values)
+
+    return count
+
+
+def get_matches(value):
+    """
+    Return all cached values matching a search term, annotated with a score for ranking (lower is better). Substring
+    matching is performed against the trigram index on CachedValue.value.
+    """
+    value = normalize(value)
+    return CachedValue.objects.filter(value__contains=value).annotate(
+        score=Case(
+            When(value=value, then=Value(RANK_EXACT)),
+            When(value__startswith=value, then=Value(RANK_PREFIX)),
+            default=Value(RANK_CONTAINS),
+            output_field=IntegerField()
+        ) + F('weight')
+    )
+
+
+def get_matching_types(value):
+    """
+    Return the IDs of all ContentTypes having at least one object which matches a search term, ordered by the score
+    of each type's best match. This is performed as a single query against the search index.
+    """
+    return list(
+        get_matches(value).values('object_type').annotate(
+            best_score=Min('score')
+        ).order_by('best_score').values_list('object_type', flat=True)
+    )
+
+
+def filter_queryset(queryset, value):
+    """
+    Filter a QuerySet to objects matching a search term, ordered by the score of each object's best match.
+    """
+    object_type = ContentType.objects.get_for_model(queryset.model)
+    matches = get_matches(value).filter(object_type=object_type)
+    best_match = matches.filter(object_id=OuterRef('pk')).order_by('score')
+
+    return queryset.filter(
+        pk__in=matches.values('object_id')
+    ).annotate(
+        search_score=Subquery(best_match.values('score')[:1])
+    ).order_by('search_score', *queryset.model._meta.ordering)
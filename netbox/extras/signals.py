@@ -2,7 +2,7 @@ import importlib
 import logging
 
 from django.contrib.contenttypes.models import ContentType
-from django.db.models.signals import m2m_changed, post_save, pre_delete
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
 from django.dispatch import receiver, Signal
 from django_prometheus.models import model_deletes, model_inserts, model_updates
 
@@ -13,6 +13,7 @@ from netbox.request_context import get_request
 from netbox.signals import post_clean
 from .choices import ObjectChangeActionChoices
 from .models import ConfigRevision, CustomField, ObjectChange
+from .search import cache_object, get_indexed_models, remove_object
 from .webhooks import enqueue_object, get_snapshots, serialize_for_webhook
 
 #
@@ -88,7 +89,8 @@ def handle_deleted_object(sender, instance, **kwargs):
     """
     Fires when an object is deleted.
     """
-    if not hasattr(instance, 'to_objectchange'):
+    # Changes for objects deleted by bulk_delete() are recorded in bulk
+    if not hasattr(instance, 'to_objectchange') or getattr(instance, '_bulk_deleted', False):
         return
 
     request = get_request()
@@ -160,6 +162,28 @@ m2m_changed.connect(handle_cf_added_obj_types, sender=CustomField.content_types.
 m2m_changed.connect(handle_cf_removed_obj_types, sender=CustomField.content_types.through)
 
 
+#
+# Search index
+#
+
+@receiver(post_save)
+def cache_search_values(sender, instance, raw=False, **kwargs):
+    """
+    Update the search index when an object included in global search is created or modified.
+    """
+    if not raw and sender in get_indexed_models():
+        cache_object(instance)
+
+
+@receiver(post_delete)
+def remove_search_values(sender, instance, **kwargs):
+    """
+    Remove an object from the search index when it is deleted.
+    """
+    if sender in get_indexed_models() and not getattr(instance, '_bulk_deleted', False):
+        remove_object(instance)
+
+
 #
 # Custom validation
 #
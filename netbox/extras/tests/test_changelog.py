@@ -1,11 +1,14 @@
 from django.contrib.contenttypes.models import ContentType
+from django.test import override_settings
 from django.urls import reverse
 from rest_framework import status
 
 from dcim.choices import SiteStatusChoices
-from dcim.models import Site
+from dcim.models import Location, Site
 from extras.choices import *
-from extras.models import CustomField, ObjectChange, Tag
+from extras.models import CachedValue, CustomField, ObjectChange, Tag
+from extras.search import cache_objects
+from extras.validators import CustomValidator
 from utilities.testing import APITestCase
 from utilities.testing.utils import create_tags, post_data
 from utilities.testing.views import ModelViewTestCase
@@ -170,6 +173,66 @@ class ChangeLogViewTest(ModelViewTestCase):
         self.assertEqual(objectchange.postchange_data['status'], form_data['status'])
         self.assertEqual(objectchange.postchange_data['description'], form_data['description'])
 
+    @override_settings(CUSTOM_VALIDATORS={'dcim.site': [CustomValidator({'slug': {'regex': r'^site-[12]$'}})]})
+    def test_bulk_update_objects_custom_validation(self):
+        sites = (
+            Site(name='Site 1', slug='site-1'),
+            Site(name='Site 2', slug='site-2'),
+            Site(name='Site 3', slug='site-3'),
+        )
+        Site.objects.bulk_create(sites)
+
+        form_data = {
+            'pk': [site.pk for site in sites],
+            '_apply': True,
+            'description': 'New description',
+        }
+
+        request = {
+            'path': self._get_url('bulk_edit'),
+            'data': post_data(form_data),
+        }
+        self.add_permissions('dcim.view_site', 'dcim.change_site')
+        response = self.client.post(**request)
+        self.assertHttpStatus(response, 200)
+
+        # Custom validation of the last site fails, so no site is updated
+        self.assertFalse(Site.objects.filter(description=form_data['description']).exists())
+        self.assertFalse(ObjectChange.objects.exists())
+
+    def test_bulk_update_custom_fields(self):
+        sites = (
+            Site(name='Site 1', slug='site-1', custom_field_data={'my_field': 'ABC', 'my_field_select': 'Bar'}),
+            Site(name='Site 2', slug='site-2', custom_field_data={'my_field': 'DEF', 'my_field_select': 'Foo'}),
+        )
+        Site.objects.bulk_create(sites)
+
+        form_data = {
+            'pk': [site.pk for site in sites],
+            '_apply': True,
+            'cf_my_field': 'GHI',
+            '_nullify': ['cf_my_field_select'],
+        }
+
+        request = {
+            'path': self._get_url('bulk_edit'),
+            'data': post_data(form_data),
+        }
+        self.add_permissions('dcim.view_site', 'dcim.change_site')
+        response = self.client.post(**request)
+        self.assertHttpStatus(response, 302)
+
+        # Custom field values are set (or nullified) on all objects
+        for site in Site.objects.filter(pk__in=form_data['pk']):
+            self.assertEqual(site.custom_field_data, {'my_field': 'GHI', 'my_field_select': None})
+
+        objectchange = ObjectChange.objects.get(
+            changed_object_type=ContentType.objects.get_for_model(Site),
+            changed_object_id=sites[1].pk
+        )
+        self.assertEqual(objectchange.prechange_data['custom_fields'], {'my_field': 'DEF', 'my_field_select': 'Foo'})
+        self.assertEqual(objectchange.postchange_data['custom_fields'], {'my_field': 'GHI', 'my_field_select': None})
+
     def test_bulk_delete_objects(self):
         sites = (
             Site(name='Site 1', slug='site-1', status=SiteStatusChoices.STATUS_ACTIVE),
@@ -203,6 +266,44 @@ class ChangeLogViewTest(ModelViewTestCase):
         self.assertEqual(objectchange.prechange_data['slug'], sites[0].slug)
         self.assertEqual(objectchange.postchange_data, None)
 
+    def test_bulk_delete_cascade(self):
+        site = Site.objects.create(name='Site 1', slug='site-1')
+        locations = (
+            Location.objects.create(name='Location 1', slug='location-1', site=site),
+            Location.objects.create(name='Location 2', slug='location-2', site=site),
+        )
+        cache_objects(locations)
+
+        form_data = {
+            'pk': [site.pk],
+            'confirm': True,
+            '_confirm': True,
+        }
+
+        request = {
+            'path': self._get_url('bulk_delete'),
+            'data': post_data(form_data),
+        }
+        self.add_permissions('dcim.delete_site')
+        response = self.client.post(**request)
+        self.assertHttpStatus(response, 302)
+        self.assertFalse(Site.objects.exists())
+        self.assertFalse(Location.objects.exists())
+
+        # Objects deleted by cascade are change-logged and removed from the search index
+        object_type = ContentType.objects.get_for_model(Location)
+        objectchanges = ObjectChange.objects.filter(changed_object_type=object_type)
+        self.assertEqual(
+            sorted(objectchanges.values_list('object_repr', 'action')),
+            [
+                ('Location 1', ObjectChangeActionChoices.ACTION_DELETE),
+                ('Location 2', ObjectChangeActionChoices.ACTION_DELETE),
+            ]
+        )
+        self.assertEqual(objectchanges[0].prechange_data['site'], site.pk)
+        self.assertIsNone(objectchanges[0].postchange_data)
+        self.assertFalse(CachedValue.objects.filter(object_type=object_type).exists())
+
 
 class ChangeLogAPITest(APITestCase):
 
@@ -0,0 +1,75 @@
+import csv
+import gzip
+import io
+import os
+import tempfile
+import uuid
+
+from django.contrib.contenttypes.models import ContentType
+from django.test import TestCase, override_settings
+
+from dcim.models import Site
+from dcim.tables import SiteTable
+from extras.choices import JobResultStatusChoices
+from extras.exports import get_export_path, run_export
+from extras.models import ExportTemplate, JobResult
+
+
+class ExportJobTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        Site.objects.bulk_create([
+            Site(name='Site 1', slug='site-1'),
+            Site(name='Site 2', slug='site-2'),
+            Site(name='Site 3', slug='site-3'),
+        ])
+
+    def setUp(self):
+        self.media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(self.media_root.cleanup)
+        self.job_result = JobResult.objects.create(
+            name='netbox_sites',
+            obj_type=ContentType.objects.get_for_model(Site),
+            job_id=uuid.uuid4()
+        )
+
+    def read_export(self):
+        with gzip.open(get_export_path(self.job_result), 'rt', encoding='utf-8') as f:
+            return f.read()
+
+    def run_export(self, **kwargs):
+        queryset = Site.objects.filter(slug__in=['site-1', 'site-2'])
+        with override_settings(MEDIA_ROOT=self.media_root.name):
+            run_export(self.job_result, model=Site, query=queryset.query, filename='netbox_sites', **kwargs)
+            self.job_result.refresh_from_db()
+            self.assertEqual(self.job_result.status, JobResultStatusChoices.STATUS_COMPLETED)
+            self.assertEqual(self.job_result.data['total'], 2)
+            self.assertEqual(self.job_result.data['size'], os.path.getsize(get_export_path(self.job_result)))
+            return self.read_export()
+
+    def test_export_csv(self):
+        output = self.run_export(table_class=SiteTable, exclude_columns=['pk', 'actions'])
+        rows = list(csv.reader(io.StringIO(output)))
+
+        self.assertEqual(len(rows), 3)
+        self.assertEqual([row[rows[0].index('Name')] for row in rows[1:]], ['Site 1', 'Site 2'])
+
+    def test_export_template(self):
+        export_template = ExportTemplate.objects.create(
+            content_type=ContentType.objects.get_for_model(Site),
+            name='Site names',
+            template_code='{% for site in queryset %}{{ site.name }}\n{% endfor %}'
+        )
+        output = self.run_export(template_pk=export_template.pk)
+
+        self.assertEqual(output, 'Site 1\nSite 2\n')
+
+    def test_export_error(self):
+        with override_settings(MEDIA_ROOT=self.media_root.name):
+            run_export(self.job_result, model=Site, query=Site.objects.all().query, template_pk=0)
+            self.job_result.refresh_from_db()
+
+            self.assertEqual(self.job_result.status, JobResultStatusChoices.STATUS_ERRORED)
+            self.assertIn('error', self.job_result.data)
+            self.assertFalse(os.path.exists(get_export_path(self.job_result)))
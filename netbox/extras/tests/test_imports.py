@@ -0,0 +1,185 @@
+import os
+import tempfile
+import uuid
+
+from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from dcim.choices import InterfaceTypeChoices
+from dcim.forms import InterfaceCSVForm, SiteCSVForm
+from dcim.models import Device, DeviceRole, DeviceType, Interface, Manufacturer, Site
+from dcim.views import SiteBulkImportView
+from extras.choices import JobResultStatusChoices
+from extras.context_managers import change_logging
+from extras.imports import BulkImporter, run_import
+from extras.models import CachedValue, JobResult, ObjectChange
+from tenancy.models import Tenant
+from utilities.constants import IMPORT_CHUNK_SIZE
+from utilities.utils import NetBoxFakeRequest
+
+
+class BulkImporterTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='testuser', is_superuser=True)
+
+        Tenant.objects.bulk_create([
+            Tenant(name='Tenant 1', slug='tenant-1'),
+            Tenant(name='Tenant 2', slug='tenant-2'),
+        ])
+
+        site = Site.objects.create(name='Site 1', slug='site-1')
+        manufacturer = Manufacturer.objects.create(name='Manufacturer 1', slug='manufacturer-1')
+        device_type = DeviceType.objects.create(manufacturer=manufacturer, model='Device Type 1', slug='device-type-1')
+        device_role = DeviceRole.objects.create(name='Device Role 1', slug='device-role-1')
+        Device.objects.create(name='Device 1', site=site, device_type=device_type, device_role=device_role)
+
+    def import_sites(self, rows):
+        headers = {'name': None, 'slug': None, 'status': None, 'tenant': None}
+        records = [dict(zip(headers, row)) for row in rows]
+        importer = BulkImporter(SiteCSVForm, headers, self.user)
+        return importer, importer.run(records)
+
+    def test_bulk_create(self):
+        rows = [
+            (f'Site {i}', f'site-{i}', 'active', f'Tenant {i % 2 + 1}') for i in range(2, 12)
+        ]
+        importer = BulkImporter(SiteCSVForm, {}, self.user)
+        self.assertTrue(importer.can_bulk_create)
+
+        with CaptureQueriesContext(connection) as context:
+            importer, new_objs = self.import_sites(rows)
+
+        # The tenants of all rows are resolved using a single query, and all sites are created using another
+        queries = [query['sql'] for query in context.captured_queries]
+        self.assertEqual(len([sql for sql in queries if sql.startswith('SELECT') and 'tenancy_tenant' in sql]), 1)
+        self.assertEqual(len([sql for sql in queries if sql.startswith('INSERT INTO "dcim_site"')]), 1)
+
+        self.assertEqual(importer.errors, [])
+        self.assertEqual(len(new_objs), 10)
+        self.assertEqual(Site.objects.get(name='Site 3').tenant.name, 'Tenant 2')
+        self.assertTrue(
+            CachedValue.objects.filter(object_type=ContentType.objects.get_for_model(Site), value='site 11').exists()
+        )
+
+    def test_errors(self):
+        importer, new_objs = self.import_sites([
+            ('Site 2', 'site-2', 'active', 'Tenant 1'),
+            ('Site 1', 'site-3', 'active', 'Tenant 1'),
+            ('Site 2', 'site-4', 'active', 'Tenant 1'),
+            ('Site 5', 'site-5', 'active', 'Tenant 3'),
+        ])
+
+        self.assertEqual(new_objs, [])
+        self.assertEqual(importer.errors, [
+            (2, 'name', 'Site with this Name already exists.'),
+            (3, 'name', 'Site with this Name already exists.'),
+            (4, 'tenant', 'Object not found.'),
+        ])
+        self.assertFalse(Site.objects.filter(slug='site-2').exists())
+
+    def test_change_logging(self):
+        request = NetBoxFakeRequest({
+            'META': {},
+            'POST': {},
+            'GET': {},
+            'FILES': {},
+            'user': self.user,
+            'path': '',
+            'id': uuid.uuid4(),
+        })
+        with change_logging(request):
+            importer, new_objs = self.import_sites([
+                ('Site 2', 'site-2', 'active', ''),
+                ('Site 3', 'site-3', 'active', ''),
+            ])
+
+        objectchanges = ObjectChange.objects.filter(request_id=request.id)
+        self.assertEqual(
+            sorted(objectchanges.values_list('object_repr', 'user_name')),
+            [('Site 2', 'testuser'), ('Site 3', 'testuser')]
+        )
+        self.assertEqual(objectchanges[0].postchange_data['status'], 'active')
+
+    def test_self_references(self):
+        headers = {'device': None, 'name': None, 'type': None, 'parent': None}
+        records = [
+            {'device': 'Device 1', 'name': 'eth0', 'type': InterfaceTypeChoices.TYPE_1GE_FIXED, 'parent': ''},
+            {'device': 'Device 1', 'name': 'eth0.1', 'type': InterfaceTypeChoices.TYPE_VIRTUAL, 'parent': 'eth0'},
+        ]
+        importer = BulkImporter(InterfaceCSVForm, headers, self.user)
+
+        # Rows referencing interfaces created by earlier rows are saved individually
+        new_objs = importer.run(records)
+
+        self.assertEqual(importer.errors, [])
+        self.assertEqual(len(new_objs), 2)
+        self.assertEqual(Interface.objects.get(name='eth0.1').parent, Interface.objects.get(name='eth0'))
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class ImportJobTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='testuser', is_superuser=True)
+
+    def setUp(self):
+        self.job_result = JobResult.objects.create(
+            name='netbox_sites',
+            obj_type=ContentType.objects.get_for_model(Site),
+            user=self.user,
+            job_id=uuid.uuid4()
+        )
+
+    def run_import(self, csv_data, atomic=True):
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False) as f:
+            f.write(csv_data)
+        request = NetBoxFakeRequest({
+            'META': {},
+            'POST': {},
+            'GET': {},
+            'FILES': {},
+            'user': self.user,
+            'path': '',
+            'id': self.job_result.job_id,
+        })
+        run_import(self.job_result, view_class=SiteBulkImportView, path=f.name, request=request, atomic=atomic)
+        self.job_result.refresh_from_db()
+
+        # The uploaded data is removed once the import has finished
+        self.assertFalse(os.path.exists(f.name))
+
+    def test_import(self):
+        self.run_import('name,slug,status\nSite 1,site-1,active\nSite 2,site-2,planned\n')
+
+        self.assertEqual(self.job_result.status, JobResultStatusChoices.STATUS_COMPLETED)
+        self.assertEqual(self.job_result.data['total'], 2)
+        self.assertEqual(self.job_result.data['created'], 2)
+        self.assertEqual(self.job_result.data['errors'], [])
+        self.assertEqual(Site.objects.get(slug='site-2').status, 'planned')
+        self.assertEqual(ObjectChange.objects.filter(request_id=self.job_result.job_id).count(), 2)
+
+    def test_import_errors(self):
+        self.run_import('name,slug,status\nSite 1,site-1,active\nSite 2,site-2,invalid\n')
+
+        self.assertEqual(self.job_result.status, JobResultStatusChoices.STATUS_FAILED)
+        self.assertEqual(self.job_result.data['errors'], [
+            [2, 'status', 'Select a valid choice. invalid is not one of the available choices.'],
+        ])
+        self.assertFalse(Site.objects.exists())
+
+    def test_import_errors_non_atomic(self):
+        rows = [f'Site {i},site-{i},active' for i in range(1, IMPORT_CHUNK_SIZE + 1)]
+        rows.append('Site X,site-x,invalid')
+        self.run_import('name,slug,status\n' + '\n'.join(rows) + '\n', atomic=False)
+
+        # Only the chunk containing the invalid row is rolled back
+        self.assertEqual(self.job_result.status, JobResultStatusChoices.STATUS_FAILED)
+        self.assertEqual(self.job_result.data['processed'], IMPORT_CHUNK_SIZE)
+        self.assertEqual(self.job_result.data['created'], IMPORT_CHUNK_SIZE)
+        self.assertEqual(Site.objects.count(), IMPORT_CHUNK_SIZE)
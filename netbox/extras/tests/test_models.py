@@ -1,7 +1,8 @@
+from django.contrib.contenttypes.models import ContentType
 from django.test import TestCase
 
 from dcim.models import Device, DeviceRole, DeviceType, Manufacturer, Platform, Region, Site, SiteGroup
-from extras.models import ConfigContext, Tag
+from extras.models import ConfigContext, ExportTemplate, Tag
 from tenancy.models import Tenant, TenantGroup
 from virtualization.models import Cluster, ClusterGroup, ClusterType, VirtualMachine
 
@@ -15,6 +16,31 @@ class TagTest(TestCase):
         self.assertEqual(tag.slug, 'testing-unicode-台灣')
 
 
+class ExportTemplateTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        Site.objects.bulk_create([
+            Site(name=f'Site {i}', slug=f'site-{i}') for i in range(1, 4)
+        ])
+
+    def setUp(self):
+        self.export_template = ExportTemplate(
+            content_type=ContentType.objects.get_for_model(Site),
+            name='Export Template 1',
+            template_code='{{ queryset|length }}\r\n{% for site in queryset %}{{ site.name }}\r\n{% endfor %}'
+        )
+
+    def test_render(self):
+        output = self.export_template.render(Site.objects.order_by('name'))
+        self.assertEqual(output, '3\nSite 1\nSite 2\nSite 3\n')
+
+    def test_render_to_response(self):
+        response = self.export_template.render_to_response(Site.objects.order_by('name'))
+        self.assertEqual(response.getvalue().decode(), '3\nSite 1\nSite 2\nSite 3\n')
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="netbox_sites"')
+
+
 class ConfigContextTest(TestCase):
     """
     These test cases deal with the weighting, ordering, and deep merge logic of config context data.
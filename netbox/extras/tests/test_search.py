@@ -0,0 +1,57 @@
+from django.contrib.contenttypes.models import ContentType
+from django.test import TestCase
+
+from dcim.models import Site
+from extras.models import CachedValue
+from extras.search import filter_queryset, get_matching_types, rebuild_index
+from tenancy.models import Tenant
+
+
+class SearchIndexTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        Site.objects.create(name='Alpha', slug='site-1', description='Primary site')
+        Site.objects.create(name='Bravo', slug='site-2', description='Alpha backup')
+        Site.objects.create(name='Charlie', slug='site-3')
+        Tenant.objects.create(name='Alpha Corp', slug='tenant-1')
+
+    def test_index_maintained(self):
+        site = Site.objects.get(name='Charlie')
+        object_type = ContentType.objects.get_for_model(Site)
+
+        self.assertEqual(
+            set(CachedValue.objects.filter(object_type=object_type, object_id=site.pk).values_list('field', 'value')),
+            {('name', 'charlie')}
+        )
+
+        site.description = 'New Description'
+        site.save()
+        self.assertEqual(
+            set(CachedValue.objects.filter(object_type=object_type, object_id=site.pk).values_list('field', 'value')),
+            {('name', 'charlie'), ('description', 'new description')}
+        )
+
+        site.delete()
+        self.assertFalse(CachedValue.objects.filter(object_type=object_type, object_id=site.pk).exists())
+
+    def test_rebuild_index(self):
+        CachedValue.objects.all().delete()
+
+        self.assertEqual(rebuild_index(Site), 5)
+        self.assertEqual(list(filter_queryset(Site.objects.all(), 'charlie')), [Site.objects.get(name='Charlie')])
+
+    def test_search_ranking(self):
+        # Matches on an object's name rank above matches on its description
+        self.assertEqual(
+            list(filter_queryset(Site.objects.all(), 'ALPHA').values_list('name', flat=True)),
+            ['Alpha', 'Bravo']
+        )
+
+        # An exact match (site "Alpha") ranks above a prefix match (tenant "Alpha Corp")
+        self.assertEqual(
+            get_matching_types('alpha'),
+            [ContentType.objects.get_for_model(Site).pk, ContentType.objects.get_for_model(Tenant).pk]
+        )
+        self.assertEqual(get_matching_types('corp'), [ContentType.objects.get_for_model(Tenant).pk])
+        self.assertEqual(get_matching_types('zulu'), [])
@@ -108,4 +108,11 @@ urlpatterns = [
     path('scripts/<str:module>.<str:name>/', views.ScriptView.as_view(), name='script'),
     path('scripts/results/<int:job_result_pk>/', views.ScriptResultView.as_view(), name='script_result'),
 
+    # Background exports
+    path('exports/<int:job_result_pk>/', views.ExportResultView.as_view(), name='export_result'),
+    path('exports/<int:job_result_pk>/download/', views.ExportDownloadView.as_view(), name='export_download'),
+
+    # Background imports
+    path('imports/<int:job_result_pk>/', views.ImportResultView.as_view(), name='import_result'),
+
 ]
@@ -15,6 +15,8 @@ from utilities.utils import copy_safe_request, count_related, get_viewname, norm
 from utilities.views import ContentTypePermissionRequiredMixin
 from . import filtersets, forms, tables
 from .choices import JobResultStatusChoices
+from .exports import get_export_response
+from .imports import get_import_progress
 from .models import *
 from .reports import get_report, get_reports, run_report
 from .scripts import get_scripts, run_script
@@ -758,3 +760,85 @@ class ScriptResultView(ContentTypePermissionRequiredMixin, GetScriptMixin, View)
             'result': result,
             'class_name': script.__class__.__name__
         })
+
+
+#
+# Background exports & imports
+#
+
+class BackgroundJobResultMixin:
+
+    def get_result(self, request, job_result_pk):
+        """
+        Return the JobResult for a background export or import. Only the user who requested the job (or a superuser)
+        may access it.
+        """
+        result = get_object_or_404(JobResult.objects.all(), pk=job_result_pk)
+        if not request.user.is_authenticated:
+            return None
+        if result.user_id != request.user.pk and not request.user.is_superuser:
+            return None
+        return result
+
+
+class ExportResultView(BackgroundJobResultMixin, View):
+    """
+    Display the progress of a background export.
+    """
+    def get(self, request, job_result_pk):
+        result = self.get_result(request, job_result_pk)
+        if result is None:
+            return HttpResponseForbidden()
+
+        # If this is an HTMX request, return only the result HTML
+        if is_htmx(request):
+            response = render(request, 'extras/htmx/export_result.html', {
+                'result': result,
+            })
+            if result.completed:
+                response.status_code = 286
+            return response
+
+        return render(request, 'extras/export_result.html', {
+            'result': result,
+            'model': result.obj_type.model_class(),
+        })
+
+
+class ExportDownloadView(BackgroundJobResultMixin, View):
+    """
+    Download the compressed output of a completed background export.
+    """
+    def get(self, request, job_result_pk):
+        result = self.get_result(request, job_result_pk)
+        if result is None:
+            return HttpResponseForbidden()
+
+        return get_export_response(result)
+
+
+class ImportResultView(BackgroundJobResultMixin, View):
+    """
+    Display the progress and outcome of a background import.
+    """
+    def get(self, request, job_result_pk):
+        result = self.get_result(request, job_result_pk)
+        if result is None:
+            return HttpResponseForbidden()
+
+        # If this is an HTMX request, return only the result HTML
+        if is_htmx(request):
+            response = render(request, 'extras/htmx/import_result.html', {
+                'result': result,
+                'data': get_import_progress(result),
+                'model': result.obj_type.model_class(),
+            })
+            if result.completed:
+                response.status_code = 286
+            return response
+
+        return render(request, 'extras/import_result.html', {
+            'result': result,
+            'data': get_import_progress(result),
+            'model': result.obj_type.model_class(),
+        })
@@ -1,51 +1,66 @@
 import graphene
 
-from netbox.graphql.fields import ObjectField, ObjectListField
+from netbox.graphql.fields import ObjectConnectionField, ObjectField, ObjectListField
 from .types import *
 
 
 class IPAMQuery(graphene.ObjectType):
     asn = ObjectField(ASNType)
     asn_list = ObjectListField(ASNType)
+    asn_connection = ObjectConnectionField(ASNType)
 
     aggregate = ObjectField(AggregateType)
     aggregate_list = ObjectListField(AggregateType)
+    aggregate_connection = ObjectConnectionField(AggregateType)
 
     ip_address = ObjectField(IPAddressType)
     ip_address_list = ObjectListField(IPAddressType)
+    ip_address_connection = ObjectConnectionField(IPAddressType)
 
     ip_range = ObjectField(IPRangeType)
     ip_range_list = ObjectListField(IPRangeType)
+    ip_range_connection = ObjectConnectionField(IPRangeType)
 
     prefix = ObjectField(PrefixType)
     prefix_list = ObjectListField(PrefixType)
+    prefix_connection = ObjectConnectionField(PrefixType)
 
     rir = ObjectField(RIRType)
     rir_list = ObjectListField(RIRType)
+    rir_connection = ObjectConnectionField(RIRType)
 
     role = ObjectField(RoleType)
     role_list = ObjectListField(RoleType)
+    role_connection = ObjectConnectionField(RoleType)
 
     route_target = ObjectField(RouteTargetType)
     route_target_list = ObjectListField(RouteTargetType)
+    route_target_connection = ObjectConnectionField(RouteTargetType)
 
     service = ObjectField(ServiceType)
     service_list = ObjectListField(ServiceType)
+    service_connection = ObjectConnectionField(ServiceType)
 
     service_template = ObjectField(ServiceTemplateType)
     service_template_list = ObjectListField(ServiceTemplateType)
+    service_template_connection = ObjectConnectionField(ServiceTemplateType)
 
     fhrp_group = ObjectField(FHRPGroupType)
     fhrp_group_list = ObjectListField(FHRPGroupType)
+    fhrp_group_connection = ObjectConnectionField(FHRPGroupType)
 
     fhrp_group_assignment = ObjectField(FHRPGroupAssignmentType)
     fhrp_group_assignment_list = ObjectListField(FHRPGroupAssignmentType)
+    fhrp_group_assignment_connection = ObjectConnectionField(FHRPGroupAssignmentType)
 
     vlan = ObjectField(VLANType)
     vlan_list = ObjectListField(VLANType)
+    vlan_connection = ObjectConnectionField(VLANType)
 
     vlan_group = ObjectField(VLANGroupType)
     vlan_group_list = ObjectListField(VLANGroupType)
+    vlan_group_connection = ObjectConnectionField(VLANGroupType)
 
     vrf = ObjectField(VRFType)
     vrf_list = ObjectListField(VRFType)
+    vrf_connection = ObjectConnectionField(VRFType)
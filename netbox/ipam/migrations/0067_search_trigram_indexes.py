@@ -0,0 +1,23 @@
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ipam', '0066_alter_service_ports_alter_servicetemplate_ports'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='ipaddress',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('dns_name'), name='gin_trgm_ops'), name='ipam_ipaddress_dns_name_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='ipaddress',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('description'), name='gin_trgm_ops'), name='ipam_ipaddress_descr_trgm'),
+        ),
+    ]
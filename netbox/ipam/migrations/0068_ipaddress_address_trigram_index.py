@@ -0,0 +1,19 @@
+# Generated by Django 4.0.6 on 2026-10-19 00:51
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+import django.db.models.expressions
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ipam', '0067_search_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ipaddress',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.expressions.Func('address', function='TEXT'), name='gin_trgm_ops'), name='ipam_ipaddress_address_trgm'),
+        ),
+    ]
@@ -17,6 +17,7 @@ from ipam.managers import IPAddressManager
 from ipam.querysets import PrefixQuerySet
 from ipam.validators import DNSValidator
 from netbox.config import get_config
+from utilities.indexes import text_trigram_index, trigram_index
 from virtualization.models import VirtualMachine
 
 
@@ -842,6 +843,11 @@ class IPAddress(NetBoxModel):
 
     class Meta:
         ordering = ('address', 'pk')  # address may be non-unique
+        indexes = (
+            trigram_index('dns_name', 'ipam_ipaddress_dns_name_trgm'),
+            trigram_index('description', 'ipam_ipaddress_descr_trgm'),
+            text_trigram_index('address', 'ipam_ipaddress_address_trgm'),
+        )
         verbose_name = 'IP address'
         verbose_name_plural = 'IP addresses'
 
@@ -348,7 +348,53 @@ class PrefixTestCase(ViewTestCases.PrimaryObjectViewTestCase):
         self.assertEqual(prefixes[0].get_child_prefixes().count(), 3)
 
         url = reverse('ipam:prefix_prefixes', kwargs={'pk': prefixes[0].pk})
-        self.assertHttpStatus(self.client.get(url), 200)
+        response = self.client.get(url)
+        self.assertHttpStatus(response, 200)
+
+        # Available prefixes are interleaved with assigned prefixes
+        table = response.context['table']
+        self.assertEqual(table.objects_count, 3)
+        self.assertEqual(
+            [str(row.record.prefix) for row in table.page.object_list][:5],
+            ['192.168.0.0/24', '192.168.1.0/24', '192.168.2.0/24', '192.168.3.0/24', '192.168.4.0/22']
+        )
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=['*'])
+    def test_prefix_prefixes_paginated(self):
+        parent = Prefix.objects.create(prefix=IPNetwork('10.0.0.0/16'))
+        Prefix.objects.bulk_create([
+            Prefix(prefix=IPNetwork(prefix)) for prefix in (
+                '10.0.0.0/20', '10.0.1.0/24', '10.0.32.0/24', '10.0.33.0/24', '10.0.34.0/24', '10.0.35.0/24',
+                '10.0.128.0/24',
+            )
+        ])
+
+        # Available prefixes are determined for each page, following all assigned prefixes on previous pages
+        url = reverse('ipam:prefix_prefixes', kwargs={'pk': parent.pk})
+        response = self.client.get(f'{url}?per_page=1&page=2')
+        self.assertHttpStatus(response, 200)
+        table = response.context['table']
+        self.assertEqual(table.objects_count, 7)
+        self.assertEqual([(str(row.record.prefix), row.record.pk is None) for row in table.page.object_list], [
+            ('10.0.1.0/24', False),
+            ('10.0.16.0/20', True),
+            ('10.0.32.0/24', False),
+            ('10.0.33.0/24', False),
+            ('10.0.34.0/24', False),
+            ('10.0.35.0/24', False),
+            ('10.0.36.0/22', True),
+            ('10.0.40.0/21', True),
+            ('10.0.48.0/20', True),
+            ('10.0.64.0/18', True),
+            ('10.0.128.0/24', False),
+            ('10.0.129.0/24', True),
+            ('10.0.130.0/23', True),
+            ('10.0.132.0/22', True),
+            ('10.0.136.0/21', True),
+            ('10.0.144.0/20', True),
+            ('10.0.160.0/19', True),
+            ('10.0.192.0/18', True),
+        ])
 
     @override_settings(EXEMPT_VIEW_PERMISSIONS=['*'])
     def test_prefix_ipranges(self):
@@ -376,7 +422,47 @@ class PrefixTestCase(ViewTestCases.PrimaryObjectViewTestCase):
         self.assertEqual(prefix.get_child_ips().count(), 3)
 
         url = reverse('ipam:prefix_ipaddresses', kwargs={'pk': prefix.pk})
-        self.assertHttpStatus(self.client.get(url), 200)
+        response = self.client.get(url)
+        self.assertHttpStatus(response, 200)
+
+        # Available IPs follow the assigned IPs
+        table = response.context['table']
+        self.assertEqual(table.objects_count, 3)
+        self.assertEqual(
+            [row.record for row in table.page.object_list][3],
+            (65531, '192.168.0.4/16')
+        )
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=['*'])
+    def test_prefix_ipaddresses_paginated(self):
+        prefix = Prefix.objects.create(prefix=IPNetwork('10.0.0.0/24'))
+        IPAddress.objects.bulk_create([
+            IPAddress(address=IPNetwork(f'10.0.0.{i}/24')) for i in (1, 2, 4, 5, 6, 7, 10)
+        ])
+        url = reverse('ipam:prefix_ipaddresses', kwargs={'pk': prefix.pk})
+
+        # Available IPs are determined for each page, following the last assigned IP on the previous page
+        response = self.client.get(f'{url}?per_page=1&page=1')
+        table = response.context['table']
+        self.assertEqual(table.objects_count, 7)
+        self.assertEqual([str(row.record.address) for row in table.page.object_list], ['10.0.0.1/24'])
+
+        response = self.client.get(f'{url}?per_page=1&page=2')
+        table = response.context['table']
+        self.assertEqual(
+            [row.record if type(row.record) is tuple else str(row.record.address) for row in table.page.object_list],
+            [
+                '10.0.0.2/24',
+                (1, '10.0.0.3/24'),
+                '10.0.0.4/24',
+                '10.0.0.5/24',
+                '10.0.0.6/24',
+                '10.0.0.7/24',
+                (2, '10.0.0.8/24'),
+                '10.0.0.10/24',
+                (244, '10.0.0.11/24'),
+            ]
+        )
 
 
 class IPRangeTestCase(ViewTestCases.PrimaryObjectViewTestCase):
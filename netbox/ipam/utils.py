@@ -1,47 +1,79 @@
 import netaddr
+from django.db.models import F, Func, Max
 
+from netbox.tables import PlaceholderTableData
 from .constants import *
+from .fields import IPNetworkField
 from .models import Prefix, VLAN
 
 
 def add_requested_prefixes(parent, prefix_list, show_available=True, show_assigned=True):
     """
-    Return a list of requested prefixes using show_available, show_assigned filters. If available prefixes are
-    requested, create fake Prefix objects for all unallocated space within a prefix.
+    Return table data for the requested prefixes using show_available, show_assigned filters. If available prefixes
+    are requested, create fake Prefix objects for all unallocated space within a prefix. When assigned prefixes are
+    also shown, the available prefixes are determined only among the assigned prefixes displayed on each page of the
+    table.
 
     :param parent: Parent Prefix instance
-    :param prefix_list: Child prefixes list
+    :param prefix_list: Child prefixes QuerySet
     :param show_available: Include available prefixes.
     :param show_assigned: Show assigned prefixes.
     """
-    child_prefixes = []
-
-    # Add available prefixes to the table if requested
-    if prefix_list and show_available:
-
-        # Find all unallocated space, add fake Prefix objects to child_prefixes.
-        available_prefixes = netaddr.IPSet(parent) ^ netaddr.IPSet([p.prefix for p in prefix_list])
-        available_prefixes = [Prefix(prefix=p, status=None) for p in available_prefixes.iter_cidrs()]
-        child_prefixes = child_prefixes + available_prefixes
-
-    # Add assigned prefixes to the table if requested
-    if prefix_list and show_assigned:
-        child_prefixes = child_prefixes + list(prefix_list)
+    prefix_list = prefix_list.order_by('prefix', F('vrf').asc(nulls_first=True), 'pk')
+
+    if not show_available:
+        return prefix_list if show_assigned else []
+
+    # Show only available prefixes (if there are any assigned prefixes)
+    if not show_assigned:
+        child_prefixes = list(prefix_list.values_list('prefix', flat=True))
+        if not child_prefixes:
+            return []
+        available_prefixes = netaddr.IPSet(parent) ^ netaddr.IPSet(child_prefixes)
+        return [Prefix(prefix=prefix, status=None) for prefix in available_prefixes.iter_cidrs()]
+
+    def get_available_prefixes(first, last):
+        first = netaddr.IPAddress(first, parent.version)
+        last = netaddr.IPAddress(last, parent.version)
+        return [Prefix(prefix=prefix, status=None) for prefix in netaddr.iprange_to_cidrs(first, last)]
+
+    def get_placeholders(start, prefixes, end):
+        # Find the first address following all preceding prefixes (which may contain one another)
+        if start:
+            last_broadcast = prefix_list[:start].aggregate(
+                last=Max(Func('prefix', function='BROADCAST', output_field=IPNetworkField()))
+            )['last']
+            next_available = last_broadcast.ip.value + 1
+        else:
+            next_available = parent.first
+
+        # Insert fake Prefix objects for any unallocated space ahead of each assigned prefix
+        placeholders = []
+        for i, prefix in enumerate(prefixes):
+            if prefix.prefix.first > next_available:
+                placeholders.extend(
+                    (i, available) for available in get_available_prefixes(next_available, prefix.prefix.first - 1)
+                )
+            next_available = max(next_available, prefix.prefix.last + 1)
+
+        # Include any remaining unallocated space
+        if end and (start or prefixes) and next_available <= parent.last:
+            placeholders.extend(
+                (len(prefixes), available) for available in get_available_prefixes(next_available, parent.last)
+            )
 
-    # Sort child prefixes after additions
-    child_prefixes.sort(key=lambda p: p.prefix)
+        return placeholders
 
-    return child_prefixes
+    return PlaceholderTableData(prefix_list, get_placeholders)
 
 
 def add_available_ipaddresses(prefix, ipaddress_list, is_pool=False):
     """
     Annotate ranges of available IP addresses within a given prefix. If is_pool is True, the first and last IP will be
-    considered usable (regardless of mask length).
+    considered usable (regardless of mask length). Available ranges are determined only among the IP addresses
+    displayed on each page of the table.
     """
-
-    output = []
-    prev_ip = None
+    ipaddress_list = ipaddress_list.order_by('address', 'pk')
 
     # Ignore the network and broadcast addresses for non-pool IPv4 prefixes larger than /31.
     if prefix.version == 4 and prefix.prefixlen < 31 and not is_pool:
@@ -51,35 +83,44 @@ def add_available_ipaddresses(prefix, ipaddress_list, is_pool=False):
         first_ip_in_prefix = netaddr.IPAddress(prefix.first)
         last_ip_in_prefix = netaddr.IPAddress(prefix.last)
 
-    if not ipaddress_list:
-        return [(
-            int(last_ip_in_prefix - first_ip_in_prefix + 1),
-            '{}/{}'.format(first_ip_in_prefix, prefix.prefixlen)
-        )]
-
-    # Account for any available IPs before the first real IP
-    if ipaddress_list[0].address.ip > first_ip_in_prefix:
-        skipped_count = int(ipaddress_list[0].address.ip - first_ip_in_prefix)
-        first_skipped = '{}/{}'.format(first_ip_in_prefix, prefix.prefixlen)
-        output.append((skipped_count, first_skipped))
-
-    # Iterate through existing IPs and annotate free ranges
-    for ip in ipaddress_list:
-        if prev_ip:
-            diff = int(ip.address.ip - prev_ip.address.ip)
-            if diff > 1:
-                first_skipped = '{}/{}'.format(prev_ip.address.ip + 1, prefix.prefixlen)
-                output.append((diff - 1, first_skipped))
-        output.append(ip)
-        prev_ip = ip
-
-    # Include any remaining available IPs
-    if prev_ip.address.ip < last_ip_in_prefix:
-        skipped_count = int(last_ip_in_prefix - prev_ip.address.ip)
-        first_skipped = '{}/{}'.format(prev_ip.address.ip + 1, prefix.prefixlen)
-        output.append((skipped_count, first_skipped))
-
-    return output
+    def get_placeholders(start, ipaddresses, end):
+        placeholders = []
+        prev_ip = ipaddress_list.values_list('address', flat=True)[start - 1].ip if start else None
+
+        # Iterate through existing IPs and annotate free ranges
+        for i, ipaddress in enumerate(ipaddresses):
+            ip = ipaddress.address.ip
+            if prev_ip is None:
+                # Account for any available IPs before the first real IP
+                if ip > first_ip_in_prefix:
+                    skipped_count = int(ip - first_ip_in_prefix)
+                    first_skipped = '{}/{}'.format(first_ip_in_prefix, prefix.prefixlen)
+                    placeholders.append((i, (skipped_count, first_skipped)))
+            else:
+                diff = int(ip - prev_ip)
+                if diff > 1:
+                    first_skipped = '{}/{}'.format(prev_ip + 1, prefix.prefixlen)
+                    placeholders.append((i, (diff - 1, first_skipped)))
+            prev_ip = ip
+
+        if not end:
+            return placeholders
+
+        if prev_ip is None:
+            placeholders.append((0, (
+                int(last_ip_in_prefix - first_ip_in_prefix + 1),
+                '{}/{}'.format(first_ip_in_prefix, prefix.prefixlen)
+            )))
+
+        # Include any remaining available IPs
+        elif prev_ip < last_ip_in_prefix:
+            skipped_count = int(last_ip_in_prefix - prev_ip)
+            first_skipped = '{}/{}'.format(prev_ip + 1, prefix.prefixlen)
+            placeholders.append((len(ipaddresses), (skipped_count, first_skipped)))
+
+        return placeholders
+
+    return PlaceholderTableData(ipaddress_list, get_placeholders)
 
 
 def add_available_vlans(vlans, vlan_group=None):
@@ -5,13 +5,18 @@ from django.core.exceptions import ObjectDoesNotExist, PermissionDenied
 from django.db import transaction
 from django.db.models import ProtectedError
 from django.shortcuts import get_object_or_404
+from django_rq.queues import get_connection
+from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
+from rq import Worker
 
-from extras.models import ExportTemplate
+from extras.exports import enqueue_export
+from extras.models import ExportTemplate, JobResult
 from netbox.api.exceptions import SerializerNotFound
 from netbox.constants import NESTED_SERIALIZER_PREFIX
 from utilities.api import get_serializer_for_model
+from utilities.exceptions import RQWorkerNotRunningException
 from .mixins import *
 
 __all__ = (
@@ -135,6 +140,15 @@ class NetBoxModelViewSet(BulkUpdateModelMixin, BulkDestroyModelMixin, ObjectVali
             content_type = ContentType.objects.get_for_model(self.get_serializer_class().Meta.model)
             et = get_object_or_404(ExportTemplate, content_type=content_type, name=request.GET['export'])
             queryset = self.filter_queryset(self.get_queryset())
+
+            # Render the template in a background job and return the pending JobResult
+            if request.GET.get('background') and request.user.is_authenticated:
+                if not Worker.count(get_connection('default')):
+                    raise RQWorkerNotRunningException()
+                job_result = enqueue_export(queryset, request.user, et.get_filename(queryset), export_template=et)
+                serializer = get_serializer_for_model(JobResult)(job_result, context={'request': request})
+                return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
+
             return et.render_to_response(queryset)
 
         return super().list(request, *args, **kwargs)
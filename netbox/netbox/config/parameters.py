@@ -134,6 +134,22 @@ PARAMS = (
         field=forms.IntegerField
     ),
 
+    # Search
+    ConfigParam(
+        name='SEARCH_MAX_WORKERS',
+        label='Search workers',
+        default=4,
+        description="Maximum number of object types to query concurrently during a global search",
+        field=forms.IntegerField
+    ),
+    ConfigParam(
+        name='SEARCH_TIMEOUT',
+        label='Search timeout',
+        default=5,
+        description="Time limit (in seconds) for retrieving the search results of each object type",
+        field=forms.IntegerField
+    ),
+
     # Validation
     ConfigParam(
         name='CUSTOM_VALIDATORS',
@@ -205,6 +221,27 @@ PARAMS = (
         description="Enable the GraphQL API",
         field=forms.BooleanField
     ),
+    ConfigParam(
+        name='GRAPHQL_MAX_QUERY_COST',
+        label='GraphQL maximum query cost',
+        default=100000,
+        description="Maximum estimated number of objects a GraphQL query may return (set to zero for unlimited)",
+        field=forms.IntegerField
+    ),
+    ConfigParam(
+        name='GRAPHQL_MAX_QUERY_DEPTH',
+        label='GraphQL maximum query depth',
+        default=10,
+        description="Maximum nesting depth of a GraphQL query (set to zero for unlimited)",
+        field=forms.IntegerField
+    ),
+    ConfigParam(
+        name='HOME_STATS_TIMEOUT',
+        label='Home page statistics timeout',
+        default=60,
+        description="Seconds for which home page object counts are cached (set to zero to disable caching)",
+        field=forms.IntegerField
+    ),
     ConfigParam(
         name='CHANGELOG_RETENTION',
         label='Changelog retention',
@@ -3,3 +3,6 @@ NESTED_SERIALIZER_PREFIX = 'Nested'
 
 # Max results per object type
 SEARCH_MAX_RESULTS = 15
+
+# Time (in seconds) for which expired home page statistics may still be served while they are being refreshed
+HOME_STATS_CACHE_TIMEOUT = 3600
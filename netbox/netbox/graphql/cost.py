@@ -0,0 +1,316 @@
+import json
+import logging
+import math
+
+from django.core.cache import cache
+from django.db import connection
+from django.db.utils import DatabaseError
+from graphene.relay import Connection
+from graphql.error import GraphQLError
+from graphql.language import ast
+from graphql.type.definition import GraphQLList, GraphQLNonNull
+from graphql.utils.value_from_ast import value_from_ast
+from prometheus_client import Counter, Histogram
+
+from netbox.config import get_config
+from .utils import get_page_limit
+
+__all__ = (
+    'QueryCostError',
+    'estimate_query_cost',
+    'get_table_rows',
+)
+
+TABLE_ROWS_CACHE_KEY = 'graphql_table_rows'
+TABLE_ROWS_CACHE_TIMEOUT = 300
+
+logger = logging.getLogger('netbox.graphql.cost')
+
+QUERY_COST = Histogram(
+    'netbox_graphql_query_cost',
+    'Estimated number of objects returned by each GraphQL query',
+    buckets=(10, 100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000, float('inf'))
+)
+QUERIES_REJECTED = Counter(
+    'netbox_graphql_queries_rejected_total',
+    'GraphQL queries rejected for exceeding the configured cost or depth limits',
+    ['reason']
+)
+
+
+class QueryCostError(GraphQLError):
+    """
+    Raised when a GraphQL query exceeds the maximum permitted cost or depth.
+    """
+    pass
+
+
+def get_table_rows():
+    """
+    Return a mapping of database table names to the estimated number of rows in each, as recorded in the PostgreSQL
+    planner statistics. Results are cached briefly to avoid querying pg_class on every request.
+    """
+    table_rows = cache.get(TABLE_ROWS_CACHE_KEY)
+    if table_rows is None:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT relname, reltuples::bigint FROM pg_class "
+                "WHERE relkind IN ('r', 'p') AND pg_table_is_visible(oid)"
+            )
+            table_rows = dict(cursor.fetchall())
+        cache.set(TABLE_ROWS_CACHE_KEY, table_rows, TABLE_ROWS_CACHE_TIMEOUT)
+    return table_rows
+
+
+def _unwrap_type(graphql_type):
+    """
+    Strip any NonNull/List wrappers from a GraphQL type. Returns the named type and a boolean indicating whether the
+    type represents a list.
+    """
+    is_list = False
+    while isinstance(graphql_type, (GraphQLNonNull, GraphQLList)):
+        if isinstance(graphql_type, GraphQLList):
+            is_list = True
+        graphql_type = graphql_type.of_type
+    return graphql_type, is_list
+
+
+def _get_model(graphql_type):
+    """
+    Return the Django model represented by a GraphQL object type, if any.
+    """
+    graphene_type = getattr(graphql_type, 'graphene_type', None)
+    meta = getattr(graphene_type, '_meta', None)
+    return getattr(meta, 'model', None)
+
+
+def _get_connection_node(graphql_type):
+    """
+    Return the node type of a GraphQL connection type, if applicable.
+    """
+    graphene_type = getattr(graphql_type, 'graphene_type', None)
+    if isinstance(graphene_type, type) and issubclass(graphene_type, Connection):
+        return graphene_type._meta.node
+    return None
+
+
+class QueryCostAnalyzer:
+    """
+    Statically estimate the cost of a GraphQL query prior to its execution. The cost of a query is the estimated number
+    of objects it will return, derived from PostgreSQL's table statistics: top-level list fields are estimated by the
+    query planner (taking into account any filters), and nested list fields are assumed to return the average number of
+    related objects per parent.
+    """
+    def __init__(self, schema, document_ast, variables=None, operation_name=None, request=None):
+        self.schema = schema
+        self.document_ast = document_ast
+        self.variables = variables or {}
+        self.operation_name = operation_name
+        self.request = request
+        self.max_depth = 0
+
+        self.fragments = {
+            definition.name.value: definition
+            for definition in document_ast.definitions if isinstance(definition, ast.FragmentDefinition)
+        }
+        # Fragments currently being expanded, to guard against cycles (which are reported during validation)
+        self._visiting_fragments = set()
+        self._table_rows = None
+
+    @property
+    def table_rows(self):
+        if self._table_rows is None:
+            self._table_rows = get_table_rows()
+        return self._table_rows
+
+    def get_operation(self):
+        """
+        Return the operation to be executed. Returns None if the operation cannot be determined (this will be reported
+        as an error during validation).
+        """
+        operations = [
+            definition for definition in self.document_ast.definitions
+            if isinstance(definition, ast.OperationDefinition)
+        ]
+        if self.operation_name:
+            for operation in operations:
+                if operation.name and operation.name.value == self.operation_name:
+                    return operation
+            return None
+        if len(operations) == 1:
+            return operations[0]
+        return None
+
+    def get_model_rows(self, model):
+        """
+        Return the estimated number of rows in a model's database table.
+        """
+        rows = self.table_rows.get(model._meta.db_table)
+        if rows is None or rows < 0:
+            # The table has not yet been analyzed (PostgreSQL 14+ reports -1)
+            rows = model._default_manager.count()
+        return rows
+
+    def get_filtered_rows(self, model, graphene_type, filters):
+        """
+        Ask the query planner to estimate the number of rows matched by a filtered list query.
+        """
+        filterset_class = getattr(graphene_type._meta, 'filterset_class', None)
+        if filterset_class is None:
+            return self.get_model_rows(model)
+
+        queryset = model._default_manager.all()
+        filterset = filterset_class(data=filters, queryset=queryset, request=self.request)
+        try:
+            plan = json.loads(filterset.qs.explain(format='json'))
+            return int(plan[0]['Plan']['Plan Rows'])
+        except (DatabaseError, KeyError, IndexError, TypeError, ValueError) as e:
+            logger.debug(f"Unable to estimate rows for {model._meta.label}: {e}")
+            return self.get_model_rows(model)
+
+    def get_arguments(self, field_node, field_def):
+        """
+        Resolve the literal or variable values of the arguments passed to a field.
+        """
+        arguments = {}
+        for argument in field_node.arguments or []:
+            name = argument.name.value
+            arg_def = field_def.args.get(name)
+            if arg_def is None:
+                continue
+            value = value_from_ast(argument.value, arg_def.type, self.variables)
+            if value is not None:
+                arguments[name] = value
+        return arguments
+
+    def get_top_level_rows(self, model, graphene_type, arguments, limit=None):
+        """
+        Estimate the number of objects returned by a top-level list or connection field.
+        """
+        if arguments:
+            rows = self.get_filtered_rows(model, graphene_type, arguments)
+        else:
+            rows = self.get_model_rows(model)
+        if limit:
+            return min(rows, limit)
+        return rows
+
+    def estimate_field_rows(self, field_node, field_def, graphql_type, parent_type, is_list):
+        """
+        Estimate the number of objects returned by a single field for each instance of its parent.
+        """
+        # Connection fields return a single page of objects
+        node_type = _get_connection_node(graphql_type)
+        if node_type is not None:
+            arguments = self.get_arguments(field_node, field_def)
+            first = max(arguments.pop('first', 0) or 0, 0)
+            arguments.pop('after', None)
+            limit = get_page_limit(first or None, default=get_config().PAGINATE_COUNT)
+            return self.get_top_level_rows(node_type._meta.model, node_type, arguments, limit)
+
+        if not is_list:
+            return 1
+
+        model = _get_model(graphql_type)
+        if model is None:
+            return 1
+
+        parent_model = _get_model(parent_type)
+        if parent_model is None:
+            # Top-level list fields
+            arguments = self.get_arguments(field_node, field_def)
+            limit = max(arguments.pop('limit', 0) or 0, 0)
+            arguments.pop('offset', None)
+            limit = get_page_limit(limit) if limit else None
+            return self.get_top_level_rows(model, graphql_type.graphene_type, arguments, limit)
+
+        # Nested list fields are assumed to return the average number of related objects per parent
+        parent_rows = self.get_model_rows(parent_model)
+        return self.get_model_rows(model) / max(parent_rows, 1)
+
+    def get_selection_cost(self, selection_set, parent_type, multiplier, depth):
+        """
+        Recursively calculate the cost of a selection set, where multiplier is the estimated number of instances of the
+        parent type.
+        """
+        if selection_set is None:
+            return 0
+
+        cost = 0
+        for selection in selection_set.selections:
+
+            if isinstance(selection, ast.FragmentSpread):
+                fragment_name = selection.name.value
+                fragment = self.fragments.get(fragment_name)
+                if fragment is not None and fragment_name not in self._visiting_fragments:
+                    fragment_type = self.schema.get_type(fragment.type_condition.name.value) or parent_type
+                    self._visiting_fragments.add(fragment_name)
+                    try:
+                        cost += self.get_selection_cost(fragment.selection_set, fragment_type, multiplier, depth)
+                    finally:
+                        self._visiting_fragments.discard(fragment_name)
+                continue
+
+            if isinstance(selection, ast.InlineFragment):
+                fragment_type = parent_type
+                if selection.type_condition is not None:
+                    fragment_type = self.schema.get_type(selection.type_condition.name.value) or parent_type
+                cost += self.get_selection_cost(selection.selection_set, fragment_type, multiplier, depth)
+                continue
+
+            # Ignore introspection fields and scalar fields (which are fetched along with their parent object)
+            field_name = selection.name.value
+            if field_name.startswith('__') or selection.selection_set is None:
+                continue
+            field_def = getattr(parent_type, 'fields', {}).get(field_name)
+            if field_def is None:
+                continue
+
+            graphql_type, is_list = _unwrap_type(field_def.type)
+            count = math.ceil(
+                multiplier * self.estimate_field_rows(selection, field_def, graphql_type, parent_type, is_list)
+            )
+
+            # Only objects count toward the cost and depth of a query (not wrappers such as connections and edges)
+            if _get_model(graphql_type) is not None:
+                self.max_depth = max(self.max_depth, depth)
+                cost += count + self.get_selection_cost(selection.selection_set, graphql_type, count, depth + 1)
+            else:
+                cost += self.get_selection_cost(selection.selection_set, graphql_type, count, depth)
+
+        return cost
+
+    def analyze(self):
+        """
+        Return the estimated cost of the query.
+        """
+        operation = self.get_operation()
+        if operation is None or operation.operation != 'query':
+            return 0
+        return self.get_selection_cost(operation.selection_set, self.schema.get_query_type(), 1, 1)
+
+
+def estimate_query_cost(schema, document_ast, variables=None, operation_name=None, request=None, max_cost=None,
+                        max_depth=None):
+    """
+    Estimate the cost of a GraphQL query, raising QueryCostError if it exceeds either the maximum cost or maximum depth
+    specified. Returns the estimated cost.
+    """
+    analyzer = QueryCostAnalyzer(schema, document_ast, variables, operation_name, request)
+    cost = analyzer.analyze()
+    QUERY_COST.observe(cost)
+
+    if max_depth and analyzer.max_depth > max_depth:
+        QUERIES_REJECTED.labels(reason='depth').inc()
+        raise QueryCostError(
+            f"Query depth ({analyzer.max_depth}) exceeds the maximum permitted depth of {max_depth}. Reduce the "
+            f"nesting of the query."
+        )
+    if max_cost and cost > max_cost:
+        QUERIES_REJECTED.labels(reason='cost').inc()
+        raise QueryCostError(
+            f"Query cost (an estimated {cost:,} objects) exceeds the maximum permitted cost of {max_cost:,}. Apply "
+            f"filters or reduce the nesting of the query to narrow its results."
+        )
+
+    return cost
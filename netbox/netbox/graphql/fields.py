@@ -1,15 +1,76 @@
-from functools import partial
+import base64
+from functools import lru_cache, partial
 
 import graphene
+from graphene.relay import PageInfo
 from graphene_django import DjangoListField
+from graphql.error import GraphQLError
 
-from .utils import get_graphene_type
+from netbox.config import get_config
+from .utils import get_graphene_type, get_page_limit
 
 __all__ = (
+    'ObjectConnection',
+    'ObjectConnectionField',
     'ObjectField',
     'ObjectListField',
 )
 
+CURSOR_PREFIX = 'pk:'
+
+
+@lru_cache(maxsize=None)
+def _get_filterset_arguments(filterset_class):
+    """
+    Build a GraphQL argument for each filter of a FilterSet. Arguments are cached so that the list and connection fields
+    for an object type can share them.
+    """
+    filter_kwargs = {}
+    for filter_name, filter_field in filterset_class.get_filters().items():
+        field_type = get_graphene_type(type(filter_field))
+        filter_kwargs[filter_name] = graphene.Argument(field_type)
+
+    return filter_kwargs
+
+
+def get_filter_arguments(django_object_type):
+    """
+    Return a dictionary of GraphQL arguments representing each filter of the object type's FilterSet, if any.
+    """
+    filterset_class = getattr(django_object_type._meta, 'filterset_class', None)
+    if filterset_class:
+        return dict(_get_filterset_arguments(filterset_class))
+
+    return {}
+
+
+def get_filtered_queryset(django_object_type, default_manager, info, args):
+    """
+    Return the restricted QuerySet for an object type, filtered by its FilterSet (if defined).
+    """
+    queryset = django_object_type.get_queryset(default_manager, info)
+
+    filterset_class = django_object_type._meta.filterset_class
+    if filterset_class:
+        filterset = filterset_class(data=args, queryset=queryset, request=info.context)
+        return filterset.qs
+
+    return queryset
+
+
+def encode_cursor(pk):
+    return base64.b64encode(f'{CURSOR_PREFIX}{pk}'.encode()).decode()
+
+
+def decode_cursor(cursor):
+    try:
+        value = base64.b64decode(cursor.encode()).decode()
+        if not value.startswith(CURSOR_PREFIX):
+            raise ValueError()
+        return int(value[len(CURSOR_PREFIX):])
+    except ValueError:
+        raise GraphQLError(f"Invalid cursor: {cursor}")
+
 
 class ObjectField(graphene.Field):
     """
@@ -38,29 +99,110 @@ class ObjectField(graphene.Field):
 
 class ObjectListField(DjangoListField):
     """
-    Retrieve a list of objects, optionally filtered by one or more FilterSet filters.
+    Retrieve a list of objects, optionally filtered by one or more FilterSet filters. Results may be paginated by
+    specifying a limit and/or offset.
     """
     def __init__(self, _type, *args, **kwargs):
-        filter_kwargs = {}
-
-        # Get FilterSet kwargs
-        filterset_class = getattr(_type._meta, 'filterset_class', None)
-        if filterset_class:
-            for filter_name, filter_field in filterset_class.get_filters().items():
-                field_type = get_graphene_type(type(filter_field))
-                filter_kwargs[filter_name] = graphene.Argument(field_type)
+        filter_kwargs = get_filter_arguments(_type)
+        filter_kwargs.update({
+            'limit': graphene.Int(),
+            'offset': graphene.Int(),
+        })
 
         super().__init__(_type, args=filter_kwargs, *args, **kwargs)
 
     @staticmethod
-    def list_resolver(django_object_type, resolver, default_manager, root, info, **args):
-        # Get the QuerySet from the object type
-        queryset = django_object_type.get_queryset(default_manager, info)
+    def list_resolver(django_object_type, resolver, default_manager, root, info, limit=None, offset=None, **args):
+        queryset = get_filtered_queryset(django_object_type, default_manager, info, args)
 
-        # Instantiate and apply the FilterSet, if defined
-        filterset_class = django_object_type._meta.filterset_class
-        if filterset_class:
-            filterset = filterset_class(data=args, queryset=queryset, request=info.context)
-            return filterset.qs
+        # Apply pagination, if requested
+        offset = max(offset or 0, 0)
+        limit = get_page_limit(limit)
+        if limit:
+            return queryset[offset:offset + limit]
+        if offset:
+            return queryset[offset:]
 
         return queryset
+
+
+class ObjectConnection(graphene.relay.Connection):
+    """
+    Base class for paginated lists of objects, following the Relay cursor connection specification.
+    """
+    total_count = graphene.Int()
+
+    class Meta:
+        abstract = True
+
+    def resolve_total_count(self, info):
+        return self.queryset.count()
+
+
+class ObjectConnectionField(graphene.Field):
+    """
+    Retrieve a paginated list of objects, optionally filtered by one or more FilterSet filters. Objects are ordered by
+    their numeric ID: each page includes the first N objects (where N defaults to PAGINATE_COUNT) following the object
+    identified by the `after` cursor.
+    """
+    connection_types = {}
+
+    def __init__(self, _type, *args, **kwargs):
+        self.node_type = _type
+
+        filter_kwargs = get_filter_arguments(_type)
+        filter_kwargs.update({
+            'first': graphene.Int(),
+            'after': graphene.String(),
+        })
+
+        super().__init__(self.get_connection_type(_type), args=filter_kwargs, *args, **kwargs)
+
+    @classmethod
+    def get_connection_type(cls, django_object_type):
+        """
+        Return the Connection type for an object type, creating it if necessary.
+        """
+        if django_object_type not in cls.connection_types:
+            cls.connection_types[django_object_type] = ObjectConnection.create_type(
+                f'{django_object_type._meta.name}Connection',
+                node=django_object_type
+            )
+        return cls.connection_types[django_object_type]
+
+    @staticmethod
+    def connection_resolver(django_object_type, connection_type, root, info, first=None, after=None, **args):
+        manager = django_object_type._meta.model._default_manager
+        queryset = get_filtered_queryset(django_object_type, manager, info, args).order_by('pk')
+
+        # Retrieve one object beyond the requested page to determine whether another page follows
+        page = queryset
+        if after is not None:
+            page = page.filter(pk__gt=decode_cursor(after))
+        limit = get_page_limit(first, default=get_config().PAGINATE_COUNT)
+        if limit:
+            objects = list(page[:limit + 1])
+            has_next_page = len(objects) > limit
+            objects = objects[:limit]
+        else:
+            objects = list(page)
+            has_next_page = False
+
+        edges = [
+            connection_type.Edge(node=obj, cursor=encode_cursor(obj.pk)) for obj in objects
+        ]
+        connection = connection_type(
+            edges=edges,
+            page_info=PageInfo(
+                start_cursor=edges[0].cursor if edges else None,
+                end_cursor=edges[-1].cursor if edges else None,
+                has_previous_page=after is not None,
+                has_next_page=has_next_page
+            )
+        )
+        connection.queryset = queryset
+
+        return connection
+
+    def get_resolver(self, parent_resolver):
+        return partial(self.connection_resolver, self.node_type, self.type)
@@ -1,5 +1,8 @@
 import graphene
 from django_filters import filters
+from graphql.error import GraphQLError
+
+from netbox.config import get_config
 
 
 def get_graphene_type(filter_cls):
@@ -23,3 +26,24 @@ def get_graphene_type(filter_cls):
         return graphene.List(field_type)
 
     return field_type
+
+
+def get_page_limit(limit, default=None):
+    """
+    Return the maximum number of objects to include in a page of GraphQL results, enforcing MAX_PAGE_SIZE. As with the
+    REST API, a limit of zero requests all objects, which is permitted only if MAX_PAGE_SIZE has been disabled. Returns
+    None if no limit is to be applied.
+    """
+    if limit is None:
+        limit = default
+    if limit is None:
+        return None
+    if limit < 0:
+        raise GraphQLError("Limit must be a non-negative integer.")
+
+    # Enforce maximum page size, if defined
+    max_page_size = get_config().MAX_PAGE_SIZE
+    if max_page_size:
+        return max_page_size if limit == 0 else min(limit, max_page_size)
+
+    return limit or None
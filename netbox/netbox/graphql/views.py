@@ -3,15 +3,21 @@ from django.contrib.auth.views import redirect_to_login
 from django.http import HttpResponseNotFound, HttpResponseForbidden
 from django.urls import reverse
 from graphene_django.views import GraphQLView as GraphQLView_
+from graphql.error import GraphQLSyntaxError
+from graphql.execution import ExecutionResult
+from graphql.language.parser import parse
+from graphql.validation import validate
+from graphql.validation.rules import NoFragmentCycles
 from rest_framework.exceptions import AuthenticationFailed
 
 from netbox.api.authentication import TokenAuthentication
 from netbox.config import get_config
+from .cost import QueryCostError, estimate_query_cost
 
 
 class GraphQLView(GraphQLView_):
     """
-    Extends graphene_django's GraphQLView to support DRF's token-based authentication.
+    Extends graphene_django's GraphQLView to support DRF's token-based authentication and to enforce query cost limits.
     """
     graphiql_template = 'graphiql.html'
 
@@ -42,3 +48,37 @@ class GraphQLView(GraphQLView_):
             return HttpResponseForbidden("No credentials provided.")
 
         return super().dispatch(request, *args, **kwargs)
+
+    def execute_graphql_request(self, request, data, query, variables, operation_name, show_graphiql=False):
+        config = get_config()
+
+        # Estimate the cost of the query and reject it if it exceeds the configured limits
+        if query and (config.GRAPHQL_MAX_QUERY_COST or config.GRAPHQL_MAX_QUERY_DEPTH):
+            try:
+                document_ast = parse(query)
+            except GraphQLSyntaxError:
+                # Defer error reporting to the parent class
+                return super().execute_graphql_request(
+                    request, data, query, variables, operation_name, show_graphiql
+                )
+
+            # Validate the query before analyzing it. Fragment cycles are checked for first, as the remaining
+            # validation rules (like the cost analysis itself) would recurse indefinitely over them.
+            errors = validate(self.schema, document_ast, [NoFragmentCycles]) or validate(self.schema, document_ast)
+            if errors:
+                return ExecutionResult(errors=errors, invalid=True)
+
+            try:
+                estimate_query_cost(
+                    self.schema,
+                    document_ast,
+                    variables=variables,
+                    operation_name=operation_name,
+                    request=request,
+                    max_cost=config.GRAPHQL_MAX_QUERY_COST,
+                    max_depth=config.GRAPHQL_MAX_QUERY_DEPTH
+                )
+            except QueryCostError as e:
+                return ExecutionResult(errors=[e], invalid=True)
+
+        return super().execute_graphql_request(request, data, query, variables, operation_name, show_graphiql)
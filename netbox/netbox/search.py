@@ -29,6 +29,13 @@ CIRCUIT_TYPES = {
         'filterset': circuits.filtersets.ProviderFilterSet,
         'table': circuits.tables.ProviderTable,
         'url': 'circuits:provider_list',
+        'search_fields': (
+            ('name', 100),
+            ('account', 200),
+            ('noc_contact', 2000),
+            ('admin_contact', 2000),
+            ('comments', 5000),
+        ),
     },
     'circuit': {
         'queryset': Circuit.objects.prefetch_related(
@@ -37,12 +44,14 @@ CIRCUIT_TYPES = {
         'filterset': circuits.filtersets.CircuitFilterSet,
         'table': circuits.tables.CircuitTable,
         'url': 'circuits:circuit_list',
+        'search_fields': (('cid', 100), ('description', 500), ('comments', 5000)),
     },
     'providernetwork': {
         'queryset': ProviderNetwork.objects.prefetch_related('provider'),
         'filterset': circuits.filtersets.ProviderNetworkFilterSet,
         'table': circuits.tables.ProviderNetworkTable,
         'url': 'circuits:providernetwork_list',
+        'search_fields': (('name', 100), ('service_id', 200), ('description', 500), ('comments', 5000)),
     },
 }
 
@@ -52,6 +61,14 @@ DCIM_TYPES = {
         'filterset': dcim.filtersets.SiteFilterSet,
         'table': dcim.tables.SiteTable,
         'url': 'dcim:site_list',
+        'search_fields': (
+            ('name', 100),
+            ('facility', 110),
+            ('description', 500),
+            ('physical_address', 2000),
+            ('shipping_address', 2000),
+            ('comments', 5000),
+        ),
     },
     'rack': {
         'queryset': Rack.objects.prefetch_related('site', 'location', 'tenant', 'tenant__group', 'role').annotate(
@@ -60,12 +77,14 @@ DCIM_TYPES = {
         'filterset': dcim.filtersets.RackFilterSet,
         'table': dcim.tables.RackTable,
         'url': 'dcim:rack_list',
+        'search_fields': (('name', 100), ('facility_id', 110), ('serial', 150), ('asset_tag', 150), ('comments', 5000)),
     },
     'rackreservation': {
         'queryset': RackReservation.objects.prefetch_related('site', 'rack', 'user'),
         'filterset': dcim.filtersets.RackReservationFilterSet,
         'table': dcim.tables.RackReservationTable,
         'url': 'dcim:rackreservation_list',
+        'search_fields': (('description', 500),),
     },
     'location': {
         'queryset': Location.objects.add_related_count(
@@ -84,6 +103,7 @@ DCIM_TYPES = {
         'filterset': dcim.filtersets.LocationFilterSet,
         'table': dcim.tables.LocationTable,
         'url': 'dcim:location_list',
+        'search_fields': (('name', 100), ('description', 500)),
     },
     'devicetype': {
         'queryset': DeviceType.objects.prefetch_related('manufacturer').annotate(
@@ -92,6 +112,7 @@ DCIM_TYPES = {
         'filterset': dcim.filtersets.DeviceTypeFilterSet,
         'table': dcim.tables.DeviceTypeTable,
         'url': 'dcim:devicetype_list',
+        'search_fields': (('model', 100), ('part_number', 200), ('comments', 5000)),
     },
     'device': {
         'queryset': Device.objects.prefetch_related(
@@ -101,6 +122,7 @@ DCIM_TYPES = {
         'filterset': dcim.filtersets.DeviceFilterSet,
         'table': dcim.tables.DeviceTable,
         'url': 'dcim:device_list',
+        'search_fields': (('name', 100), ('ip_address', 150), ('os', 300), ('url', 300), ('comments', 5000)),
     },
     'moduletype': {
         'queryset': ModuleType.objects.prefetch_related('manufacturer').annotate(
@@ -109,6 +131,7 @@ DCIM_TYPES = {
         'filterset': dcim.filtersets.ModuleTypeFilterSet,
         'table': dcim.tables.ModuleTypeTable,
         'url': 'dcim:moduletype_list',
+        'search_fields': (('model', 100), ('part_number', 200), ('comments', 5000)),
     },
     'module': {
         'queryset': Module.objects.prefetch_related(
@@ -117,6 +140,7 @@ DCIM_TYPES = {
         'filterset': dcim.filtersets.ModuleFilterSet,
         'table': dcim.tables.ModuleTable,
         'url': 'dcim:module_list',
+        'search_fields': (('serial', 150), ('asset_tag', 150), ('comments', 5000)),
     },
     'virtualchassis': {
         'queryset': VirtualChassis.objects.prefetch_related('master').annotate(
@@ -125,18 +149,21 @@ DCIM_TYPES = {
         'filterset': dcim.filtersets.VirtualChassisFilterSet,
         'table': dcim.tables.VirtualChassisTable,
         'url': 'dcim:virtualchassis_list',
+        'search_fields': (('name', 100), ('domain', 300)),
     },
     'cable': {
         'queryset': Cable.objects.all(),
         'filterset': dcim.filtersets.CableFilterSet,
         'table': dcim.tables.CableTable,
         'url': 'dcim:cable_list',
+        'search_fields': (('label', 100),),
     },
     'powerfeed': {
         'queryset': PowerFeed.objects.all(),
         'filterset': dcim.filtersets.PowerFeedFilterSet,
         'table': dcim.tables.PowerFeedTable,
         'url': 'dcim:powerfeed_list',
+        'search_fields': (('name', 100), ('comments', 5000)),
     },
 }
 
@@ -146,42 +173,49 @@ IPAM_TYPES = {
         'filterset': ipam.filtersets.VRFFilterSet,
         'table': ipam.tables.VRFTable,
         'url': 'ipam:vrf_list',
+        'search_fields': (('name', 100), ('rd', 200), ('description', 500)),
     },
     'aggregate': {
         'queryset': Aggregate.objects.prefetch_related('rir'),
         'filterset': ipam.filtersets.AggregateFilterSet,
         'table': ipam.tables.AggregateTable,
         'url': 'ipam:aggregate_list',
+        'search_fields': (('prefix', 100), ('description', 500)),
     },
     'prefix': {
         'queryset': Prefix.objects.prefetch_related('site', 'vrf__tenant', 'tenant', 'tenant__group', 'vlan', 'role'),
         'filterset': ipam.filtersets.PrefixFilterSet,
         'table': ipam.tables.PrefixTable,
         'url': 'ipam:prefix_list',
+        'search_fields': (('prefix', 100), ('description', 500)),
     },
     'ipaddress': {
         'queryset': IPAddress.objects.prefetch_related('vrf__tenant', 'tenant', 'tenant__group'),
         'filterset': ipam.filtersets.IPAddressFilterSet,
         'table': ipam.tables.IPAddressTable,
         'url': 'ipam:ipaddress_list',
+        'search_fields': (('address', 100), ('dns_name', 150), ('description', 500)),
     },
     'vlan': {
         'queryset': VLAN.objects.prefetch_related('site', 'group', 'tenant', 'tenant__group', 'role'),
         'filterset': ipam.filtersets.VLANFilterSet,
         'table': ipam.tables.VLANTable,
         'url': 'ipam:vlan_list',
+        'search_fields': (('name', 100), ('vid', 100), ('description', 500)),
     },
     'asn': {
         'queryset': ASN.objects.prefetch_related('rir', 'tenant', 'tenant__group'),
         'filterset': ipam.filtersets.ASNFilterSet,
         'table': ipam.tables.ASNTable,
         'url': 'ipam:asn_list',
+        'search_fields': (('asn', 100), ('description', 500)),
     },
     'service': {
         'queryset': Service.objects.prefetch_related('device', 'virtual_machine'),
         'filterset': ipam.filtersets.ServiceFilterSet,
         'table': ipam.tables.ServiceTable,
         'url': 'ipam:service_list',
+        'search_fields': (('name', 100), ('description', 500)),
     },
 }
 
@@ -191,6 +225,7 @@ TENANCY_TYPES = {
         'filterset': tenancy.filtersets.TenantFilterSet,
         'table': tenancy.tables.TenantTable,
         'url': 'tenancy:tenant_list',
+        'search_fields': (('name', 100), ('slug', 110), ('description', 500), ('comments', 5000)),
     },
     'contact': {
         'queryset': Contact.objects.prefetch_related('group', 'assignments').annotate(
@@ -198,6 +233,15 @@ TENANCY_TYPES = {
         'filterset': tenancy.filtersets.ContactFilterSet,
         'table': tenancy.tables.ContactTable,
         'url': 'tenancy:contact_list',
+        'search_fields': (
+            ('name', 100),
+            ('title', 300),
+            ('phone', 200),
+            ('email', 200),
+            ('address', 2000),
+            ('link', 300),
+            ('comments', 5000),
+        ),
     },
 }
 
@@ -210,6 +254,7 @@ VIRTUALIZATION_TYPES = {
         'filterset': virtualization.filtersets.ClusterFilterSet,
         'table': virtualization.tables.ClusterTable,
         'url': 'virtualization:cluster_list',
+        'search_fields': (('name', 100), ('comments', 5000)),
     },
     'virtualmachine': {
         'queryset': VirtualMachine.objects.prefetch_related(
@@ -218,6 +263,7 @@ VIRTUALIZATION_TYPES = {
         'filterset': virtualization.filtersets.VirtualMachineFilterSet,
         'table': virtualization.tables.VirtualMachineTable,
         'url': 'virtualization:virtualmachine_list',
+        'search_fields': (('name', 100), ('comments', 5000)),
     },
 }
 
@@ -229,12 +275,14 @@ WIRELESS_TYPES = {
         'filterset': wireless.filtersets.WirelessLANFilterSet,
         'table': wireless.tables.WirelessLANTable,
         'url': 'wireless:wirelesslan_list',
+        'search_fields': (('ssid', 100), ('description', 500)),
     },
     'wirelesslink': {
         'queryset': WirelessLink.objects.prefetch_related('interface_a__device', 'interface_b__device'),
         'filterset': wireless.filtersets.WirelessLinkFilterSet,
         'table': wireless.tables.WirelessLinkTable,
         'url': 'wireless:wirelesslink_list',
+        'search_fields': (('ssid', 100), ('description', 500)),
     },
 }
 
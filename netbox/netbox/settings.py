@@ -308,6 +308,7 @@ INSTALLED_APPS = [
     'django.contrib.messages',
     'django.contrib.staticfiles',
     'django.contrib.humanize',
+    'django.contrib.postgres',  # Required for OpClass() in expression indexes (see utilities.indexes)
     'corsheaders',
     'debug_toolbar',
     'graphiql_debug_toolbar',
@@ -559,6 +560,8 @@ GRAPHENE = {
     # Avoids naming collision on models with 'type' field; see
     # https://github.com/graphql-python/graphene-django/issues/185
     'DJANGO_CHOICE_FIELD_ENUM_V3_NAMING': True,
+    # Imported lazily upon the first GraphQL request to avoid building the schema in every worker at startup
+    'SCHEMA': 'netbox.graphql.schema.schema',
 }
 
 
@@ -1,27 +1,122 @@
+import itertools
+
 import django_tables2 as tables
 from django.contrib.auth.models import AnonymousUser
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import FieldDoesNotExist
 from django.db.models.fields.related import RelatedField
-from django_tables2.data import TableQuerysetData
+from django.utils.encoding import force_str
+from django.utils.functional import cached_property
+from django_tables2.data import TableListData, TableQuerysetData
+from django_tables2.rows import BoundRow
 
 from extras.models import CustomField, CustomLink
 from netbox.tables import columns
+from utilities.constants import EXPORT_CHUNK_SIZE
 from utilities.paginator import EnhancedPaginator, get_paginate_count
+from utilities.utils import iterate_queryset
 
 __all__ = (
     'BaseTable',
     'NetBoxTable',
+    'PlaceholderTableData',
 )
 
 
+class PlaceholderTableData(TableListData):
+    """
+    Table data comprising a QuerySet of objects interleaved with placeholder rows (e.g. representing available address
+    space). The placeholder rows are determined only for the objects within a requested slice of the data, such as
+    the current page of a table, so that only those objects are retrieved from the database.
+
+    The data is indexed and sliced by object rather than by row: a slice comprises the objects within it, each
+    preceded by any placeholder rows belonging before it. A slice which reaches the end of the QuerySet is also
+    followed by any trailing placeholder rows. (Tables are thus paginated by object.)
+
+    :param queryset: The QuerySet of objects, ordered as they are to be displayed
+    :param get_placeholders: A callable which accepts the index of the first of a list of consecutive objects within
+        the QuerySet, the list of objects, and whether the list ends the QuerySet. It returns an ordered list of
+        (index, row) tuples, each indicating a placeholder row to be inserted before the object at the specified index
+        of the list (or after the last object, if the index is equal to the length of the list).
+    """
+    def __init__(self, queryset, get_placeholders):
+        super().__init__(queryset)
+        self.get_placeholders = get_placeholders
+        self._rows = None
+
+    @cached_property
+    def objects_count(self):
+        return self.data.count()
+
+    def __len__(self):
+        if self._rows is not None:
+            return len(self._rows)
+        return self.objects_count
+
+    def _get_rows(self, start, objects, end):
+        """
+        Return the rows for a list of consecutive objects beginning at the specified index of the QuerySet.
+        """
+        placeholders = self.get_placeholders(start, objects, end)
+        rows = []
+        i = 0
+        for index, obj in enumerate(objects):
+            while i < len(placeholders) and placeholders[i][0] == index:
+                rows.append(placeholders[i][1])
+                i += 1
+            rows.append(obj)
+        rows.extend(row for _, row in placeholders[i:])
+
+        return rows
+
+    def __iter__(self):
+        if self._rows is not None:
+            yield from self._rows
+            return
+
+        objects = iterate_queryset(self.data)
+        start = 0
+        while True:
+            chunk = list(itertools.islice(objects, EXPORT_CHUNK_SIZE))
+            end = len(chunk) < EXPORT_CHUNK_SIZE
+            yield from self._get_rows(start, chunk, end)
+            if end:
+                break
+            start += len(chunk)
+
+    def __getitem__(self, key):
+        if self._rows is not None:
+            return self._rows[key]
+
+        if not isinstance(key, slice):
+            if key < 0:
+                key += len(self)
+            if not 0 <= key < len(self):
+                raise IndexError('Table data index out of range')
+            return self.data[key]
+
+        start, stop, step = key.indices(len(self))
+        if step != 1:
+            raise ValueError('Table data does not support slicing with a step')
+
+        objects = list(self.data[start:stop]) if stop > start else []
+        return self._get_rows(start, objects, stop >= len(self))
+
+    def order_by(self, aliases):
+        # Ordering by a column requires all rows to be retrieved
+        rows = TableListData(list(self))
+        rows.set_table(self.table)
+        rows.order_by(aliases)
+        self._rows = rows.data
+
+
 class BaseTable(tables.Table):
     """
     Base table class for NetBox objects. Adds support for:
 
         * User configuration (column preferences)
-        * Automatic prefetching of related objects
+        * Automatic loading of related objects (via joins or prefetching)
         * BS5 styling
 
     :param user: Personalize table display for the given user (optional). Has no effect if AnonymousUser is passed.
@@ -73,31 +168,55 @@ class BaseTable(tables.Table):
             self.sequence.remove('actions')
             self.sequence.append('actions')
 
-        # Dynamically update the table's QuerySet to ensure related fields are pre-fetched
+        # Dynamically update the table's QuerySet to ensure related objects are loaded
         if isinstance(self.data, TableQuerysetData):
+            select_fields, prefetch_fields = self._get_related_fields()
+            queryset = self.data.data.prefetch_related(None).prefetch_related(*prefetch_fields)
+            if select_fields:
+                queryset = queryset.select_related(*select_fields)
+            self.data.data = queryset
+
+    def _get_related_fields(self):
+        """
+        Return the related fields referenced by visible columns as two lists: single-valued (forward ForeignKey and
+        one-to-one) relations, to be joined via select_related(), and multi-valued or generic relations, which must be
+        prefetched.
+        """
+        select_fields = set()
+        prefetch_fields = set()
+
+        for column in self.columns:
+            if not column.visible:
+                continue
+            model = getattr(self.Meta, 'model')
+            accessor = column.accessor
+            path = []
+            select_path = None
+            for field_name in accessor.split(accessor.SEPARATOR):
+                try:
+                    field = model._meta.get_field(field_name)
+                except FieldDoesNotExist:
+                    break
+                if isinstance(field, RelatedField):
+                    # Join single-valued relations up to the first multi-valued relation in the path
+                    if select_path is None and (field.many_to_many or field.one_to_many):
+                        select_path = list(path)
+                    path.append(field_name)
+                    model = field.remote_field.model
+                elif isinstance(field, GenericForeignKey):
+                    # Can't load beyond a GenericForeignKey
+                    if select_path is None:
+                        select_path = list(path)
+                    path.append(field_name)
+                    break
+            if select_path is None:
+                select_path = path
+            elif path:
+                prefetch_fields.add('__'.join(path))
+            if select_path:
+                select_fields.add('__'.join(select_path))
 
-            prefetch_fields = []
-            for column in self.columns:
-                if column.visible:
-                    model = getattr(self.Meta, 'model')
-                    accessor = column.accessor
-                    prefetch_path = []
-                    for field_name in accessor.split(accessor.SEPARATOR):
-                        try:
-                            field = model._meta.get_field(field_name)
-                        except FieldDoesNotExist:
-                            break
-                        if isinstance(field, RelatedField):
-                            # Follow ForeignKeys to the related model
-                            prefetch_path.append(field_name)
-                            model = field.remote_field.model
-                        elif isinstance(field, GenericForeignKey):
-                            # Can't prefetch beyond a GenericForeignKey
-                            prefetch_path.append(field_name)
-                            break
-                    if prefetch_path:
-                        prefetch_fields.append('__'.join(prefetch_path))
-            self.data.data = self.data.data.prefetch_related(None).prefetch_related(*prefetch_fields)
+        return sorted(select_fields), sorted(prefetch_fields)
 
     def _get_columns(self, visible=True):
         columns = []
@@ -121,9 +240,41 @@ class BaseTable(tables.Table):
         prefixes/IP addresses/etc., where some table rows may represent available address space.
         """
         if not hasattr(self, '_objects_count'):
-            self._objects_count = sum(1 for obj in self.data if hasattr(obj, 'pk'))
+            if isinstance(self.data, TableQuerysetData):
+                # Shares the count performed for pagination
+                self._objects_count = len(self.data)
+            elif isinstance(self.data, PlaceholderTableData):
+                self._objects_count = self.data.objects_count
+            else:
+                self._objects_count = sum(1 for obj in self.data if hasattr(obj, 'pk'))
         return self._objects_count
 
+    def iter_values(self, exclude_columns=None, chunk_size=EXPORT_CHUNK_SIZE):
+        """
+        Iterate over the table's column headers and row values, as with as_values(). When the table is backed by a
+        QuerySet, objects are retrieved from the database in chunks (with related objects prefetched for each chunk)
+        so that only a single chunk is held in memory at a time.
+
+        :param exclude_columns: An iterable of column names to exclude
+        :param chunk_size: The number of objects to retrieve from the database at a time
+        """
+        if not isinstance(self.data, TableQuerysetData):
+            yield from self.as_values(exclude_columns=exclude_columns)
+            return
+
+        exclude_columns = exclude_columns or ()
+        columns = [
+            column for column in self.columns.iterall()
+            if not (column.column.exclude_from_export or column.name in exclude_columns)
+        ]
+        yield [force_str(column.header, strings_only=True) for column in columns]
+
+        for record in iterate_queryset(self.data.data, chunk_size=chunk_size):
+            row = BoundRow(record, table=self)
+            yield [
+                force_str(row.get_cell_value(column.name), strings_only=True) for column in columns
+            ]
+
     def configure(self, request):
         """
         Configure the table for a specific request context. This performs pagination and records
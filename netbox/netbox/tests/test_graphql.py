@@ -1,6 +1,9 @@
 from django.test import override_settings
 from django.urls import reverse
+from graphql.language.parser import parse
 
+from netbox.graphql.cost import estimate_query_cost
+from netbox.graphql.schema import schema
 from utilities.testing import disable_warnings, TestCase
 
 
@@ -34,3 +37,32 @@ class GraphQLTestCase(TestCase):
         response = self.client.get(url, **header)
         with disable_warnings('django.request'):
             self.assertHttpStatus(response, 302)  # Redirect to login page
+
+    @override_settings(GRAPHQL_MAX_QUERY_DEPTH=2)
+    def test_graphql_max_query_depth(self):
+        """
+        Queries nested more deeply than GRAPHQL_MAX_QUERY_DEPTH should be rejected
+        """
+        url = reverse('graphql')
+        query = '{ site_list { tenant { group { name } } } }'
+        response = self.client.post(url, data={'query': query}, content_type='application/json')
+        self.assertHttpStatus(response, 400)
+        self.assertIn('maximum permitted depth', response.json()['errors'][0]['message'])
+
+    @override_settings(GRAPHQL_MAX_QUERY_DEPTH=5)
+    def test_graphql_fragment_cycle(self):
+        """
+        Queries containing a fragment cycle should be rejected by validation before their cost is estimated
+        """
+        url = reverse('graphql')
+        query = 'query { site(id: 1) { ...A } } fragment A on SiteType { ...A }'
+        response = self.client.post(url, data={'query': query}, content_type='application/json')
+        self.assertHttpStatus(response, 400)
+        self.assertIn('Cannot spread fragment "A" within itself', response.json()['errors'][0]['message'])
+
+    def test_estimate_query_cost_fragment_cycle(self):
+        """
+        A fragment cycle should not cause infinite recursion when estimating the cost of a query
+        """
+        document_ast = parse('query { site(id: 1) { ...A } } fragment A on SiteType { name ...A }')
+        self.assertGreater(estimate_query_cost(schema, document_ast), 0)
@@ -1,3 +1,4 @@
+import django_tables2 as tables
 from django.template import Context, Template
 from django.test import TestCase
 
@@ -35,3 +36,29 @@ class TagColumnTest(TestCase):
             'table': table
         })
         template.render(context)
+
+
+class RelatedObjectsTable(NetBoxTable):
+    region = tables.Column(linkify=True)
+    group = tables.Column(accessor='group__parent')
+    tenant = tables.Column(accessor='tenant__group')
+    tags = columns.TagColumn(url_name='dcim:site_list')
+
+    class Meta(NetBoxTable.Meta):
+        model = Site
+        fields = ('pk', 'name', 'region', 'group', 'tenant', 'tags')
+        default_columns = fields
+
+
+class RelatedObjectsTest(TestCase):
+
+    def test_related_fields(self):
+        table = RelatedObjectsTable(Site.objects.all())
+        queryset = table.data.data
+
+        # Single-valued relations are joined; multi-valued relations are prefetched
+        self.assertEqual(
+            queryset.query.select_related,
+            {'region': {}, 'group': {'parent': {}}, 'tenant': {'group': {}}}
+        )
+        self.assertEqual(queryset._prefetch_related_lookups, ('tags',))
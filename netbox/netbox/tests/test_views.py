@@ -1,8 +1,13 @@
 import urllib.parse
 
-from utilities.testing import TestCase
+from django.contrib.auth.models import User
+from django.test import Client, TransactionTestCase, override_settings
 from django.urls import reverse
 
+from dcim.models import DeviceRole, Site
+from tenancy.models import Tenant
+from utilities.testing import TestCase
+
 
 class HomeViewTestCase(TestCase):
 
@@ -13,6 +18,28 @@ class HomeViewTestCase(TestCase):
         response = self.client.get(url)
         self.assertHttpStatus(response, 200)
 
+    def get_stat(self, response, label):
+        for section_label, items, icon_class in response.context['stats']:
+            for item in items:
+                if item['label'] == label:
+                    return item['count']
+
+    @override_settings(
+        EXEMPT_VIEW_PERMISSIONS=['*'],
+        CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+    )
+    def test_home_stats_cached(self):
+        DeviceRole.objects.create(name='Device Role 1', slug='device-role-1')
+        url = reverse('home')
+
+        response = self.client.get(url)
+        self.assertEqual(self.get_stat(response, 'Server Roles'), 1)
+
+        # Counts are served from the cache until they expire
+        DeviceRole.objects.create(name='Device Role 2', slug='device-role-2')
+        response = self.client.get(url)
+        self.assertEqual(self.get_stat(response, 'Server Roles'), 1)
+
     def test_search(self):
 
         url = reverse('search')
@@ -22,3 +49,48 @@ class HomeViewTestCase(TestCase):
 
         response = self.client.get('{}?{}'.format(url, urllib.parse.urlencode(params)))
         self.assertHttpStatus(response, 200)
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=['*'])
+    def test_search_results(self):
+        Site.objects.create(name='Foo Site', slug='foo-site')
+        Site.objects.create(name='Bar Site', slug='bar-site')
+
+        url = reverse('search')
+        params = {
+            'q': 'foo',
+        }
+
+        response = self.client.get('{}?{}'.format(url, urllib.parse.urlencode(params)))
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(len(response.context['results']), 1)
+        self.assertContains(response, 'Foo Site')
+        self.assertNotContains(response, 'Bar Site')
+
+
+class SearchViewTransactionTestCase(TransactionTestCase):
+    """
+    Search results spanning multiple object types are retrieved in worker threads, each with its own database
+    connection, so the test data must be committed.
+    """
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser')
+        self.client = Client()
+        self.client.force_login(self.user)
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=['*'])
+    def test_search_results_multiple_types(self):
+        Site.objects.create(name='Foo Site', slug='foo-site')
+        Tenant.objects.create(name='Foo Tenant', slug='foo-tenant')
+        Tenant.objects.create(name='Bar Tenant', slug='bar-tenant')
+
+        url = reverse('search')
+        params = {
+            'q': 'foo',
+        }
+
+        response = self.client.get('{}?{}'.format(url, urllib.parse.urlencode(params)))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context['results']), 2)
+        self.assertContains(response, 'Foo Site')
+        self.assertContains(response, 'Foo Tenant')
+        self.assertNotContains(response, 'Bar Tenant')
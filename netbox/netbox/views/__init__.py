@@ -1,9 +1,16 @@
+import hashlib
+import json
 import platform
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 
 from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
+from django.db import connections, transaction
 from django.db.models import F
+from django.db.utils import OperationalError
 from django.http import HttpResponseServerError
 from django.shortcuts import redirect, render
 from django.template import loader
@@ -13,6 +20,7 @@ from django.views.decorators.csrf import requires_csrf_token
 from django.views.defaults import ERROR_500_TEMPLATE_NAME, page_not_found
 from django.views.generic import View
 from packaging import version
+from psycopg2.errors import QueryCanceled
 from sentry_sdk import capture_message
 
 from dcim.models import (
@@ -20,56 +28,38 @@ from dcim.models import (
 )
 from ipam.models import Service, ServiceTemplate, Connection
 from extras.models import ObjectChange
+from extras.search import filter_queryset, get_matching_types
 from extras.tables import ObjectChangeTable
-from netbox.constants import SEARCH_MAX_RESULTS
+from netbox.config import get_config
+from netbox.constants import HOME_STATS_CACHE_TIMEOUT, SEARCH_MAX_RESULTS
 from netbox.forms import SearchForm
 from netbox.search import SEARCH_TYPES
+from utilities.permissions import permission_is_exempt
+
+# Background threads for refreshing expired home page statistics
+_stats_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='home_stats')
+
 
 class HomeView(View):
     template_name = 'home.html'
+    stats_sections = (
+        ("DCIM", "server", (
+            ("dcim.view_device", "Servers", Device),
+            ("dcim.view_devicerole", "Server Roles", DeviceRole),
+            ("dcim.view_product", "Products", Product),
+            ("dcim.view_program", "Programs", Program),
+        )),
+        ("IPAM", "counter", (
+            ("ipam.view_service", "Ports", Service),
+            ("ipam.view_servicetemplate", "Port Templates", ServiceTemplate),
+            ("ipam.view_connection", "Server Connections", Connection),
+        )),
+    )
 
     def get(self, request):
         if settings.LOGIN_REQUIRED and not request.user.is_authenticated:
             return redirect("login")
 
-        def build_stats():
-            dcim = (
-                ("dcim.view_device", "Servers", Device.objects.restrict(request.user, 'view').count),
-                ("dcim.view_devicerole", "Server Roles", DeviceRole.objects.restrict(request.user, 'view').count),
-                ("dcim.view_product", "Products", Product.objects.restrict(request.user, 'view').count),
-                ("dcim.view_program", "Programs", Program.objects.restrict(request.user, 'view').count),
-            )
-            ipam = (
-                ("ipam.view_service", "Ports", Service.objects.restrict(request.user, 'view').count),
-                ("ipam.view_servicetemplate", "Port Templates", ServiceTemplate.objects.restrict(request.user, 'view').count),
-                ("ipam.view_connection", "Server Connections", Connection.objects.restrict(request.user, 'view').count),
-            )
-            sections = (
-                ("DCIM", dcim, "server"),
-                ("IPAM", ipam, "counter"),
-            )
-
-            stats = []
-            for section_label, section_items, icon_class in sections:
-                items = []
-                for perm, item_label, get_count in section_items:
-                    app, scope = perm.split(".")
-                    url = ":".join((app, scope.replace("view_", "") + "_list"))
-                    item = {
-                        "label": item_label,
-                        "count": None,
-                        "url": url,
-                        "disabled": True,
-                        "icon": icon_class,
-                    }
-                    if request.user.has_perm(perm):
-                        item["count"] = get_count()
-                        item["disabled"] = False
-                    items.append(item)
-                stats.append((section_label, items, icon_class))
-
-            return stats
-
         # Compile changelog table
         changelog = ObjectChange.objects.restrict(request.user, 'view').prefetch_related(
             'user', 'changed_object_type'
@@ -90,11 +80,85 @@ class HomeView(View):
 
         return render(request, self.template_name, {
             'search_form': SearchForm(),
-            'stats': build_stats(),
+            'stats': self.get_stats(request.user),
             'changelog_table': changelog_table,
             'new_release': new_release,
         })
 
+    def get_stats(self, user):
+        stats = []
+        for section_label, icon_class, section_items in self.stats_sections:
+            items = []
+            for perm, item_label, model in section_items:
+                app, scope = perm.split(".")
+                url = ":".join((app, scope.replace("view_", "") + "_list"))
+                item = {
+                    "label": item_label,
+                    "count": None,
+                    "url": url,
+                    "disabled": True,
+                    "icon": icon_class,
+                }
+                if user.has_perm(perm):
+                    item["count"] = self.get_count(user, perm, model)
+                    item["disabled"] = False
+                items.append(item)
+            stats.append((section_label, items, icon_class))
+
+        return stats
+
+    @staticmethod
+    def get_permission_fingerprint(user, perm):
+        """
+        Return a fingerprint of the constraints under which the user holds a permission. All users for whom the
+        permission is unconstrained share the same fingerprint.
+        """
+        if user.is_superuser or permission_is_exempt(perm):
+            return 'all'
+        constraints = user._object_perm_cache[perm]
+        if not all(constraints):
+            # Any permission with null constraints grants access to all objects
+            return 'all'
+        return hashlib.sha256(json.dumps(constraints, sort_keys=True, default=str).encode()).hexdigest()
+
+    def get_count(self, user, perm, model):
+        """
+        Return the number of objects of the given model visible to the user. Counts are cached per permission
+        fingerprint for HOME_STATS_TIMEOUT seconds; once expired, the cached count is still returned while a fresh
+        one is computed in the background.
+        """
+        timeout = get_config().HOME_STATS_TIMEOUT
+        if not timeout:
+            return model.objects.restrict(user, 'view').count()
+
+        cache_key = f'home_stats:{perm}:{self.get_permission_fingerprint(user, perm)}'
+        cached = cache.get(cache_key)
+        if cached is None:
+            return self.update_count(cache_key, user, model)
+
+        count, updated = cached
+        # Ensure that only one refresh is scheduled for each expired count
+        if updated + timeout < time.time() and cache.add(f'{cache_key}:refresh', True, timeout):
+            _stats_executor.submit(self._update_count, cache_key, user, model)
+
+        return count
+
+    @staticmethod
+    def update_count(cache_key, user, model):
+        count = model.objects.restrict(user, 'view').count()
+        cache.set(cache_key, (count, time.time()), HOME_STATS_CACHE_TIMEOUT)
+        cache.delete(f'{cache_key}:refresh')
+        return count
+
+    def _update_count(self, *args):
+        """
+        Wrapper for update_count() when executed in a background thread, closing the thread's database connection.
+        """
+        try:
+            return self.update_count(*args)
+        finally:
+            connections.close_all()
+
 
 class SearchView(View):
 
@@ -110,30 +174,118 @@ class SearchView(View):
                 url = reverse(SEARCH_TYPES[object_type]['url'])
                 return redirect(f"{url}?q={form.cleaned_data['q']}")
 
-            for obj_type in SEARCH_TYPES.keys():
-
-                queryset = SEARCH_TYPES[obj_type]['queryset'].restrict(request.user, 'view')
-                filterset = SEARCH_TYPES[obj_type]['filterset']
-                table = SEARCH_TYPES[obj_type]['table']
-                url = SEARCH_TYPES[obj_type]['url']
-
-                # Construct the results table for this object type
-                filtered_queryset = filterset({'q': form.cleaned_data['q']}, queryset=queryset).qs
-                table = table(filtered_queryset, orderable=False)
-                table.paginate(per_page=SEARCH_MAX_RESULTS)
+            # Find the object types with matching objects (ranked by their best match) using the search index
+            query = form.cleaned_data['q']
+            content_types = ContentType.objects.get_for_models(
+                *[search_type['queryset'].model for search_type in SEARCH_TYPES.values()]
+            )
+            search_types = {
+                content_types[search_type['queryset'].model].pk: obj_type
+                for obj_type, search_type in SEARCH_TYPES.items()
+            }
+            obj_types = [
+                search_types[content_type_id] for content_type_id in get_matching_types(query)
+                if content_type_id in search_types
+            ]
 
-                if table.page:
-                    results.append({
-                        'name': queryset.model._meta.verbose_name_plural,
-                        'table': table,
-                        'url': f"{reverse(url)}?q={form.cleaned_data.get('q')}"
-                    })
+            results = self.get_results(request, obj_types, query)
 
         return render(request, 'search.html', {
             'form': form,
             'results': results,
         })
 
+    def get_results(self, request, obj_types, query):
+        """
+        Retrieve the search results for each object type, in the order given. Results for multiple object types are
+        retrieved concurrently (each in its own thread and database connection), up to SEARCH_MAX_WORKERS at a time.
+        Any object type whose results are not retrieved within SEARCH_TIMEOUT is reported as having timed out.
+        """
+        config = get_config()
+        timeout = config.SEARCH_TIMEOUT
+        max_workers = min(config.SEARCH_MAX_WORKERS, len(obj_types))
+
+        # Apply permissions in the request thread, as the user's permissions are cached on the request
+        querysets = {
+            obj_type: SEARCH_TYPES[obj_type]['queryset'].restrict(request.user, 'view') for obj_type in obj_types
+        }
+
+        if max_workers <= 1:
+            type_results = {
+                obj_type: self.get_type_results(obj_type, querysets[obj_type], query, timeout)
+                for obj_type in obj_types
+            }
+        else:
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+            futures = {
+                obj_type: executor.submit(self._get_type_results, obj_type, querysets[obj_type], query, timeout)
+                for obj_type in obj_types
+            }
+            # Allow for types being queued behind others in the pool
+            wait(futures.values(), timeout=timeout * len(obj_types) / max_workers + 1 if timeout else None)
+            # Cancel any types still queued (shutdown() accepts cancel_futures only from Python 3.9)
+            for future in futures.values():
+                future.cancel()
+            executor.shutdown(wait=False)
+            type_results = {}
+            for obj_type, future in futures.items():
+                if future.done() and not future.cancelled():
+                    type_results[obj_type] = future.result()
+                else:
+                    type_results[obj_type] = self.timed_out(obj_type, query)
+
+        return [type_results[obj_type] for obj_type in obj_types if type_results[obj_type] is not None]
+
+    def _get_type_results(self, *args):
+        """
+        Wrapper for get_type_results() when executed in a worker thread, closing the thread's database connection.
+        """
+        try:
+            return self.get_type_results(*args)
+        finally:
+            connections.close_all()
+
+    def get_type_results(self, obj_type, queryset, query, timeout=None):
+        """
+        Construct the results table for a single object type. Returns None if no objects match.
+        """
+        table = SEARCH_TYPES[obj_type]['table']
+        url = SEARCH_TYPES[obj_type]['url']
+
+        try:
+            with transaction.atomic():
+                if timeout:
+                    with transaction.get_connection().cursor() as cursor:
+                        cursor.execute('SET LOCAL statement_timeout = %s', [timeout * 1000])
+
+                # Construct the results table for this object type. Evaluating the page retrieves the results.
+                table = table(filter_queryset(queryset, query), orderable=False)
+                table.paginate(per_page=SEARCH_MAX_RESULTS)
+                if not table.page:
+                    return None
+        except OperationalError as e:
+            if isinstance(e.__cause__, QueryCanceled):
+                return self.timed_out(obj_type, query)
+            raise
+
+        return {
+            'name': queryset.model._meta.verbose_name_plural,
+            'table': table,
+            'url': f"{reverse(url)}?q={query}"
+        }
+
+    @staticmethod
+    def timed_out(obj_type, query):
+        """
+        Return the result for an object type whose results could not be retrieved within the time limit.
+        """
+        return {
+            'name': SEARCH_TYPES[obj_type]['queryset'].model._meta.verbose_name_plural,
+            'table': None,
+            'timed_out': True,
+            'url': f"{reverse(SEARCH_TYPES[obj_type]['url'])}?q={query}",
+        }
+
 
 class StaticMediaFailureView(View):
     """
@@ -1,6 +1,12 @@
+from copy import copy
+
+from django.core.exceptions import ValidationError
+from django.db.models import Model
 from django.shortcuts import get_object_or_404
 from django.views.generic import View
 
+from extras.bulk import bulk_create_objects, can_bulk_create, get_defining_class, validate_unique
+from netbox.signals import post_clean
 from utilities.views import ObjectPermissionRequiredMixin
 
 
@@ -56,3 +62,85 @@ class BaseMultiObjectView(ObjectPermissionRequiredMixin, View):
             request: The current request
         """
         return {}
+
+
+class ComponentCreateMixin:
+    """
+    Provides for the creation of many device components (or component templates) at once from a set of patterned
+    values (e.g. names). Rather than a model form being validated and saved for each new component, one model form is
+    validated for each parent object and its instance is copied for each set of patterned values. The uniqueness of
+    all new components is validated at once, and they are created in bulk where the model permits.
+
+    Attributes:
+        model_form: The form used to validate each set of new components
+    """
+    model_form = None
+
+    def get_component_form(self, data):
+        """
+        Return a bound model form for validating new components. Uniqueness is not validated by the form, as it is
+        instead validated for all new components by save_components().
+        """
+        form = self.model_form(data)
+        form.validate_unique = lambda: None
+        return form
+
+    def build_components(self, component_form, patterned_values):
+        """
+        Copy the instance of a valid component form for each dictionary of patterned field values. Returns a list of
+        the new (unsaved) components and a list of (component, ValidationError) tuples for any which are invalid.
+        """
+        model = component_form._meta.model
+        components = []
+        errors = []
+
+        for values in patterned_values:
+            component = copy(component_form.instance)
+            for field_name, value in values.items():
+                setattr(component, field_name, value)
+
+            # Only the patterned fields differ from the validated instance, but custom validation rules are
+            # applied to each component
+            try:
+                component.clean_fields(exclude=[f.name for f in model._meta.fields if f.name not in values])
+                post_clean.send(sender=model, instance=component)
+            except ValidationError as e:
+                errors.append((component, e))
+            components.append(component)
+
+        return components, errors
+
+    def save_components(self, component_form, components):
+        """
+        Validate the uniqueness of new components copied from the given component form and save them, along with the
+        form's many-to-many assignments. Nothing is saved if any component is not unique; instead, a list of
+        (component, ValidationError) tuples is returned.
+        """
+        model = component_form._meta.model
+        exclude = component_form._get_validation_exclusions()
+
+        if get_defining_class(model, 'validate_unique') is Model:
+            errors = validate_unique((component, exclude) for component in components)
+        else:
+            errors = []
+            for component in components:
+                try:
+                    component.validate_unique(exclude=exclude)
+                except ValidationError as e:
+                    errors.append((component, e))
+        if errors:
+            return errors
+
+        m2m_values = {
+            field.name: list(component_form.cleaned_data[field.name])
+            for field in model._meta.many_to_many if component_form.cleaned_data.get(field.name)
+        }
+        if can_bulk_create(type(component_form)):
+            bulk_create_objects(components, m2m_values)
+        else:
+            for component in components:
+                component.save()
+                for field_name, value in m2m_values.items():
+                    getattr(component, field_name).set(value)
+
+        return []
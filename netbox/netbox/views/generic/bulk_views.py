@@ -1,3 +1,4 @@
+import json
 import logging
 import re
 from collections import defaultdict
@@ -5,26 +6,37 @@ from copy import deepcopy
 
 from django.contrib import messages
 from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.fields import ArrayField
 from django.core.exceptions import FieldDoesNotExist, ValidationError
 from django.db import transaction, IntegrityError
-from django.db.models import ManyToManyField, ProtectedError
+from django.db.models import F, Func, JSONField, ManyToManyField, Model, ProtectedError, TextField, Value
 from django.db.models.fields.reverse_related import ManyToManyRel
-from django.forms import Form, ModelMultipleChoiceField, MultipleHiddenInput
-from django.http import HttpResponse
+from django.db.models.functions import Cast
+from django.db.models.signals import post_save, pre_save
+from django.forms import BooleanField, Form, ModelMultipleChoiceField, MultipleHiddenInput
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
-from django_tables2.export import TableExport
+from django_rq.queues import get_connection
+from rq import Worker
 
+from extras.bulk import bulk_delete, get_defining_class, get_serialization_lookups, has_receivers, log_changes
+from extras.choices import ObjectChangeActionChoices
+from extras.exports import enqueue_export
+from extras.imports import BulkImporter, enqueue_import
 from extras.models import ExportTemplate
+from extras.search import cache_objects, get_indexed_models
 from extras.signals import clear_webhooks
+from netbox.models.features import CustomFieldsMixin
 from utilities.error_handlers import handle_protectederror
-from utilities.exceptions import PermissionsViolation
+from utilities.exceptions import AbortTransaction, PermissionsViolation
 from utilities.forms import (
     BootstrapMixin, BulkRenameForm, ConfirmationForm, CSVDataField, CSVFileField, restrict_form_fields,
 )
 from utilities.htmx import is_htmx
 from utilities.permissions import get_permission_for_model
+from utilities.utils import iterate_queryset, stream_csv
 from utilities.views import GetReturnURLMixin
-from .base import BaseMultiObjectView
+from .base import BaseMultiObjectView, ComponentCreateMixin
 
 __all__ = (
     'BulkComponentCreateView',
@@ -82,21 +94,20 @@ class ObjectListView(BaseMultiObjectView):
 
     def export_yaml(self):
         """
-        Export the queryset of objects as concatenated YAML documents.
+        Export the queryset of objects as concatenated YAML documents. Documents are yielded one at a time as objects
+        are retrieved from the database in chunks.
         """
-        yaml_data = [obj.to_yaml() for obj in self.queryset]
+        for i, obj in enumerate(iterate_queryset(self.queryset)):
+            yield f'---\n{obj.to_yaml()}' if i else obj.to_yaml()
 
-        return '---\n'.join(yaml_data)
-
-    def export_table(self, table, columns=None, filename=None):
+    @staticmethod
+    def get_export_exclude_columns(table, columns=None):
         """
-        Export all table data in CSV format.
+        Return the set of table columns to be omitted from a CSV export.
 
         Args:
             table: The Table instance to export
             columns: A list of specific columns to include. If None, all columns will be exported.
-            filename: The name of the file attachment sent to the client. If None, will be determined automatically
-                from the queryset model name.
         """
         exclude_columns = {'pk', 'actions'}
         if columns:
@@ -104,14 +115,29 @@ class ObjectListView(BaseMultiObjectView):
             exclude_columns.update({
                 col for col in all_columns if col not in columns
             })
-        exporter = TableExport(
-            export_format=TableExport.CSV,
-            table=table,
-            exclude_columns=exclude_columns
-        )
-        return exporter.response(
-            filename=filename or f'netbox_{self.queryset.model._meta.verbose_name_plural}.csv'
+        return exclude_columns
+
+    def export_table(self, table, columns=None, filename=None):
+        """
+        Export all table data in CSV format. The response is streamed to the client as rows are rendered, so that
+        large tables need not be held in memory.
+
+        Args:
+            table: The Table instance to export
+            columns: A list of specific columns to include. If None, all columns will be exported.
+            filename: The name of the file attachment sent to the client. If None, will be determined automatically
+                from the queryset model name.
+        """
+        exclude_columns = self.get_export_exclude_columns(table, columns)
+        filename = filename or f'netbox_{self.queryset.model._meta.verbose_name_plural}.csv'
+
+        response = StreamingHttpResponse(
+            stream_csv(table.iter_values(exclude_columns=exclude_columns)),
+            content_type='text/csv; charset=utf-8'
         )
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+
+        return response
 
     def export_template(self, template, request):
         """
@@ -130,6 +156,55 @@ class ObjectListView(BaseMultiObjectView):
             query_params.pop('export')
             return redirect(f'{request.path}?{query_params.urlencode()}')
 
+    def export_background(self, request, bulk_actions=True):
+        """
+        Enqueue a background job to export the current queryset, and redirect the user to the pending result. The
+        requested export (table, template, or all data) is determined as for a regular export.
+
+        Args:
+            request: The current request
+            bulk_actions: Passed through to get_table()
+        """
+        model = self.queryset.model
+        export = request.GET['export']
+
+        # Allow background exports only if an RQ worker process is running
+        if not Worker.count(get_connection('default')):
+            messages.error(request, "Unable to export in the background: RQ worker process not running.")
+            query_params = request.GET.copy()
+            query_params.pop('export')
+            query_params.pop('background', None)
+            return redirect(f'{request.path}?{query_params.urlencode()}')
+
+        # Export the current table view, or all columns if the model does not support YAML export
+        if export == 'table' or (not export and not hasattr(model, 'to_yaml')):
+            table = self.get_table(request, bulk_actions)
+            columns = [name for name, _ in table.selected_columns] if export == 'table' else None
+            job_result = enqueue_export(
+                self.queryset,
+                request.user,
+                f'netbox_{model._meta.verbose_name_plural}.csv',
+                table_class=self.table,
+                exclude_columns=self.get_export_exclude_columns(table, columns)
+            )
+
+        # Render an ExportTemplate
+        elif export:
+            content_type = ContentType.objects.get_for_model(model)
+            template = get_object_or_404(ExportTemplate, content_type=content_type, name=export)
+            job_result = enqueue_export(
+                self.queryset,
+                request.user,
+                template.get_filename(self.queryset),
+                export_template=template
+            )
+
+        # Export all data as YAML
+        else:
+            job_result = enqueue_export(self.queryset, request.user, f'netbox_{model._meta.verbose_name_plural}.yaml')
+
+        return redirect('extras:export_result', job_result_pk=job_result.pk)
+
     #
     # Request handlers
     #
@@ -158,6 +233,10 @@ class ObjectListView(BaseMultiObjectView):
 
         if 'export' in request.GET:
 
+            # Enqueue the export as a background job
+            if request.GET.get('background') and request.user.is_authenticated:
+                return self.export_background(request, has_bulk_actions)
+
             # Export the current table view
             if request.GET['export'] == 'table':
                 table = self.get_table(request, has_bulk_actions)
@@ -171,7 +250,7 @@ class ObjectListView(BaseMultiObjectView):
 
             # Check for YAML export support on the model
             elif hasattr(model, 'to_yaml'):
-                response = HttpResponse(self.export_yaml(), content_type='text/yaml')
+                response = StreamingHttpResponse(self.export_yaml(), content_type='text/yaml')
                 filename = 'netbox_{}.yaml'.format(self.queryset.model._meta.verbose_name_plural)
                 response['Content-Disposition'] = 'attachment; filename="{}"'.format(filename)
                 return response
@@ -331,6 +410,18 @@ class BulkImportView(GetReturnURLMixin, BaseMultiObjectView):
                 from_form=self.model_form,
                 required=False
             )
+            background = BooleanField(
+                required=False,
+                label="Import in background",
+                help_text="Import the data as a background job and track its progress (recommended for large imports)"
+            )
+            atomic = BooleanField(
+                required=False,
+                initial=True,
+                label="All or nothing",
+                help_text="Roll back a background import entirely if any row fails, rather than committing rows in "
+                          "chunks as they are imported"
+            )
 
             def clean(self):
                 csv_rows = self.cleaned_data['csv'][1] if 'csv' in self.cleaned_data else None
@@ -345,24 +436,34 @@ class BulkImportView(GetReturnURLMixin, BaseMultiObjectView):
 
         return ImportForm(*args, **kwargs)
 
+    def get_importer(self, request, headers):
+        """
+        Return a BulkImporter for creating objects from CSV records with the given headers.
+        """
+        # Objects are created in bulk where possible, unless _save_obj() has been overridden
+        save_obj = None
+        if type(self)._save_obj is not BulkImportView._save_obj:
+            def save_obj(obj_form):
+                return self._save_obj(obj_form, request)
+
+        return BulkImporter(self.model_form, headers, request.user, save_obj=save_obj)
+
     def _create_objects(self, form, request):
-        new_objs = []
-        if request.FILES:
-            headers, records = form.cleaned_data['csv_file']
-        else:
-            headers, records = form.cleaned_data['csv']
+        field_name = 'csv_file' if request.FILES else 'csv'
+        headers, records = form.cleaned_data[field_name]
 
-        for row, data in enumerate(records, start=1):
-            obj_form = self.model_form(data, headers=headers)
-            restrict_form_fields(obj_form, request.user)
+        # Records from an uploaded file are parsed as they are imported, so any malformed row is reported here
+        importer = self.get_importer(request, headers)
+        try:
+            new_objs = importer.run(records)
+        except ValidationError as e:
+            form.add_error(field_name, e)
+            raise ValidationError("")
 
-            if obj_form.is_valid():
-                obj = self._save_obj(obj_form, request)
-                new_objs.append(obj)
-            else:
-                for field, err in obj_form.errors.items():
-                    form.add_error('csv', f'Row {row} {field}: {err[0]}')
-                raise ValidationError("")
+        if importer.errors:
+            for row, field, err in importer.errors:
+                form.add_error('csv', f'Row {row} {field}: {err}')
+            raise ValidationError("")
 
         return new_objs
 
@@ -393,7 +494,19 @@ class BulkImportView(GetReturnURLMixin, BaseMultiObjectView):
         logger = logging.getLogger('netbox.views.BulkImportView')
         form = self._import_form(request.POST, request.FILES)
 
-        if form.is_valid():
+        if form.is_valid() and form.cleaned_data['background']:
+            logger.debug("Form validation was successful")
+
+            # Allow background imports only if an RQ worker process is running
+            if not Worker.count(get_connection('default')):
+                form.add_error('background', "Unable to import in the background: RQ worker process not running.")
+            else:
+                csv_data = request.FILES['csv_file'] if request.FILES else form.data['csv'].strip()
+                job_result = enqueue_import(type(self), request, csv_data, atomic=form.cleaned_data['atomic'])
+
+                return redirect('extras:import_result', job_result_pk=job_result.pk)
+
+        elif form.is_valid():
             logger.debug("Form validation was successful")
 
             try:
@@ -454,6 +567,110 @@ class BulkEditView(GetReturnURLMixin, BaseMultiObjectView):
     def get_required_permission(self):
         return get_permission_for_model(self.queryset.model, 'change')
 
+    def _get_bulk_update_values(self, form, nullified_fields):
+        """
+        Return a two-tuple of the model field values and custom field values to be set on all selected objects, or
+        None if the changes cannot be applied to all objects at once. This is possible only if the edited fields are
+        plain concrete columns which are not subject to uniqueness constraints, and the model has no custom save or
+        validation logic (which needs to be applied to each object individually).
+        """
+        model = self.queryset.model
+        custom_fields = getattr(form, 'custom_fields', [])
+
+        if form.cleaned_data.get('add_tags') or form.cleaned_data.get('remove_tags'):
+            return None
+        if get_defining_class(model, 'save') is not Model or model._meta.parents:
+            return None
+        if has_receivers(pre_save, model) or has_receivers(post_save, model):
+            return None
+        if get_defining_class(model, 'clean') not in (Model, CustomFieldsMixin):
+            return None
+
+        values = {}
+        for name in form.fields:
+            if name in custom_fields or name in ('pk', 'add_tags', 'remove_tags'):
+                continue
+            nullify = name in form.nullable_fields and name in nullified_fields
+            if not nullify and name not in form.changed_data:
+                continue
+            try:
+                model_field = model._meta.get_field(name)
+            except FieldDoesNotExist:
+                return None
+            if not model_field.concrete or model_field.many_to_many or model_field.primary_key:
+                return None
+            if nullify:
+                values[name] = None if model_field.null else ''
+            else:
+                values[name] = form.cleaned_data[name]
+
+        unique_checks, _ = model()._get_unique_checks()
+        if any(set(values).intersection(fields) for _, fields in unique_checks):
+            return None
+
+        custom_field_values = {}
+        for name in custom_fields:
+            if name in form.nullable_fields and name in nullified_fields:
+                custom_field_values[name[3:]] = None
+            elif name in form.changed_data:
+                custom_field_values[name[3:]] = form.fields[name].prepare_value(form.cleaned_data[name])
+
+        return values, custom_field_values
+
+    def _bulk_update_objects(self, form, values, custom_field_values):
+        """
+        Apply the same changes to all selected objects using a single UPDATE query. Field values are validated against
+        one of the objects, while model validation (including custom validators) runs on every object. Changelog
+        records are created in bulk.
+        """
+        model = self.queryset.model
+        objects = list(
+            self.queryset.filter(pk__in=form.cleaned_data['pk']).prefetch_related(*get_serialization_lookups(model))
+        )
+        if not objects:
+            return []
+
+        # Set any auto-updated fields (e.g. last_updated), as update() does not
+        for model_field in model._meta.concrete_fields:
+            if getattr(model_field, 'auto_now', False):
+                values[model_field.name] = model_field.pre_save(objects[0], add=False)
+
+        for obj in objects:
+            if hasattr(obj, 'snapshot'):
+                obj.snapshot()
+            for name, value in values.items():
+                setattr(obj, name, value)
+            if custom_field_values:
+                obj.custom_field_data.update(custom_field_values)
+
+        # Field values are validated independently of the objects they are set on, so validating one object suffices.
+        # Model validation (including custom fields and custom validators) depends on each object, however.
+        objects[0].clean_fields(exclude=[f.name for f in model._meta.fields if f.name not in values])
+        for obj in objects:
+            obj.clean()
+
+        updates = dict(values)
+        if custom_field_values:
+            encoder = model._meta.get_field('custom_field_data').encoder
+            expression = F('custom_field_data')
+            for name, value in custom_field_values.items():
+                expression = Func(
+                    expression,
+                    Value([name], output_field=ArrayField(TextField())),
+                    Cast(Value(json.dumps(value, cls=encoder)), output_field=JSONField()),
+                    function='jsonb_set',
+                    output_field=JSONField()
+                )
+            updates['custom_field_data'] = expression
+        model._default_manager.filter(pk__in=[obj.pk for obj in objects]).update(**updates)
+
+        log_changes(objects, ObjectChangeActionChoices.ACTION_UPDATE)
+        indexed_fields = get_indexed_models().get(model, [])
+        if any(name in values for name, _ in indexed_fields):
+            cache_objects(objects)
+
+        return objects
+
     def _update_objects(self, form, request):
         custom_fields = getattr(form, 'custom_fields', [])
         standard_fields = [
@@ -462,6 +679,11 @@ class BulkEditView(GetReturnURLMixin, BaseMultiObjectView):
         nullified_fields = request.POST.getlist('_nullify')
         updated_objects = []
 
+        # Apply simple changes to all objects at once where possible
+        bulk_update_values = self._get_bulk_update_values(form, nullified_fields)
+        if bulk_update_values is not None:
+            return self._bulk_update_objects(form, *bulk_update_values)
+
         for obj in self.queryset.filter(pk__in=form.cleaned_data['pk']):
 
             # Take a snapshot of change-logged models
@@ -710,6 +932,28 @@ class BulkDeleteView(GetReturnURLMixin, BaseMultiObjectView):
 
         return BulkDeleteForm
 
+    def _delete_objects(self, queryset):
+        """
+        Delete the objects in the queryset. Unless the model overrides delete(), the objects and their dependents are
+        deleted together using bulk_delete(); otherwise each object is deleted in turn.
+        """
+        model = queryset.model
+
+        if get_defining_class(model, 'delete') is Model:
+            objects = list(queryset.prefetch_related(*get_serialization_lookups(model)))
+            for obj in objects:
+                # Take a snapshot of change-logged models
+                if hasattr(obj, 'snapshot'):
+                    obj.snapshot()
+            bulk_delete(objects)
+            return
+
+        for obj in queryset:
+            # Take a snapshot of change-logged models
+            if hasattr(obj, 'snapshot'):
+                obj.snapshot()
+            obj.delete()
+
     #
     # Request handlers
     #
@@ -741,11 +985,7 @@ class BulkDeleteView(GetReturnURLMixin, BaseMultiObjectView):
                 queryset = self.queryset.filter(pk__in=pk_list)
                 deleted_count = queryset.count()
                 try:
-                    for obj in queryset:
-                        # Take a snapshot of change-logged models
-                        if hasattr(obj, 'snapshot'):
-                            obj.snapshot()
-                        obj.delete()
+                    self._delete_objects(queryset)
                 except ProtectedError as e:
                     logger.info("Caught ProtectedError while attempting to delete objects")
                     handle_protectederror(queryset, request, e)
@@ -784,7 +1024,7 @@ class BulkDeleteView(GetReturnURLMixin, BaseMultiObjectView):
 # Device/VirtualMachine components
 #
 
-class BulkComponentCreateView(GetReturnURLMixin, BaseMultiObjectView):
+class BulkComponentCreateView(GetReturnURLMixin, ComponentCreateMixin, BaseMultiObjectView):
     """
     Add one or more components (e.g. interfaces, console ports, etc.) to a set of Devices or VirtualMachines.
     """
@@ -792,7 +1032,6 @@ class BulkComponentCreateView(GetReturnURLMixin, BaseMultiObjectView):
     parent_model = None
     parent_field = None
     form = None
-    model_form = None
     filterset = None
     table = None
 
@@ -825,37 +1064,49 @@ class BulkComponentCreateView(GetReturnURLMixin, BaseMultiObjectView):
                 new_components = []
                 data = deepcopy(form.cleaned_data)
 
+                names = data['name_pattern']
+                labels = data['label_pattern'] if 'label_pattern' in data else None
+                patterned_values = [
+                    {'name': name, 'label': labels[i]} if labels else {'name': name}
+                    for i, name in enumerate(names)
+                ]
+
+                # Validate a single component form for each parent object, from which all of its components are copied
+                for obj in data['pk']:
+                    component_data = {
+                        self.parent_field: obj.pk,
+                        'name': names[0],
+                        'label': labels[0] if labels else None,
+                    }
+                    component_data.update(data)
+                    component_form = self.get_component_form(component_data)
+                    if not component_form.is_valid():
+                        for field, errors in component_form.errors.as_data().items():
+                            for e in errors:
+                                form.add_error(field, '{}: {}'.format(obj, ', '.join(e)))
+                        continue
+
+                    components, errors = self.build_components(component_form, patterned_values)
+                    for component, e in errors:
+                        form.add_error(None, '{} {}: {}'.format(obj, component.name, ', '.join(e.messages)))
+                    new_components.extend(components)
+
                 try:
                     with transaction.atomic():
-
-                        for obj in data['pk']:
-
-                            names = data['name_pattern']
-                            labels = data['label_pattern'] if 'label_pattern' in data else None
-                            for i, name in enumerate(names):
-                                label = labels[i] if labels else None
-
-                                component_data = {
-                                    self.parent_field: obj.pk,
-                                    'name': name,
-                                    'label': label
-                                }
-                                component_data.update(data)
-                                component_form = self.model_form(component_data)
-                                if component_form.is_valid():
-                                    instance = component_form.save()
-                                    logger.debug(f"Created {instance} on {instance.parent_object}")
-                                    new_components.append(instance)
-                                else:
-                                    for field, errors in component_form.errors.as_data().items():
-                                        for e in errors:
-                                            form.add_error(field, '{} {}: {}'.format(obj, name, ', '.join(e)))
+                        if not form.errors:
+                            for component, e in self.save_components(component_form, new_components):
+                                form.add_error(None, '{} {}: {}'.format(
+                                    component.parent_object, component.name, ', '.join(e.messages)
+                                ))
+                        if form.errors:
+                            raise AbortTransaction()
+                        logger.debug(f"Created {len(new_components)} {model_name}")
 
                         # Enforce object-level permissions
                         if self.queryset.filter(pk__in=[obj.pk for obj in new_components]).count() != len(new_components):
                             raise PermissionsViolation
 
-                except IntegrityError:
+                except (AbortTransaction, IntegrityError):
                     clear_webhooks.send(sender=self)
 
                 except PermissionsViolation:
@@ -19,7 +19,7 @@ from utilities.htmx import is_htmx
 from utilities.permissions import get_permission_for_model
 from utilities.utils import get_viewname, normalize_querydict, prepare_cloned_fields
 from utilities.views import GetReturnURLMixin
-from .base import BaseObjectView
+from .base import BaseObjectView, ComponentCreateMixin
 
 __all__ = (
     'ComponentCreateView',
@@ -516,13 +516,12 @@ class ObjectDeleteView(GetReturnURLMixin, BaseObjectView):
 # Device/VirtualMachine components
 #
 
-class ComponentCreateView(GetReturnURLMixin, BaseObjectView):
+class ComponentCreateView(GetReturnURLMixin, ComponentCreateMixin, BaseObjectView):
     """
     Add one or more components (e.g. interfaces, console ports, etc.) to a Device or VirtualMachine.
     """
     template_name = 'dcim/component_create.html'
     form = None
-    model_form = None
     patterned_fields = ('name', 'label')
 
     def get_required_permission(self):
@@ -561,34 +560,49 @@ class ComponentCreateView(GetReturnURLMixin, BaseObjectView):
         instance = self.alter_object(self.queryset.model(), request)
 
         if form.is_valid():
-            new_components = []
             data = deepcopy(request.POST)
             pattern_count = len(form.cleaned_data[f'{self.patterned_fields[0]}_pattern'])
-
-            for i in range(pattern_count):
-                for field_name in self.patterned_fields:
-                    if form.cleaned_data.get(f'{field_name}_pattern'):
-                        data[field_name] = form.cleaned_data[f'{field_name}_pattern'][i]
-
-                if hasattr(form, 'get_iterative_data'):
+            patterned_values = [
+                {
+                    field_name: form.cleaned_data[f'{field_name}_pattern'][i]
+                    for field_name in self.patterned_fields if form.cleaned_data.get(f'{field_name}_pattern')
+                } for i in range(pattern_count)
+            ]
+
+            errors = []
+            if hasattr(form, 'get_iterative_data'):
+                # Components differ by more than their patterned values, so each is validated by its own form
+                new_components = []
+                for i, values in enumerate(patterned_values):
+                    for field_name, value in values.items():
+                        data[field_name] = value
                     data.update(form.get_iterative_data(i))
-
-                component_form = self.model_form(data)
-
+                    component_form = self.get_component_form(data)
+                    if not component_form.is_valid():
+                        break
+                    new_components.append(component_form.instance)
+            else:
+                for field_name, value in patterned_values[0].items():
+                    data[field_name] = value
+                component_form = self.get_component_form(data)
                 if component_form.is_valid():
-                    new_components.append(component_form)
+                    new_components, errors = self.build_components(component_form, patterned_values)
+
+            for component, e in errors:
+                form.add_error(None, f'{component}: {", ".join(e.messages)}')
 
             if not form.errors and not component_form.errors:
                 try:
                     with transaction.atomic():
                         # Create the new components
-                        new_objs = []
-                        for component_form in new_components:
-                            obj = component_form.save()
-                            new_objs.append(obj)
+                        for component, e in self.save_components(component_form, new_components):
+                            form.add_error(None, f'{component}: {", ".join(e.messages)}')
+                        if form.errors:
+                            raise AbortTransaction()
 
                         # Enforce object-level permissions
-                        if self.queryset.filter(pk__in=[obj.pk for obj in new_objs]).count() != len(new_objs):
+                        new_pks = [obj.pk for obj in new_components]
+                        if self.queryset.filter(pk__in=new_pks).count() != len(new_components):
                             raise PermissionsViolation
 
                         messages.success(request, "Added {} {}".format(
@@ -601,6 +615,9 @@ class ComponentCreateView(GetReturnURLMixin, BaseObjectView):
                         else:
                             return redirect(self.get_return_url(request))
 
+                except AbortTransaction:
+                    clear_webhooks.send(sender=self)
+
                 except PermissionsViolation:
                     msg = "Component creation failed due to object-level permissions violation"
                     logger.debug(msg)
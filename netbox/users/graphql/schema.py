@@ -1,12 +1,14 @@
 import graphene
 
-from netbox.graphql.fields import ObjectField, ObjectListField
+from netbox.graphql.fields import ObjectConnectionField, ObjectField, ObjectListField
 from .types import *
 
 
 class UsersQuery(graphene.ObjectType):
     group = ObjectField(GroupType)
     group_list = ObjectListField(GroupType)
+    group_connection = ObjectConnectionField(GroupType)
 
     user = ObjectField(UserType)
     user_list = ObjectListField(UserType)
+    user_connection = ObjectConnectionField(UserType)
@@ -67,3 +67,30 @@ HTTP_REQUEST_META_SAFE_COPY = [
     'SERVER_NAME',
     'SERVER_PORT',
 ]
+
+
+#
+# Exports
+#
+
+# Number of objects to retrieve from the database at a time when streaming exports
+EXPORT_CHUNK_SIZE = 1000
+
+# Approximate number of characters of rendered export output to send to the client at a time
+EXPORT_BUFFER_SIZE = 65536
+
+
+#
+# Imports
+#
+
+# Number of CSV rows to validate and create at a time when importing objects in bulk
+IMPORT_CHUNK_SIZE = 1000
+
+
+#
+# Natural ordering
+#
+
+# Maximum number of distinct values for which each NaturalOrderingField retains its naturalized values
+NATURALIZE_CACHE_SIZE = 4096
@@ -1,6 +1,9 @@
+from functools import lru_cache
+
 from django.core.validators import RegexValidator
 from django.db import models
 
+from utilities.constants import NATURALIZE_CACHE_SIZE
 from utilities.ordering import naturalize
 from .forms import ColorSelect
 
@@ -52,12 +55,16 @@ class NaturalOrderingField(models.CharField):
         self.naturalize_function = naturalize_function
         super().__init__(*args, **kwargs)
 
+        # Naturalized values are cached, as the same values commonly recur across many objects being saved together
+        # (e.g. the interface names created on each of many devices)
+        self._naturalize = lru_cache(maxsize=NATURALIZE_CACHE_SIZE)(naturalize_function)
+
     def pre_save(self, model_instance, add):
         """
         Generate a naturalized value from the target field
         """
         original_value = getattr(model_instance, self.target_field)
-        naturalized_value = self.naturalize_function(original_value, max_length=self.max_length)
+        naturalized_value = self._naturalize(original_value, max_length=self.max_length)
         setattr(model_instance, self.attname, naturalized_value)
 
         return naturalized_value
@@ -1,3 +1,4 @@
+import codecs
 import csv
 from io import StringIO
 
@@ -7,7 +8,7 @@ from django.core.exceptions import MultipleObjectsReturned, ObjectDoesNotExist
 from django.db.models import Q
 
 from utilities.choices import unpack_grouped_choices
-from utilities.forms.utils import parse_csv, validate_csv
+from utilities.forms.utils import iter_csv, parse_csv, validate_csv
 from utilities.utils import content_type_identifier
 
 __all__ = (
@@ -69,8 +70,9 @@ class CSVFileField(forms.FileField):
     """
     A FileField (rendered as a file input button) which accepts a file containing CSV-formatted data. It returns
     data as a two-tuple: The first item is a dictionary of column headers, mapping field names to the attribute
-    by which they match a related object (where applicable). The second item is a list of dictionaries, each
-    representing a discrete row of CSV data.
+    by which they match a related object (where applicable). The second item is an iterator of dictionaries, each
+    representing a discrete row of CSV data. The file is decoded and parsed incrementally as the iterator is
+    consumed, so rows are never all held in memory at once; any malformed row raises a ValidationError when reached.
 
     :param from_form: The form from which the field derives its validation rules.
     """
@@ -90,11 +92,11 @@ class CSVFileField(forms.FileField):
         if file is None:
             return None
 
-        csv_str = file.read().decode('utf-8').strip()
-        reader = csv.reader(StringIO(csv_str))
-        headers, records = parse_csv(reader)
-
-        return headers, records
+        try:
+            reader = csv.reader(codecs.iterdecode(file, 'utf-8'))
+            return iter_csv(reader)
+        except UnicodeDecodeError:
+            raise forms.ValidationError("Invalid data: CSV files must be encoded as UTF-8")
 
     def validate(self, value):
         if value is None:
@@ -140,12 +142,28 @@ class CSVTypedChoiceField(forms.TypedChoiceField):
 class CSVModelChoiceField(forms.ModelChoiceField):
     """
     Extends Django's `ModelChoiceField` to provide additional validation for CSV values.
+
+    `resolved_objects` may be set to a dictionary mapping raw values to the lists of matching objects, which have
+    been retrieved in bulk for many rows (see extras.imports.BulkImporter). Values absent from the dictionary are
+    looked up individually.
     """
     default_error_messages = {
         'invalid_choice': 'Object not found.',
     }
+    resolved_objects = None
 
     def to_python(self, value):
+        if self.resolved_objects is not None and value in self.resolved_objects:
+            objects = self.resolved_objects[value]
+            if not objects:
+                raise forms.ValidationError(
+                    self.error_messages['invalid_choice'], code='invalid_choice', params={'value': value}
+                )
+            if len(objects) > 1:
+                raise forms.ValidationError(
+                    f'"{value}" is not a unique value for this field; multiple objects were found'
+                )
+            return objects[0]
         try:
             return super().to_python(value)
         except MultipleObjectsReturned:
@@ -16,6 +16,7 @@ __all__ = (
     'get_selected_values',
     'parse_alphanumeric_range',
     'parse_numeric_range',
+    'iter_csv',
     'restrict_form_fields',
     'parse_csv',
     'validate_csv',
@@ -188,31 +189,51 @@ def parse_csv(reader):
     Parse a csv_reader object into a headers dictionary and a list of records dictionaries. Raise an error
     if the records are formatted incorrectly. Return headers and records as a tuple.
     """
-    records = []
+    headers, records = iter_csv(reader)
+
+    return headers, list(records)
+
+
+def iter_csv(reader):
+    """
+    Parse a csv_reader object into a headers dictionary and an iterator of records dictionaries, returned as a tuple.
+    Only the column headers are consumed immediately; each record is parsed as the iterator is consumed, raising an
+    error if it is formatted incorrectly. Empty lines are ignored.
+    """
     headers = {}
 
     # Consume the first line of CSV data as column headers. Create a dictionary mapping each header to an optional
     # "to" field specifying how the related object is being referenced. For example, importing a Device might use a
     # `site.slug` header, to indicate the related site is being referenced by its slug.
 
-    for header in next(reader):
+    for header in next(filter(None, reader), []):
         if '.' in header:
             field, to_field = header.split('.', 1)
             headers[field] = to_field
         else:
             headers[header] = None
 
-    # Parse CSV rows into a list of dictionaries mapped from the column headers.
-    for i, row in enumerate(reader, start=1):
-        if len(row) != len(headers):
-            raise forms.ValidationError(
-                f"Row {i}: Expected {len(headers)} columns but found {len(row)}"
-            )
-        row = [col.strip() for col in row]
-        record = dict(zip(headers.keys(), row))
-        records.append(record)
-
-    return headers, records
+    return headers, _iter_csv_records(reader, headers)
+
+
+def _iter_csv_records(reader, headers):
+    """
+    Parse CSV rows into dictionaries mapped from the column headers.
+    """
+    i = 0
+    try:
+        for row in reader:
+            if not row:
+                continue
+            i += 1
+            if len(row) != len(headers):
+                raise forms.ValidationError(
+                    f"Row {i}: Expected {len(headers)} columns but found {len(row)}"
+                )
+            row = [col.strip() for col in row]
+            yield dict(zip(headers.keys(), row))
+    except UnicodeDecodeError:
+        raise forms.ValidationError(f"Row {i + 1}: Invalid data (CSV files must be encoded as UTF-8)")
 
 
 def validate_csv(headers, fields, required_fields):
@@ -0,0 +1,26 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db.models import Func
+from django.db.models.functions import Upper
+
+__all__ = (
+    'text_trigram_index',
+    'trigram_index',
+)
+
+
+def trigram_index(field_name, name):
+    """
+    Return a trigram (pg_trgm) GIN index supporting case-insensitive substring lookups (e.g. icontains) on a field.
+    Django renders icontains as UPPER(field::text) LIKE UPPER(%s), so the index is built on the same expression to
+    make it usable by the query planner.
+    """
+    return GinIndex(OpClass(Upper(field_name), name='gin_trgm_ops'), name=name)
+
+
+def text_trigram_index(field_name, name):
+    """
+    Return a trigram (pg_trgm) GIN index on the text representation of a network address field. The string lookups
+    of IPNetworkField and IPAddressField (e.g. istartswith) are rendered as TEXT(field) LIKE %s, which this index
+    supports.
+    """
+    return GinIndex(OpClass(Func(field_name, function='TEXT'), name='gin_trgm_ops'), name=name)
@@ -1,7 +1,9 @@
+from collections import defaultdict
+
 from mptt.managers import TreeManager as TreeManager_
 from mptt.querysets import TreeQuerySet as TreeQuerySet_
 
-from django.db.models import Manager
+from django.db.models import Manager, Max
 from .querysets import RestrictedQuerySet
 
 
@@ -16,4 +18,42 @@ class TreeManager(Manager.from_queryset(TreeQuerySet), TreeManager_):
     """
     Extend django-mptt's TreeManager to incorporate RestrictedQuerySet().
     """
-    pass
+    def bulk_create_trees(self, objs):
+        """
+        Create one or more new trees of objects, calculating their MPTT attributes in memory and inserting them with a
+        single bulk_create() per tree level. `objs` must include every node of each new tree, with the parent of each
+        node (if any) being one of the other unsaved objects. Children are ordered after their preceding siblings.
+        """
+        opts = self.model._mptt_meta
+        roots = []
+        children = defaultdict(list)
+        for obj in objs:
+            parent = getattr(obj, opts.parent_attr)
+            if parent is None:
+                roots.append(obj)
+            else:
+                children[id(parent)].append(obj)
+
+        levels = defaultdict(list)
+
+        def build(node, tree_id, level, left):
+            setattr(node, opts.tree_id_attr, tree_id)
+            setattr(node, opts.level_attr, level)
+            setattr(node, opts.left_attr, left)
+            levels[level].append(node)
+            right = left + 1
+            for child in children[id(node)]:
+                right = build(child, tree_id, level + 1, right) + 1
+            setattr(node, opts.right_attr, right)
+            return right
+
+        # Each new tree is assigned the next available tree ID
+        max_tree_id = self.model._default_manager.aggregate(max_tree_id=Max(opts.tree_id_attr))['max_tree_id']
+        for tree_id, root in enumerate(roots, start=(max_tree_id or 0) + 1):
+            build(root, tree_id, 0, 1)
+
+        # Parents must be saved before their children can reference them
+        for level in sorted(levels):
+            self.bulk_create(levels[level])
+
+        return objs
@@ -87,6 +87,7 @@ def export_button(context, model):
 
     return {
         'perms': context['perms'],
+        'user': user,
         'content_type': content_type,
         'url_params': context['request'].GET.urlencode() if context['request'].GET else '',
         'export_templates': export_templates,
@@ -516,6 +516,61 @@ class APIViewTestCases:
             self.assertNotIn('errors', data)
             self.assertGreater(len(data['data'][field_name]), 0)
 
+        @override_settings(LOGIN_REQUIRED=True)
+        def test_graphql_list_objects_paginated(self):
+            url = reverse('graphql')
+            field_name = f'{self._get_graphql_base_name()}_list'
+            query = self._build_query(field_name, limit=1, offset=1)
+
+            # Add object-level permission
+            obj_perm = ObjectPermission(
+                name='Test permission',
+                actions=['view']
+            )
+            obj_perm.save()
+            obj_perm.users.add(self.user)
+            obj_perm.object_types.add(ContentType.objects.get_for_model(self.model))
+
+            response = self.client.post(url, data={'query': query}, **self.header)
+            self.assertHttpStatus(response, status.HTTP_200_OK)
+            data = json.loads(response.content)
+            self.assertNotIn('errors', data)
+            self.assertEqual(len(data['data'][field_name]), 1)
+
+        @override_settings(LOGIN_REQUIRED=True)
+        def test_graphql_connection(self):
+            url = reverse('graphql')
+            field_name = f'{self._get_graphql_base_name()}_connection'
+            query = f"""
+            {{
+                {field_name}(first: 2) {{
+                    total_count
+                    pageInfo {{ hasNextPage endCursor }}
+                    edges {{ cursor node {{ id }} }}
+                }}
+            }}
+            """
+
+            # Add object-level permission
+            obj_perm = ObjectPermission(
+                name='Test permission',
+                actions=['view']
+            )
+            obj_perm.save()
+            obj_perm.users.add(self.user)
+            obj_perm.object_types.add(ContentType.objects.get_for_model(self.model))
+
+            response = self.client.post(url, data={'query': query}, **self.header)
+            self.assertHttpStatus(response, status.HTTP_200_OK)
+            data = json.loads(response.content)
+            self.assertNotIn('errors', data)
+            connection = data['data'][field_name]
+            count = self._get_queryset().count()
+            self.assertEqual(connection['total_count'], count)
+            self.assertEqual(len(connection['edges']), min(count, 2))
+            self.assertEqual(connection['pageInfo']['hasNextPage'], count > 2)
+            self.assertEqual(connection['pageInfo']['endCursor'], connection['edges'][-1]['cursor'])
+
     class APIViewTestCase(
         GetObjectViewTestCase,
         ListObjectsViewTestCase,
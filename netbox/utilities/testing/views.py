@@ -1,3 +1,6 @@
+import csv
+import io
+
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ObjectDoesNotExist
 from django.test import override_settings
@@ -457,6 +460,11 @@ class ViewTestCases:
             self.assertHttpStatus(response, 200)
             self.assertEqual(response.get('Content-Type'), 'text/csv; charset=utf-8')
 
+            # Streamed CSV should include a header row followed by one row per object
+            content = b''.join(response.streaming_content).decode('utf-8')
+            rows = list(csv.reader(io.StringIO(content)))
+            self.assertEqual(len(rows), self._get_queryset().count() + 1)
+
     class CreateMultipleObjectsViewTestCase(ModelViewTestCase):
         """
         Create multiple instances using a single form. Expects the creation of three new instances by default.
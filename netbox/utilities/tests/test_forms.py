@@ -1,8 +1,9 @@
 from django import forms
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import TestCase
 
 from ipam.forms import IPAddressCSVForm
-from utilities.forms.fields import CSVDataField
+from utilities.forms.fields import CSVDataField, CSVFileField
 from utilities.forms.utils import expand_alphanumeric_pattern, expand_ipaddress_pattern
 
 
@@ -365,3 +366,38 @@ class CSVDataFieldTest(TestCase):
         """
         with self.assertRaises(forms.ValidationError):
             self.field.clean(input)
+
+
+class CSVFileFieldTest(TestCase):
+
+    def setUp(self):
+        self.field = CSVFileField(from_form=IPAddressCSVForm)
+
+    def test_clean(self):
+        csv_file = SimpleUploadedFile(
+            'ipaddresses.csv',
+            b'address,status,vrf.rd\n192.0.2.1/32,Active,123:456\n\n"192.0.2.2/32",Reserved,\n'
+        )
+        headers, records = self.field.clean(csv_file)
+
+        self.assertEqual(headers, {'address': None, 'status': None, 'vrf': 'rd'})
+        self.assertEqual(list(records), [
+            {'address': '192.0.2.1/32', 'status': 'Active', 'vrf': '123:456'},
+            {'address': '192.0.2.2/32', 'status': 'Reserved', 'vrf': ''},
+        ])
+
+    def test_clean_invalid_header(self):
+        csv_file = SimpleUploadedFile('ipaddresses.csv', b'address,status,foo\n192.0.2.1/32,Active,Bar\n')
+
+        # Column headers are validated before any rows are parsed
+        with self.assertRaises(forms.ValidationError):
+            self.field.clean(csv_file)
+
+    def test_clean_invalid_row(self):
+        csv_file = SimpleUploadedFile('ipaddresses.csv', b'address,status\n192.0.2.1/32,Active\n192.0.2.2/32\n')
+        headers, records = self.field.clean(csv_file)
+
+        # Malformed rows are reported as they are reached
+        self.assertEqual(next(records), {'address': '192.0.2.1/32', 'status': 'Active'})
+        with self.assertRaisesMessage(forms.ValidationError, 'Row 2: Expected 2 columns but found 1'):
+            next(records)
@@ -1,4 +1,6 @@
+import csv
 import datetime
+import io
 import json
 from collections import OrderedDict
 from decimal import Decimal
@@ -6,7 +8,7 @@ from itertools import count, groupby
 
 import bleach
 from django.core.serializers import serialize
-from django.db.models import Count, OuterRef, Subquery
+from django.db.models import Count, OuterRef, Subquery, prefetch_related_objects
 from django.db.models.functions import Coalesce
 from django.http import QueryDict
 from jinja2.sandbox import SandboxedEnvironment
@@ -16,7 +18,7 @@ from dcim.choices import CableLengthUnitChoices
 from extras.plugins import PluginConfig
 from extras.utils import is_taggable
 from netbox.config import get_config
-from utilities.constants import HTTP_REQUEST_META_SAFE_COPY
+from utilities.constants import EXPORT_CHUNK_SIZE, HTTP_REQUEST_META_SAFE_COPY
 
 
 def get_viewname(model, action=None, rest_api=False):
@@ -82,6 +84,79 @@ def csv_format(data):
     return ','.join(csv)
 
 
+def iterate_queryset(queryset, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Iterate over the objects in a QuerySet, retrieving them from the database in chunks rather than loading the entire
+    result set into memory. Any related objects specified by prefetch_related() are fetched for each chunk.
+
+    :param queryset: The QuerySet to iterate
+    :param chunk_size: The number of objects to retrieve per chunk
+    """
+    prefetch_lookups = queryset._prefetch_related_lookups
+    chunk = []
+
+    # QuerySet.iterator() ignores prefetch_related() prior to Django 4.1, so prefetching is applied to each chunk here
+    for obj in queryset.iterator(chunk_size=chunk_size):
+        chunk.append(obj)
+        if len(chunk) == chunk_size:
+            if prefetch_lookups:
+                prefetch_related_objects(chunk, *prefetch_lookups)
+            yield from chunk
+            chunk = []
+
+    if chunk:
+        if prefetch_lookups:
+            prefetch_related_objects(chunk, *prefetch_lookups)
+        yield from chunk
+
+
+class ChunkedQuerySet:
+    """
+    Wrap a QuerySet so that iterating over it retrieves objects from the database in chunks (see iterate_queryset()).
+    All other attributes are passed through to the underlying QuerySet. This allows a QuerySet to be passed to a
+    template without the entire result set being loaded into memory.
+    """
+    def __init__(self, queryset, chunk_size=EXPORT_CHUNK_SIZE):
+        self.queryset = queryset
+        self.chunk_size = chunk_size
+
+    def __iter__(self):
+        return iterate_queryset(self.queryset, chunk_size=self.chunk_size)
+
+    def __len__(self):
+        return self.queryset.count()
+
+    def __bool__(self):
+        return self.queryset.exists()
+
+    def __getitem__(self, key):
+        return self.queryset[key]
+
+    def __getattr__(self, item):
+        return getattr(self.queryset, item)
+
+
+def stream_csv(rows, buffer_size=EXPORT_CHUNK_SIZE):
+    """
+    Render an iterable of rows as CSV, yielding the output in blocks of up to buffer_size rows.
+
+    :param rows: An iterable of rows, each of which is a list of values
+    :param buffer_size: The maximum number of rows to render per block of output
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    for i, row in enumerate(rows, start=1):
+        writer.writerow(row)
+        if i % buffer_size == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
 def foreground_color(bg_color, dark='000000', light='ffffff'):
     """
     Return the ideal foreground color (dark or light) for a given background color in hexadecimal RGB format.
@@ -264,6 +339,16 @@ def render_jinja2(template_code, context):
     return environment.from_string(source=template_code).render(**context)
 
 
+def render_jinja2_stream(template_code, context):
+    """
+    Render a Jinja2 template with the provided context. Return an iterator which yields the rendered content piece by
+    piece as it is generated. (Any syntax errors in the template are raised immediately.)
+    """
+    environment = SandboxedEnvironment()
+    environment.filters.update(get_config().JINJA2_FILTERS)
+    return environment.from_string(source=template_code).generate(**context)
+
+
 def prepare_cloned_fields(instance):
     """
     Compile an object's `clone_fields` list into a string of URL query parameters. Tags are automatically cloned where
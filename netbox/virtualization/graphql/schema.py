@@ -1,21 +1,26 @@
 import graphene
 
-from netbox.graphql.fields import ObjectField, ObjectListField
+from netbox.graphql.fields import ObjectConnectionField, ObjectField, ObjectListField
 from .types import *
 
 
 class VirtualizationQuery(graphene.ObjectType):
     cluster = ObjectField(ClusterType)
     cluster_list = ObjectListField(ClusterType)
+    cluster_connection = ObjectConnectionField(ClusterType)
 
     cluster_group = ObjectField(ClusterGroupType)
     cluster_group_list = ObjectListField(ClusterGroupType)
+    cluster_group_connection = ObjectConnectionField(ClusterGroupType)
 
     cluster_type = ObjectField(ClusterTypeType)
     cluster_type_list = ObjectListField(ClusterTypeType)
+    cluster_type_connection = ObjectConnectionField(ClusterTypeType)
 
     virtual_machine = ObjectField(VirtualMachineType)
     virtual_machine_list = ObjectListField(VirtualMachineType)
+    virtual_machine_connection = ObjectConnectionField(VirtualMachineType)
 
     vm_interface = ObjectField(VMInterfaceType)
     vm_interface_list = ObjectListField(VMInterfaceType)
+    vm_interface_connection = ObjectConnectionField(VMInterfaceType)
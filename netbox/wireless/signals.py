@@ -61,6 +61,5 @@ def nullify_connected_interfaces(instance, **kwargs):
             _link_peer_id=None
         )
 
-    # Delete and retrace any dependent cable paths
-    for cablepath in CablePath.objects.filter(path__contains=instance):
-        cablepath.delete()
+    # Delete any dependent cable paths
+    CablePath.objects.filter(path__contains=instance).delete()